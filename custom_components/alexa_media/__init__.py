@@ -14,7 +14,7 @@ import logging
 import os
 import random
 import time
-from typing import Optional
+from typing import Container, Optional
 from urllib.parse import urlparse
 
 import aiohttp
@@ -42,12 +42,12 @@ from homeassistant.const import (
     CONF_URL,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    STATE_PLAYING,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import UnknownFlow
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.loader import async_get_integration
@@ -68,12 +68,14 @@ from .const import (
     CONF_PUBLIC_URL,
     CONF_QUEUE_DELAY,
     CONF_SCAN_INTERVAL,
+    CONF_WARM_BOOT,
     DATA_ALEXAMEDIA,
     DATA_LISTENER,
     DEFAULT_EXTENDED_ENTITY_DISCOVERY,
     DEFAULT_PUBLIC_URL,
     DEFAULT_QUEUE_DELAY,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WARM_BOOT,
     DEPENDENT_ALEXA_COMPONENTS,
     DOMAIN,
     HTTP2_ERROR_THRESHOLD,
@@ -85,10 +87,8 @@ from .const import (
     LAST_CALLED_DEBOUNCE_S,
     LAST_CALLED_ITEMS,
     LAST_CALLED_LOGIN_BACKOFF_S,
-    LAST_CALLED_LOOKBACK_MS,
     LAST_CALLED_RETRY_DELAY_S,
     LAST_CALLED_RETRY_LIMIT,
-    LAST_CALLED_STALE_FUDGE_MS,
     LAST_CALLED_SUCCESS_PACE_S,
     LAST_PING_MAX_AGE_SECONDS,
     LAST_PUSH_INACTIVITY_SECONDS,
@@ -97,24 +97,39 @@ from .const import (
     NOTIFICATION_COOLDOWN,
     NOTIFY_REFRESH_BACKOFF,
     NOTIFY_REFRESH_MAX_RETRIES,
+    PUSH_COALESCE_WINDOW_S,
     SCAN_INTERVAL,
     STARTUP_MESSAGE,
 )
-from .coordinator import AlexaMediaCoordinator
+from .coordinator import AlexaMediaCoordinator, FetchScheduler
+from .device_state import DeviceStateIndex
 from .exceptions import TimeoutException
 from .helpers import (
     _catch_login_errors,
-    _existing_serials,
     alarm_just_dismissed,
     calculate_uuid,
+    dispatch_account_event,
+    dispatch_serial_event,
     hide_email,
     report_relogin_required,
     safe_get,
 )
+from .last_called import (
+    CustomerHistoryWindow,
+    LastCalledActivityQueue,
+    LastCalledHistoryMatcher,
+    QueuedActivity,
+    valid_voice_summary,
+)
 from .metrics import AlexaMetrics, get_metrics
+from .notifications import bucket_versions, changed_buckets, count_notification_sensors
 from .notify import async_unload_entry as notify_async_unload_entry
+from .push_router import PushCommand, PushCommandRouter
+from .rate_limiter import RequestPriority, limited_call, remove_rate_limiter
 from .runtime_data import AlexaRuntimeData
+from .serial_index import SerialIndex, get_serial_index
 from .services import AlexaMediaServices
+from .snapshot import DeviceSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -151,87 +166,12 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _valid_voice_summary(summary: object) -> bool:
-    """Return True if summary looks like a real spoken utterance."""
-    if not isinstance(summary, str):
-        return False
-    summary = summary.strip()
-    return bool(summary) and any(ch.isalnum() for ch in summary)
-
-
-def _queue_last_called_activity(
-    account: dict,
-    *,
-    device_serial: str,
-    customer_id: str | None,
-    activity_ts: int | None,
-    command: str,
-) -> None:
-    """Queue or refresh a last_called activity candidate keyed by device/customer."""
-    if not device_serial:
-        return
-
-    try:
-        ts = int(activity_ts) if activity_ts is not None else 0
-    except (TypeError, ValueError):
-        ts = 0
-
-    queue: list[dict] = account.setdefault("last_called_activity_queue", [])
-
-    for item in queue:
-        if (
-            item.get("serial") == device_serial
-            and item.get("customer_id") == customer_id
-        ):
-            # Keep earliest timestamp like alexa-remote does for the queued burst.
-            prev_ts = int(item.get("activity_ts") or 0)
-            if ts and (prev_ts == 0 or ts < prev_ts):
-                item["activity_ts"] = ts
-            item["command"] = command
-            return
-
-    queue.append(
-        {
-            "serial": device_serial,
-            "customer_id": customer_id,
-            "activity_ts": ts,
-            "command": command,
-        }
-    )
-
-
-def _snapshot_last_called_activity_queue(account: dict) -> list[dict]:
-    """Return a shallow snapshot of queued activity entries."""
-    queue = account.get("last_called_activity_queue") or []
-    return [dict(item) for item in queue if isinstance(item, dict)]
-
-
-def _remove_last_called_activity_queue_entries(
-    account: dict, resolved_keys: set[tuple[str, str | None]]
-) -> None:
-    """Remove resolved queue entries by (serial, customer_id)."""
-    queue = account.get("last_called_activity_queue") or []
-    account["last_called_activity_queue"] = [
-        item
-        for item in queue
-        if (
-            item.get("serial"),
-            item.get("customer_id"),
-        )
-        not in resolved_keys
-    ]
-
-
-def _valid_utterance_type(record: dict) -> bool:
-    """Filter utterance types similar to Node-RED/alexa-remote logic."""
-    utterance_type = record.get("utteranceType")
-    if utterance_type in {
-        "DEVICE_ARBITRATION",
-        "ASR_TIMEOUT",
-        "WAKE_WORD_ONLY",
-    }:
-        return False
-    return True
+def _last_called_activity_queue(account: dict) -> LastCalledActivityQueue:
+    """Return the account's last_called activity queue, creating it if needed."""
+    queue = account.get("last_called_activity_queue")
+    if not isinstance(queue, LastCalledActivityQueue):
+        queue = account["last_called_activity_queue"] = LastCalledActivityQueue()
+    return queue
 
 
 def _push_healthy(account: dict) -> bool:
@@ -270,6 +210,32 @@ def _push_healthy(account: dict) -> bool:
     return True
 
 
+def _adapt_poll_interval(account: dict) -> None:
+    """Let the account coordinator pick its poll interval from current signals."""
+    coordinator = account.get("coordinator")
+    if not isinstance(coordinator, AlexaMediaCoordinator):
+        return
+    media_players = (account.get("entities") or {}).get("media_player") or {}
+    coordinator.adapt_interval(
+        push_connected=bool(account.get("http2"))
+        and int(account.get("http2error") or 0) < HTTP2_ERROR_THRESHOLD,
+        push_healthy=_push_healthy(account),
+        last_push_activity=float(account.get("last_push_activity") or 0.0),
+        playing=sum(
+            1
+            for entity in media_players.values()
+            if getattr(entity, "state", None) == STATE_PLAYING
+        ),
+    )
+
+
+def _record_rate_limited(account: dict | None) -> None:
+    """Tell the account coordinator an Alexa API call was rate limited."""
+    coordinator = (account or {}).get("coordinator")
+    if isinstance(coordinator, AlexaMediaCoordinator):
+        coordinator.record_rate_limited()
+
+
 def _network_allowed(login_obj) -> bool:
     if login_obj.close_requested:
         return False
@@ -331,108 +297,32 @@ def _entity_backed_device_identifiers(account_dict: dict) -> set[str]:
     return identifiers
 
 
-def _entity_backed_serials(account: dict) -> set[str]:
-    """Return serials that exist only because we created entity-backed devices.
-
-    These serials may not be discoverable via media player inventory, but should
-    still be considered 'current' so we don't prune/ignore them.
-    """
-    serials: set[str] = set()
-    entities = account.get("entities")
-    if not isinstance(entities, dict):
-        return serials
-
-    # Sensors are stored keyed by serial; this is where AIAQM lives.
-    sensors = entities.get("sensor")
-    if isinstance(sensors, dict):
-        serials.update(s for s in sensors.keys() if isinstance(s, str) and s)
-
-    return serials
+def _customer_history_window(account: dict) -> CustomerHistoryWindow:
+    """Return the account's customer history window, creating it if needed."""
+    window = account.get("last_called_history_window")
+    if not isinstance(window, CustomerHistoryWindow):
+        window = account["last_called_history_window"] = CustomerHistoryWindow()
+    return window
 
 
 def _select_last_called_payload_from_records(
     records: list[dict],
-    queue_snapshot: list[dict],
+    queue_snapshot: list[QueuedActivity],
     account: dict,
-    existing_serials_local: set[str],
+    existing_serials_local: Container[str],
 ) -> tuple[dict | None, set[tuple[str, str | None]]]:
     """Select the best last_called payload from raw customer history records."""
-    if not records or not queue_snapshot:
-        return None, set()
-
-    watermark = int(account.get("last_called_customer_history_ts") or 0)
-    last_pushed_activity = account.get("last_called_last_pushed_activity") or {}
-
-    queue_by_key = {
-        (item.get("serial"), item.get("customer_id")): item
-        for item in queue_snapshot
-        if item.get("serial")
-    }
-
-    def _record_ts(record: dict) -> int:
-        try:
-            return int(record.get("creationTimestamp") or 0)
-        except (TypeError, ValueError):
-            return 0
-
-    sorted_records = sorted(
-        (r for r in records if isinstance(r, dict)),
-        key=_record_ts,
-        reverse=True,
+    matcher = account.get("last_called_history_matcher")
+    if not isinstance(matcher, LastCalledHistoryMatcher):
+        matcher = account["last_called_history_matcher"] = LastCalledHistoryMatcher()
+    return matcher.match(
+        records,
+        queue_snapshot,
+        existing_serials_local,
+        watermark=int(account.get("last_called_customer_history_ts") or 0),
+        last_pushed_activity=account.get("last_called_last_pushed_activity"),
     )
 
-    for record in sorted_records:
-        serial = record.get("deviceSerialNumber")
-        if not serial or serial not in existing_serials_local:
-            continue
-
-        if not _valid_utterance_type(record):
-            continue
-
-        summary = ((record.get("description") or {}).get("summary") or "").strip()
-        if not _valid_voice_summary(summary):
-            continue
-
-        try:
-            ts = int(record.get("creationTimestamp") or 0)
-        except (TypeError, ValueError):
-            continue
-
-        if ts <= watermark:
-            continue
-
-        if ts <= int(last_pushed_activity.get(serial) or 0):
-            continue
-
-        for key, queued in queue_by_key.items():
-            queued_serial, _queued_customer = key
-            queued_ts = int(queued.get("activity_ts") or 0)
-
-            if serial != queued_serial:
-                continue
-
-            # Future enhancement: customer/user matching.
-            # The push payload includes destinationUserId, but the current
-            # get_customer_history_records() helper does not expose a matching
-            # user identifier from the raw RVH records, so this check is currently
-            # ineffective. Leave in place in case the API helper is extended later.
-            #
-            # if queued_customer and record.get("customerId") not in (None, queued_customer):
-            #    continue
-
-            if queued_ts and ts < (queued_ts - LAST_CALLED_STALE_FUDGE_MS):
-                continue
-
-            payload = {
-                "serialNumber": serial,
-                "timestamp": ts,
-                "summary": summary,
-                "response": (record.get("alexaResponse") or "").strip() or None,
-            }
-            return payload, {key}
-
-    return None, set()
-
 
 async def async_setup(hass, config):
     """Set up the Alexa domain."""
@@ -524,9 +414,9 @@ def _store_and_dispatch_last_called(
             "%s: last_called changed",
             hide_email(email),
         )
-        async_dispatcher_send(
+        dispatch_account_event(
             hass,
-            f"{DOMAIN}_{hide_email(email)}"[0:32],
+            email,
             {"last_called_change": payload},
         )
 
@@ -569,14 +459,27 @@ async def _async_update_last_called_global(
             if account:
                 api_lock = account.get("last_called_api_lock")
             if api_lock is None:
-                last_called = await AlexaAPI.get_last_device_serial(login_obj)
+                last_called = await limited_call(
+                    hass,
+                    login_obj,
+                    RequestPriority.PUSH,
+                    AlexaAPI.get_last_device_serial,
+                    login_obj,
+                )
             else:
                 async with api_lock:
-                    last_called = await AlexaAPI.get_last_device_serial(login_obj)
+                    last_called = await limited_call(
+                        hass,
+                        login_obj,
+                        RequestPriority.PUSH,
+                        AlexaAPI.get_last_device_serial,
+                        login_obj,
+                    )
         except asyncio.CancelledError:
             # Task cancelled during unload/shutdown; propagate cancellation.
             raise
         except AlexapyTooManyRequestsError:
+            _record_rate_limited(account)
             _LOGGER.debug(
                 "%s: Rate limited during last_called update; skipping",
                 hide_email(email),
@@ -610,7 +513,7 @@ async def _async_update_last_called_global(
             )
             return
 
-    if not _valid_voice_summary(last_called.get("summary")):
+    if not valid_voice_summary(last_called.get("summary")):
         _LOGGER.debug(
             "%s: Ignoring last_called with invalid summary",
             hide_email(email),
@@ -695,6 +598,7 @@ async def async_setup_entry(hass, config_entry):
     email = account.get(CONF_EMAIL)
     password = account.get(CONF_PASSWORD)
     url = account.get(CONF_URL)
+    serial_index = SerialIndex()
     hass.data[DATA_ALEXAMEDIA]["accounts"].setdefault(
         email,
         {
@@ -719,7 +623,14 @@ async def async_setup_entry(hass, config_entry):
                 "alarm_control_panel": {},
                 "smart_switch": [],
             },
-            "excluded": {},
+            "excluded": serial_index.excluded,
+            "serial_index": serial_index,
+            "snapshot": (
+                DeviceSnapshot(hass, config_entry.entry_id)
+                if config_entry.data.get(CONF_WARM_BOOT, DEFAULT_WARM_BOOT)
+                else None
+            ),
+            "snapshot_reconcile": None,
             "new_devices": True,
             "http2_lastattempt": 0,
             "http2error": 0,
@@ -749,6 +660,9 @@ async def async_setup_entry(hass, config_entry):
                 CONF_EXTENDED_ENTITY_DISCOVERY: config_entry.data.get(
                     CONF_EXTENDED_ENTITY_DISCOVERY, DEFAULT_EXTENDED_ENTITY_DISCOVERY
                 ),
+                CONF_WARM_BOOT: config_entry.data.get(
+                    CONF_WARM_BOOT, DEFAULT_WARM_BOOT
+                ),
                 CONF_DEBUG: config_entry.data.get(CONF_DEBUG, False),
             },
             DATA_LISTENER: [config_entry.add_update_listener(update_listener)],
@@ -890,12 +804,13 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
         if not login_obj or not _network_allowed(login_obj):
             return None
         account = hass.data[DATA_ALEXAMEDIA]["accounts"][email]
-        existing_serials = set(_existing_serials(hass, login_obj))
-        existing_serials |= _entity_backed_serials(account)
+        existing_serials = get_serial_index(account)
         existing_entities = hass.data[DATA_ALEXAMEDIA]["accounts"][email]["entities"][
             "media_player"
         ].values()
         auth_info = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("auth_info")
+        # Set by setup_alexa for the first refresh only when a snapshot loaded.
+        warm_snapshot: DeviceSnapshot | None = account.pop("warm_snapshot", None)
         new_devices = hass.data[DATA_ALEXAMEDIA]["accounts"][email]["new_devices"]
         extended_entity_discovery = hass.data[DATA_ALEXAMEDIA]["accounts"][email][
             "options"
@@ -905,10 +820,12 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
         ]
         first_run = hass.data[DATA_ALEXAMEDIA]["accounts"][email]["first_run"]
         devices = {}
-        bluetooth = {}
-        preferences = {}
-        dnd = {}
+        # None means not fetched this poll; the previous values are kept.
+        bluetooth = None
+        preferences = None
+        dnd = None
         entity_state = {}
+        fresh_entities = None
 
         # Try to get cached data for faster boot
         entry_id = config_entry.entry_id if config_entry else ""
@@ -916,29 +833,87 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
         cached_devices = None
         _used_cached_devices = False
         if metrics:
-            cached_devices = metrics.api_cache.get(f"{cache_key_prefix}_devices")
+            cached_devices = metrics.api_cache.get(f"devices:{cache_key_prefix}")
+
+        # Per-device state endpoints; the coordinator's fetch scheduler decides
+        # which of them are due on this poll.
+        state_fetchers = {
+            "bluetooth": AlexaAPI.get_bluetooth,
+            "preferences": AlexaAPI.get_device_preferences,
+            "dnd": AlexaAPI.get_dnd_state,
+        }
+        fetch_scheduler: FetchScheduler | None = getattr(
+            account.get("coordinator"), "fetch_scheduler", None
+        )
+        if warm_snapshot is not None:
+            state_endpoints = []
+        elif fetch_scheduler is None or new_devices:
+            state_endpoints = list(state_fetchers)
+        else:
+            media_players = account["devices"]["media_player"].values()
+            state_endpoints = fetch_scheduler.select(
+                (
+                    endpoint
+                    for endpoint in state_fetchers
+                    # Bluetooth state is only used by PAIR_BT_SOURCE devices.
+                    if endpoint != "bluetooth"
+                    or any(
+                        "PAIR_BT_SOURCE" in (device.get("capabilities") or [])
+                        for device in media_players
+                    )
+                ),
+                push_healthy=_push_healthy(account),
+            )
+        state_tasks = [
+            limited_call(
+                hass,
+                login_obj,
+                RequestPriority.POLL,
+                state_fetchers[endpoint],
+                login_obj,
+            )
+            for endpoint in state_endpoints
+        ]
 
-        if cached_devices and not new_devices:
+        if warm_snapshot is not None:
+            # Create entities from the last good snapshot without waiting on the
+            # API; the next refresh fetches live data and reconciles.
+            _LOGGER.debug("%s: Using device snapshot for warm boot", hide_email(email))
+            devices = warm_snapshot.devices
+            auth_info = warm_snapshot.auth_info
+            hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"].update(
+                warm_snapshot.entities
+            )
+            account["snapshot_reconcile"] = warm_snapshot.signature
+            tasks = []
+        elif cached_devices and not new_devices:
             _LOGGER.debug("%s: Using cached devices data", hide_email(email))
             # NOTE: DataCache returns direct references. We intentionally enrich device dicts
             # in-place each refresh cycle (bluetooth_state/locale/dnd/etc.).
             devices = cached_devices
             _used_cached_devices = True
-            # Still need fresh bluetooth, preferences, and DND
-            tasks = [
-                AlexaAPI.get_bluetooth(login_obj),
-                AlexaAPI.get_device_preferences(login_obj),
-                AlexaAPI.get_dnd_state(login_obj),
-            ]
+            tasks = state_tasks
         else:
             tasks = [
-                AlexaAPI.get_devices(login_obj),
-                AlexaAPI.get_bluetooth(login_obj),
-                AlexaAPI.get_device_preferences(login_obj),
-                AlexaAPI.get_dnd_state(login_obj),
+                limited_call(
+                    hass,
+                    login_obj,
+                    RequestPriority.POLL,
+                    AlexaAPI.get_devices,
+                    login_obj,
+                ),
+                *state_tasks,
             ]
-        if new_devices:
-            tasks.append(AlexaAPI.get_authentication(login_obj))
+        if new_devices and warm_snapshot is None:
+            tasks.append(
+                limited_call(
+                    hass,
+                    login_obj,
+                    RequestPriority.POLL,
+                    AlexaAPI.get_authentication,
+                    login_obj,
+                )
+            )
 
         entities_to_monitor = set()
 
@@ -990,11 +965,27 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             if smart_switch.enabled:
                 entities_to_monitor.add(smart_switch.alexa_entity_id)
 
-        if entities_to_monitor:
-            tasks.append(get_entity_data(login_obj, list(entities_to_monitor)))
+        if entities_to_monitor and warm_snapshot is None:
+            # Each chunk takes its own rate limiter token
+            tasks.append(
+                get_entity_data(
+                    login_obj,
+                    list(entities_to_monitor),
+                    previous=getattr(account.get("coordinator"), "data", None),
+                    hass=hass,
+                )
+            )
 
-        if should_get_network:
-            tasks.append(AlexaAPI.get_network_details(login_obj))
+        if should_get_network and warm_snapshot is None:
+            tasks.append(
+                limited_call(
+                    hass,
+                    login_obj,
+                    RequestPriority.POLL,
+                    AlexaAPI.get_network_details,
+                    login_obj,
+                )
+            )
 
         optional_task_results = []
         try:
@@ -1005,21 +996,20 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 # get_network_details() retries which could up to 30s.
                 async with async_timeout.timeout(45):
                     start_fetch = time.monotonic()
-                    if _used_cached_devices:
-                        (
-                            bluetooth,
-                            preferences,
-                            dnd,
-                            *optional_task_results,
-                        ) = await asyncio.gather(*tasks)
-                    else:
-                        (
-                            devices,
-                            bluetooth,
-                            preferences,
-                            dnd,
-                            *optional_task_results,
-                        ) = await asyncio.gather(*tasks)
+                    results = await asyncio.gather(*tasks)
+                    if not _used_cached_devices:
+                        devices, *results = results
+                    state_results = dict(
+                        zip(state_endpoints, results[: len(state_endpoints)])
+                    )
+                    optional_task_results = results[len(state_endpoints) :]
+                    bluetooth = state_results.get("bluetooth")
+                    preferences = state_results.get("preferences")
+                    dnd = state_results.get("dnd")
+                    if fetch_scheduler is not None:
+                        for endpoint, result in state_results.items():
+                            if result is not None:
+                                fetch_scheduler.mark_fetched(endpoint)
 
                     fetch_time = time.monotonic() - start_fetch
                     _LOGGER.debug(
@@ -1034,7 +1024,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                         # Cache the devices for faster next boot (only freshly fetched)
                         if not _used_cached_devices:
                             metrics.api_cache.cache_set(
-                                f"{cache_key_prefix}_devices", devices
+                                f"devices:{cache_key_prefix}", devices
                             )
 
                     _t_post = time.monotonic()
@@ -1075,6 +1065,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                         hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"].update(
                             alexa_entities
                         )
+                        if api_devices:
+                            fresh_entities = alexa_entities
 
                         _entities_to_monitor = set()
                         for type_of_entity, entities in alexa_entities.items():
@@ -1091,16 +1083,16 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             hide_email(email),
                             len(list(_entities_to_monitor)),
                         )
-                        # Use shorter timeout for entity data to avoid blocking
+                        # Each chunk is limited and timed out on its own, so a
+                        # slow chunk does not cancel the others.
                         _t_ed = time.monotonic()
                         try:
-                            entity_state = await asyncio.wait_for(
-                                get_entity_data(login_obj, list(_entities_to_monitor)),
-                                timeout=10.0,
+                            entity_state = await get_entity_data(
+                                login_obj, list(_entities_to_monitor), hass=hass
                             )
                         except asyncio.TimeoutError:
                             _LOGGER.warning(
-                                "%s: get_entity_data timed out after 10s, "
+                                "%s: get_entity_data timed out for every chunk, "
                                 "entity states will be fetched on next cycle",
                                 hide_email(email),
                             )
@@ -1192,11 +1184,50 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                     event_data={"email": hide_email(email), "url": login_obj.url},
                 )
             return None
+        except AlexapyTooManyRequestsError:
+            _record_rate_limited(account)
+            _adapt_poll_interval(account)
+            raise
         except asyncio.CancelledError:
             # Task cancelled during unload/shutdown; propagate cancellation.
             raise
 
+        if (snapshot := account.get("snapshot")) is not None and warm_snapshot is None:
+            if devices:
+                snapshot.async_update(devices, fresh_entities, auth_info)
+            warm_signature = account.get("snapshot_reconcile")
+            if warm_signature is not None and fresh_entities is not None:
+                # Entities were created from the snapshot; reload if live data
+                # describes different devices or network entities.
+                account["snapshot_reconcile"] = None
+                if snapshot.signature != warm_signature:
+                    _LOGGER.info(
+                        "%s: Device snapshot was out of date; reloading",
+                        hide_email(email),
+                    )
+
+                    async def _reload_with_fresh_snapshot() -> None:
+                        await snapshot.async_flush()
+                        await hass.config_entries.async_reload(config_entry.entry_id)
+
+                    hass.async_create_task(_reload_with_fresh_snapshot())
+                    return entity_state
+                if metrics:
+                    metrics.record_boot_stage(
+                        f"snapshot_reconciled_{hide_email(email)}"
+                    )
+
         _t_proc = time.monotonic()
+        coordinator = account.get("coordinator")
+        last_called = account.get("last_called") or {}
+        last_called_key = (
+            last_called.get("serialNumber"),
+            last_called.get("timestamp"),
+        )
+        # Index the per-device responses once so the merge below is linear.
+        device_state = account["device_state"] = DeviceStateIndex.from_responses(
+            bluetooth, preferences, dnd, previous=account.get("device_state")
+        )
         new_alexa_clients = []  # list of newly discovered device names
         exclude_filter = []
         include_filter = []
@@ -1206,29 +1237,11 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             dev_name = device["accountName"]
             if include and dev_name not in include:
                 include_filter.append(dev_name)
-                if "appDeviceList" in device:
-                    for app in device["appDeviceList"]:
-                        (
-                            hass.data[DATA_ALEXAMEDIA]["accounts"][email]["excluded"][
-                                app["serialNumber"]
-                            ]
-                        ) = device
-                hass.data[DATA_ALEXAMEDIA]["accounts"][email]["excluded"][
-                    serial
-                ] = device
+                existing_serials.exclude(device)
                 continue
             if exclude and dev_name in exclude:
                 exclude_filter.append(dev_name)
-                if "appDeviceList" in device:
-                    for app in device["appDeviceList"]:
-                        (
-                            hass.data[DATA_ALEXAMEDIA]["accounts"][email]["excluded"][
-                                app["serialNumber"]
-                            ]
-                        ) = device
-                hass.data[DATA_ALEXAMEDIA]["accounts"][email]["excluded"][
-                    serial
-                ] = device
+                existing_serials.exclude(device)
                 continue
 
             if (
@@ -1243,34 +1256,19 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 _LOGGER.debug("Excluding %s for lacking capability", dev_name)
                 continue
 
-            if bluetooth is not None and "bluetoothStates" in bluetooth:
-                for b_state in bluetooth["bluetoothStates"]:
-                    if serial == b_state["deviceSerialNumber"]:
-                        device["bluetooth_state"] = b_state
-                        break
-
-            if preferences is not None and "devicePreferences" in preferences:
-                for dev in preferences["devicePreferences"]:
-                    if dev["deviceSerialNumber"] == serial:
-                        device["locale"] = dev["locale"]
-                        device["timeZoneId"] = dev["timeZoneId"]
-                        _LOGGER.debug(
-                            "%s: Locale %s timezone %s",
-                            dev_name,
-                            device["locale"],
-                            device["timeZoneId"],
-                        )
-                        break
-
-            if dnd is not None and "doNotDisturbDeviceStatusList" in dnd:
-                for dev in dnd["doNotDisturbDeviceStatusList"]:
-                    if dev["deviceSerialNumber"] == serial:
-                        device["dnd"] = dev["enabled"]
-                        _LOGGER.debug("%s: DND %s", dev_name, device["dnd"])
-                        hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"][
-                            "switch"
-                        ].setdefault(serial, {"dnd": True})
-                        break
+            device_state.merge(device)
+            if serial in device_state.preferences:
+                _LOGGER.debug(
+                    "%s: Locale %s timezone %s",
+                    dev_name,
+                    device["locale"],
+                    device["timeZoneId"],
+                )
+            if serial in device_state.dnd:
+                _LOGGER.debug("%s: DND %s", dev_name, device["dnd"])
+                hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"][
+                    "switch"
+                ].setdefault(serial, {"dnd": True})
 
             hass.data[DATA_ALEXAMEDIA]["accounts"][email]["auth_info"] = device[
                 "auth_info"
@@ -1278,27 +1276,39 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"]["media_player"][
                 serial
             ] = device
+            existing_serials.set_device(serial, device)
 
             if serial not in existing_serials:
                 new_alexa_clients.append(dev_name)
             elif (
                 serial in existing_serials
-                and hass.data[DATA_ALEXAMEDIA]["accounts"][email]["entities"][
-                    "media_player"
-                ].get(serial)
-                and hass.data[DATA_ALEXAMEDIA]["accounts"][email]["entities"][
-                    "media_player"
-                ]
-                .get(serial)
-                .enabled
-            ):
-                await (
-                    hass.data[DATA_ALEXAMEDIA]["accounts"][email]["entities"][
+                and (
+                    client := hass.data[DATA_ALEXAMEDIA]["accounts"][email]["entities"][
                         "media_player"
-                    ]
-                    .get(serial)
-                    .refresh(device, skip_api=True)
+                    ].get(serial)
                 )
+                and client.enabled
+            ):
+                # Skip entities whose device json (with merged bluetooth,
+                # preferences, DND and auth), last_called and availability are
+                # unchanged. Push events can flip availability without a json
+                # change, so it is part of the fingerprint.
+                if isinstance(coordinator, AlexaMediaCoordinator) and (
+                    not coordinator.device_changed(
+                        serial, device, id(client), last_called_key, client.available
+                    )
+                ):
+                    if metrics:
+                        metrics.record_device_refresh(applied=False)
+                    continue
+                try:
+                    await client.refresh(device, skip_api=True)
+                except Exception:
+                    if isinstance(coordinator, AlexaMediaCoordinator):
+                        coordinator.forget_device(serial)
+                    raise
+                if metrics:
+                    metrics.record_device_refresh(applied=True)
         _LOGGER.debug(
             "%s: Existing: %s New: %s;"
             " Filtered out by not being in include: %s "
@@ -1326,13 +1336,20 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 _LOGGER.debug("[BOOT] platform loading in %.2fs", time.monotonic() - _t)
                 if metrics:
                     metrics.record_boot_stage(f"platforms_loaded_{hide_email(email)}")
+                    metrics.record_boot_stage(
+                        f"entities_created_{'warm' if warm_snapshot else 'cold'}"
+                        f"_{hide_email(email)}"
+                    )
             except (asyncio.TimeoutError, TimeoutException) as ex:
                 _LOGGER.error(f"Error while loading platforms: {ex}")
                 raise ConfigEntryNotReady(
                     f"Timeout while loading platforms: {ex}"
                 ) from ex
 
-        hass.data[DATA_ALEXAMEDIA]["accounts"][email]["new_devices"] = False
+        # After a warm boot the next refresh still fetches devices and auth info.
+        hass.data[DATA_ALEXAMEDIA]["accounts"][email]["new_devices"] = (
+            warm_snapshot is not None
+        )
         # prune stale devices
         device_registry = dr.async_get(hass)
         entity_backed_ids = _entity_backed_device_identifiers(
@@ -1395,6 +1412,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                     )
                 hass.data[DATA_ALEXAMEDIA]["accounts"][email]["first_run"] = False
 
+        _adapt_poll_interval(account)
         return entity_state
 
     @_catch_login_errors
@@ -1426,7 +1444,13 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
 
             # Small delay to let Alexa settle if we're polling explicitly
             await asyncio.sleep(4)
-            raw_notifications = await AlexaAPI.get_notifications(login_obj)
+            raw_notifications = await limited_call(
+                hass,
+                login_obj,
+                RequestPriority.POLL,
+                AlexaAPI.get_notifications,
+                login_obj,
+            )
 
         previous = account_dict.get("notifications", {})
         notifications = {"process_timestamp": dt.utcnow()}
@@ -1470,20 +1494,34 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                     notifications[n_dev_id][n_type] = {}
                 notifications[n_dev_id][n_type][n_id] = notification
 
+        versions = bucket_versions(notifications)
+        changed = changed_buckets(account_dict.get("notification_versions"), versions)
+        account_dict["notification_versions"] = versions
         account_dict["notifications"] = notifications
+        updated, skipped = count_notification_sensors(
+            account_dict.get("entities", {}).get("sensor"), changed
+        )
         _LOGGER.debug(
-            "%s: Updated %s notifications for %s devices at %s",
+            "%s: Updated %s notifications for %s devices at %s; "
+            "%s changed buckets, %s sensors updated, %s skipped",
             hide_email(email),
             len(raw_notifications) if raw_notifications is not None else 0,
             len(notifications),
             dt.as_local(account_dict["notifications"]["process_timestamp"]),
+            sum(len(types) for types in changed.values()),
+            updated,
+            skipped,
         )
-        # Notify sensors that the notifications snapshot has been refreshed
-        async_dispatcher_send(
-            hass,
-            f"{DOMAIN}_{hide_email(email)}"[0:32],
-            {"notifications_refreshed": True},
-        )
+        if (metrics := get_metrics(hass)) is not None:
+            metrics.record_notification_refresh(updated, skipped)
+        # Only wake the sensors whose (serial, type) bucket changed
+        for serial, types in changed.items():
+            dispatch_serial_event(
+                hass,
+                email,
+                serial,
+                {"notifications_refreshed": {"types": sorted(types)}},
+            )
         return True
 
     # ---------------------------------------------------------------------
@@ -1504,7 +1542,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
         account.setdefault("last_called_probe_trigger_serial", None)
         account.setdefault("last_called_probe_trigger_ts", 0)  # newest push ts (ms)
         account.setdefault("last_called_probe_trigger", None)
-        account.setdefault("last_called_activity_queue", [])
+        _last_called_activity_queue(account)
         account.setdefault("last_called_last_pushed_activity", {})
         account.setdefault("last_volumes", {})
         account.setdefault("last_equalizer", {})
@@ -1600,23 +1638,26 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
 
                         try:
                             async with account_live["last_called_api_lock"]:
-                                queue_snapshot = _snapshot_last_called_activity_queue(
+                                queue_snapshot = _last_called_activity_queue(
                                     account_live
-                                )
+                                ).snapshot()
                                 if not queue_snapshot:
                                     if trigger_cmd in (
                                         "GLOBAL_REFRESH",
                                         "SERVICE_REFRESH",
                                         "POLL_REFRESH",
                                     ):
-                                        last_called = (
-                                            await AlexaAPI.get_last_device_serial(
-                                                login_live, items=LAST_CALLED_ITEMS
-                                            )
+                                        last_called = await limited_call(
+                                            hass,
+                                            login_live,
+                                            RequestPriority.POLL,
+                                            AlexaAPI.get_last_device_serial,
+                                            login_live,
+                                            items=LAST_CALLED_ITEMS,
                                         )
                                         if isinstance(
                                             last_called, dict
-                                        ) and _valid_voice_summary(
+                                        ) and valid_voice_summary(
                                             last_called.get("summary")
                                         ):
                                             await update_last_called(
@@ -1627,28 +1668,34 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
 
                                 earliest_ts = min(
                                     (
-                                        int(item.get("activity_ts") or 0)
+                                        item.activity_ts
                                         for item in queue_snapshot
-                                        if item.get("activity_ts")
+                                        if item.activity_ts
                                     ),
                                     default=0,
                                 )
 
-                                rvh_window_ms = max(
-                                    LAST_CALLED_LOOKBACK_MS, 15 * 60 * 1000
-                                )
-                                start_time = (
-                                    max(0, earliest_ts - rvh_window_ms)
-                                    if earliest_ts
-                                    else int((time.time() * 1000) - rvh_window_ms)
+                                history_window = _customer_history_window(account_live)
+                                start_time, end_time = history_window.bounds(
+                                    earliest_ts,
+                                    int(time.time() * 1000),
+                                    watermark=int(
+                                        account_live.get(
+                                            "last_called_customer_history_ts"
+                                        )
+                                        or 0
+                                    ),
                                 )
-                                end_time = int(time.time() * 1000) + rvh_window_ms
                                 max_record_size = max(
                                     LAST_CALLED_ITEMS, len(queue_snapshot) + 2
                                 )
 
                             try:
-                                records = await AlexaAPI.get_customer_history_records(
+                                records = await limited_call(
+                                    hass,
+                                    login_live,
+                                    RequestPriority.PUSH,
+                                    AlexaAPI.get_customer_history_records,
                                     login_live,
                                     start_time=start_time,
                                     end_time=end_time,
@@ -1660,6 +1707,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                                 # within a session: back off and do NOT re-arm. The
                                 # old behavior crash-looped ~every 11s, hammering the
                                 # API. Wait for the next genuine push trigger instead.
+                                history_window.widen()
                                 backoff = max(LAST_CALLED_CONN_BACKOFF_S, 60.0)
                                 account_live["last_called_probe_next_allowed"] = (
                                     time.monotonic() + backoff
@@ -1679,7 +1727,10 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                                     hide_email(email),
                                     trigger_cmd,
                                 )
+                                history_window.widen()
                                 records = []
+                            elif isinstance(records, list):
+                                history_window.record_response(records)
 
                             # 🔎 DEBUG: inspect raw history result
                             _LOGGER.debug(
@@ -1715,6 +1766,8 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                         except asyncio.CancelledError:
                             raise
                         except AlexapyTooManyRequestsError:
+                            _record_rate_limited(account_live)
+                            _customer_history_window(account_live).widen()
                             uk_floor = random.uniform(  # noqa: S311
                                 30.0, 63.0
                             )  # nosec B311
@@ -1748,6 +1801,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             account_live["last_called_probe_event"].set()
                             break
                         except AlexapyLoginError:
+                            _customer_history_window(account_live).widen()
                             account_live["last_called_probe_next_allowed"] = (
                                 time.monotonic() + LAST_CALLED_LOGIN_BACKOFF_S
                             )
@@ -1759,6 +1813,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             report_relogin_required(hass, login_live, email)
                             break
                         except AlexapyConnectionError as exc:
+                            _customer_history_window(account_live).widen()
                             account_live["last_called_probe_next_allowed"] = (
                                 time.monotonic() + LAST_CALLED_CONN_BACKOFF_S
                             )
@@ -1770,10 +1825,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             )
                             break
 
-                        existing_serials_local = set(
-                            _existing_serials(hass, login_live)
-                        )
-                        existing_serials_local |= _entity_backed_serials(account_live)
+                        existing_serials_local = get_serial_index(account_live)
 
                         payload, resolved_keys = (
                             _select_last_called_payload_from_records(
@@ -1789,10 +1841,10 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                             trigger_cmd,
                             [
                                 {
-                                    "serial": item.get("serial"),
-                                    "customer_id": item.get("customer_id"),
-                                    "activity_ts": item.get("activity_ts"),
-                                    "command": item.get("command"),
+                                    "serial": item.serial,
+                                    "customer_id": item.customer_id,
+                                    "activity_ts": item.activity_ts,
+                                    "command": item.command,
                                 }
                                 for item in queue_snapshot
                             ],
@@ -1814,6 +1866,10 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                                 await asyncio.sleep(LAST_CALLED_RETRY_DELAY_S)
                                 continue
 
+                            # The record may have been filed below the overlap;
+                            # look further back on the next probe.
+                            _customer_history_window(account_live).widen()
+
                             if trigger_cmd in (
                                 "GLOBAL_REFRESH",
                                 "SERVICE_REFRESH",
@@ -1824,26 +1880,24 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                                     hide_email(email),
                                 )
 
-                                unresolved_keys = {
-                                    (item.get("serial"), item.get("customer_id"))
-                                    for item in queue_snapshot
-                                    if item.get("serial")
-                                }
-                                _remove_last_called_activity_queue_entries(
-                                    account_live, unresolved_keys
+                                _last_called_activity_queue(account_live).remove(
+                                    (item.key for item in queue_snapshot),
+                                    resolved=False,
                                 )
 
                                 try:
                                     async with account_live["last_called_api_lock"]:
-                                        last_called = (
-                                            await AlexaAPI.get_last_device_serial(
-                                                login_live,
-                                                items=LAST_CALLED_ITEMS,
-                                            )
+                                        last_called = await limited_call(
+                                            hass,
+                                            login_live,
+                                            RequestPriority.POLL,
+                                            AlexaAPI.get_last_device_serial,
+                                            login_live,
+                                            items=LAST_CALLED_ITEMS,
                                         )
                                     if isinstance(
                                         last_called, dict
-                                    ) and _valid_voice_summary(
+                                    ) and valid_voice_summary(
                                         last_called.get("summary")
                                     ):
                                         await update_last_called(
@@ -1900,9 +1954,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                         account_live["last_called_last_pushed_activity"][
                             payload["serialNumber"]
                         ] = payload["timestamp"]
-                        _remove_last_called_activity_queue_entries(
-                            account_live, resolved_keys
-                        )
+                        _last_called_activity_queue(account_live).remove(resolved_keys)
                         account_live["last_called_probe_trigger_ts"] = 0
                         account_live["last_called_probe_event"].clear()
                         break
@@ -1993,15 +2045,28 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 api_lock = account.get("last_called_api_lock") if account else None
 
                 if api_lock is None:
-                    last_called = await AlexaAPI.get_last_device_serial(login_obj)
+                    last_called = await limited_call(
+                        hass,
+                        login_obj,
+                        RequestPriority.PUSH,
+                        AlexaAPI.get_last_device_serial,
+                        login_obj,
+                    )
                 else:
                     async with api_lock:
-                        last_called = await AlexaAPI.get_last_device_serial(login_obj)
+                        last_called = await limited_call(
+                            hass,
+                            login_obj,
+                            RequestPriority.PUSH,
+                            AlexaAPI.get_last_device_serial,
+                            login_obj,
+                        )
 
             except asyncio.CancelledError:
                 raise
 
             except AlexapyTooManyRequestsError:
+                _record_rate_limited(hass.data[DATA_ALEXAMEDIA]["accounts"].get(email))
                 _LOGGER.debug(
                     "%s: Rate limited during last_called update; skipping",
                     hide_email(email),
@@ -2041,7 +2106,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 return
 
         # Central voice-only gate
-        if not _valid_voice_summary(last_called.get("summary")):
+        if not valid_voice_summary(last_called.get("summary")):
             _LOGGER.debug(
                 "%s: Ignoring last_called with invalid/non-voice summary: %s",
                 hide_email(email),
@@ -2060,25 +2125,39 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             )
             await update_dnd_state(login_obj)
 
+    def _fetch_scheduler() -> FetchScheduler | None:
+        """Return the coordinator's per-endpoint fetch scheduler, if any."""
+        account = hass.data[DATA_ALEXAMEDIA]["accounts"].get(email) or {}
+        return getattr(account.get("coordinator"), "fetch_scheduler", None)
+
     @_catch_login_errors
     async def update_bluetooth_state(login_obj, device_serial):
         """Update the bluetooth state on ws bluetooth event."""
-        bluetooth = await AlexaAPI.get_bluetooth(login_obj)
+        bluetooth = await limited_call(
+            hass, login_obj, RequestPriority.PUSH, AlexaAPI.get_bluetooth, login_obj
+        )
         device = hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"][
             "media_player"
         ][device_serial]
 
-        if bluetooth is not None and "bluetoothStates" in bluetooth:
-            for b_state in bluetooth["bluetoothStates"]:
-                if device_serial == b_state["deviceSerialNumber"]:
-                    _LOGGER.debug(
-                        "%s: setting value for: %s to %s",
-                        hide_email(email),
-                        hide_serial(device_serial),
-                        hide_serial(b_state),
-                    )
-                    device["bluetooth_state"] = b_state
-                    return device["bluetooth_state"]
+        device_state = hass.data[DATA_ALEXAMEDIA]["accounts"][email].setdefault(
+            "device_state", DeviceStateIndex()
+        )
+        device_state.update_bluetooth(bluetooth)
+        if bluetooth is not None and (fetch_scheduler := _fetch_scheduler()):
+            fetch_scheduler.mark_fetched("bluetooth")
+        if (
+            bluetooth is not None
+            and (b_state := device_state.bluetooth.get(device_serial)) is not None
+        ):
+            _LOGGER.debug(
+                "%s: setting value for: %s to %s",
+                hide_email(email),
+                hide_serial(device_serial),
+                hide_serial(b_state),
+            )
+            device["bluetooth_state"] = b_state
+            return device["bluetooth_state"]
         _LOGGER.debug(
             "%s: get_bluetooth for: %s failed with %s",
             hide_email(email),
@@ -2166,6 +2245,9 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
         """Update the DND state on websocket DND combo event."""
         email = login_obj.email
         now = datetime.utcnow()
+        # If this update is throttled, the next poll still fetches DND.
+        if fetch_scheduler := _fetch_scheduler():
+            fetch_scheduler.invalidate("dnd")
 
         async with dnd_update_lock:
             last_run = last_dnd_update_times.get(email)
@@ -2195,7 +2277,9 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
 
         _LOGGER.debug("%s: Updating DND state", hide_email(email))
         try:
-            dnd = await AlexaAPI.get_dnd_state(login_obj)
+            dnd = await limited_call(
+                hass, login_obj, RequestPriority.PUSH, AlexaAPI.get_dnd_state, login_obj
+            )
         except asyncio.TimeoutError:
             _LOGGER.error(
                 "%s: Timeout occurred while fetching DND state",
@@ -2211,9 +2295,14 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             return
 
         if dnd is not None and "doNotDisturbDeviceStatusList" in dnd:
-            async_dispatcher_send(
+            account = hass.data[DATA_ALEXAMEDIA]["accounts"].get(email)
+            if account is not None:
+                account.setdefault("device_state", DeviceStateIndex()).update_dnd(dnd)
+            if fetch_scheduler:
+                fetch_scheduler.mark_fetched("dnd")
+            dispatch_account_event(
                 hass,
-                f"{DOMAIN}_{hide_email(email)}"[0:32],
+                email,
                 {"dnd_update": dnd["doNotDisturbDeviceStatusList"]},
             )
             return
@@ -2281,7 +2370,13 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 and retries <= NOTIFY_REFRESH_MAX_RETRIES
             ):
                 try:
-                    data = await AlexaAPI.get_notifications(login)
+                    data = await limited_call(
+                        hass,
+                        login,
+                        RequestPriority.PUSH,
+                        AlexaAPI.get_notifications,
+                        login,
+                    )
                 except Exception as ex:
                     _LOGGER.warning(
                         "%s: get_notifications raised %s; treating as None. This may indicate an unexpected error.",
@@ -2378,32 +2473,27 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
         _LOGGER.debug("%s: HTTP2 created: %s", hide_email(email), http2)
         return http2
 
-    @callback
-    async def http2_handler(message_obj):
-        # pylint: disable=too-many-branches,too-many-statements
-        """Handle http2 push messages.
-
-        This allows push notifications from Alexa to update last_called and media state.
-        """
-
-        coordinator = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("coordinator")
+    def _build_push_router() -> PushCommandRouter:
+        # pylint: disable=too-many-statements
+        """Build the push command routing table for this account."""
         account = hass.data[DATA_ALEXAMEDIA]["accounts"][email]
+        serial_index = get_serial_index(account)
 
         def _now_ms() -> int:
             return int(time.time() * 1000)
 
+        def _resource_ts_ms(resource: dict) -> int | None:
+            ts = resource.get("timeStamp")
+            return int(ts) if ts else None
+
         def simulate_activity(
             device_serial: str,
             customer_id: str | None,
             trigger_command: str,
             trigger_ts_ms: int | None,
         ) -> None:
-            _queue_last_called_activity(
-                account,
-                device_serial=device_serial,
-                customer_id=customer_id,
-                activity_ts=trigger_ts_ms,
-                command=trigger_command,
+            _last_called_activity_queue(account).upsert(
+                device_serial, customer_id, trigger_ts_ms, trigger_command
             )
             account["last_called_probe_trigger_serial"] = device_serial
             trigger = account.get("last_called_probe_trigger")
@@ -2411,88 +2501,239 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 trigger(trigger_command, trigger_ts_ms)
 
         def _handle_volume_change_activity(
-            serial: str,
-            json_payload: dict,
-            trigger_ts_ms: int | None,
+            serial: str | None, json_payload: dict, resource: dict
         ) -> None:
             """Mirror alexa-remote.ts PUSH_VOLUME_CHANGE -> simulateActivity() conditions."""
-            last_volumes: dict = account["last_volumes"]
-            last_equalizer: dict = account["last_equalizer"]
+            if not serial:
+                return
+            try:
+                trigger_ts_ms = _resource_ts_ms(resource)
+                last_volumes: dict = account["last_volumes"]
+                last_equalizer: dict = account["last_equalizer"]
 
-            vol = json_payload.get("volumeSetting")
-            muted = json_payload.get("isMuted")
+                vol = json_payload.get("volumeSetting")
+                muted = json_payload.get("isMuted")
 
-            prev = last_volumes.get(serial)
-            eq_prev = last_equalizer.get(serial)
+                eq_prev = last_equalizer.get(serial)
 
-            should_simulate = (
-                eq_prev is not None
-                and abs(_now_ms() - int(eq_prev.get("updated", 0)))
-                < LAST_CALLED_COALESCE_WINDOW_MS
-            )
-
-            if should_simulate:
-                _LOGGER.debug(
-                    "[_handle_volume_change_activity] Simulating activity",
+                should_simulate = (
+                    eq_prev is not None
+                    and abs(_now_ms() - int(eq_prev.get("updated", 0)))
+                    < LAST_CALLED_COALESCE_WINDOW_MS
                 )
-                simulate_activity(
-                    serial,
-                    json_payload.get("destinationUserId"),
+
+                if should_simulate:
+                    _LOGGER.debug(
+                        "[_handle_volume_change_activity] Simulating activity",
+                    )
+                    simulate_activity(
+                        serial,
+                        json_payload.get("destinationUserId"),
+                        "PUSH_VOLUME_CHANGE",
+                        trigger_ts_ms,
+                    )
+                else:
+                    _LOGGER.debug(
+                        "[_handle_volume_change_activity] Not simulating activity",
+                    )
+
+                last_volumes[serial] = {
+                    "volumeSetting": vol,
+                    "isMuted": muted,
+                    "updated": _now_ms(),
+                }
+            except Exception:
+                _LOGGER.exception(
+                    "%s: http2_handler failed processing %s",
+                    hide_email(email),
                     "PUSH_VOLUME_CHANGE",
-                    trigger_ts_ms,
                 )
-            else:
-                _LOGGER.debug(
-                    "[_handle_volume_change_activity] Not simulating activity",
-                )
-
-            last_volumes[serial] = {
-                "volumeSetting": vol,
-                "isMuted": muted,
-                "updated": _now_ms(),
-            }
 
         def _handle_equalizer_change_activity(
-            serial: str,
-            json_payload: dict,
-            trigger_ts_ms: int | None,
+            serial: str | None, json_payload: dict, resource: dict
         ) -> None:
             """Mirror alexa-remote.ts PUSH_EQUALIZER_STATE_CHANGE -> simulateActivity() conditions."""
-            last_volumes: dict = account["last_volumes"]
-            last_equalizer: dict = account["last_equalizer"]
-
-            bass = json_payload.get("bass")
-            treble = json_payload.get("treble")
-            midrange = json_payload.get("midrange")
-
-            prev = last_equalizer.get(serial)
-            vol_prev = last_volumes.get(serial)
-
-            should_simulate = (
-                prev is not None
-                and prev.get("bass") == bass
-                and prev.get("treble") == treble
-                and prev.get("midrange") == midrange
-            ) or (
-                vol_prev is not None
-                and abs(_now_ms() - int(vol_prev.get("updated", 0)))
-                < LAST_CALLED_COALESCE_WINDOW_MS
-            )
+            if not serial:
+                return
+            try:
+                trigger_ts_ms = _resource_ts_ms(resource)
+                last_volumes: dict = account["last_volumes"]
+                last_equalizer: dict = account["last_equalizer"]
+
+                bass = json_payload.get("bass")
+                treble = json_payload.get("treble")
+                midrange = json_payload.get("midrange")
+
+                prev = last_equalizer.get(serial)
+                vol_prev = last_volumes.get(serial)
+
+                should_simulate = (
+                    prev is not None
+                    and prev.get("bass") == bass
+                    and prev.get("treble") == treble
+                    and prev.get("midrange") == midrange
+                ) or (
+                    vol_prev is not None
+                    and abs(_now_ms() - int(vol_prev.get("updated", 0)))
+                    < LAST_CALLED_COALESCE_WINDOW_MS
+                )
+
+                if should_simulate:
+                    simulate_activity(
+                        serial,
+                        json_payload.get("destinationUserId"),
+                        "PUSH_EQUALIZER_STATE_CHANGE",
+                        trigger_ts_ms,
+                    )
 
-            if should_simulate:
-                simulate_activity(
-                    serial,
-                    json_payload.get("destinationUserId"),
+                last_equalizer[serial] = {
+                    "bass": bass,
+                    "treble": treble,
+                    "midrange": midrange,
+                    "updated": _now_ms(),
+                }
+            except Exception:
+                _LOGGER.exception(
+                    "%s: http2_handler failed processing %s",
+                    hide_email(email),
                     "PUSH_EQUALIZER_STATE_CHANGE",
-                    trigger_ts_ms,
                 )
 
-            last_equalizer[serial] = {
-                "bass": bass,
-                "treble": treble,
-                "midrange": midrange,
-                "updated": _now_ms(),
-            }
+        def _handle_now_playing(
+            serial: str | None, json_payload: dict, resource: dict
+        ) -> None:
+            if serial and serial in serial_index:
+                dispatch_serial_event(
+                    hass, email, serial, {"player_state": json_payload}
+                )
+            else:
+                _LOGGER.debug("Send NowPlaying: %s", hide_serial(json_payload))
+                dispatch_account_event(hass, email, {"now_playing": json_payload})
+
+        async def _handle_bluetooth_change(
+            serial: str | None, json_payload: dict, resource: dict
+        ) -> None:
+            bt_event = json_payload.get("bluetoothEvent")
+            _LOGGER.debug("bt_event: %s", bt_event)
+            bt_success = json_payload.get("bluetoothEventSuccess")
+            _LOGGER.debug("bt_success: %s", bt_success)
+            if (
+                serial
+                and serial in serial_index
+                and bt_success
+                and bt_event
+                in {
+                    "DEVICE_CONNECTED",
+                    "DEVICE_DISCONNECTED",
+                    "STREAMING_STATE_CHANGED",
+                }
+            ):
+                _LOGGER.debug(
+                    "Updating media_player bluetooth %s",
+                    hide_serial(json_payload),
+                )
+                bluetooth_state = await update_bluetooth_state(login_obj, serial)
+                _LOGGER.debug("bluetooth_state %s", hide_serial(bluetooth_state))
+                if bluetooth_state:
+                    dispatch_serial_event(
+                        hass, email, serial, {"bluetooth_change": bluetooth_state}
+                    )
+            elif fetch_scheduler := _fetch_scheduler():
+                # Other bluetooth events (e.g. pairing) are picked up next poll.
+                fetch_scheduler.invalidate("bluetooth")
+
+        def _handle_notification_change(
+            serial: str | None, json_payload: dict, resource: dict
+        ) -> None:
+            # Notification/alarm state changed on this device.
+            # Queue a refresh with backoff to ride out alexa-side cooldowns.
+            _schedule_notifications_refresh(
+                hass,
+                email,
+                device_serial=serial,
+                reason="PUSH_NOTIFICATION_CHANGE",
+            )
+
+        router = PushCommandRouter(
+            dispatch=lambda serial, event: dispatch_serial_event(
+                hass, email, serial, event
+            ),
+            is_known_serial=serial_index.__contains__,
+            metrics=get_metrics(hass),
+            coalesce_window=PUSH_COALESCE_WINDOW_S,
+        )
+        for command in (
+            "PUSH_AUDIO_PLAYER_STATE",
+            "PUSH_MEDIA_CHANGE",
+            "NotifyMediaSessionsUpdated",
+            "PUSH_DOPPLER_CONNECTION_CHANGE",  # Player availability update
+        ):
+            router.register(PushCommand(command, dispatch_key="player_state"))
+        router.register(
+            PushCommand(
+                "PUSH_MEDIA_PROGRESS_CHANGE", dispatch_key="player_state", coalesce=True
+            )
+        )
+        router.register(
+            PushCommand("NotifyNowPlayingUpdated", handler=_handle_now_playing)
+        )
+        router.register(
+            PushCommand(
+                "PUSH_VOLUME_CHANGE",
+                handler=_handle_volume_change_activity,
+                dispatch_key="player_state",
+                coalesce=True,
+            )
+        )
+        router.register(
+            PushCommand(
+                "PUSH_EQUALIZER_STATE_CHANGE",
+                handler=_handle_equalizer_change_activity,
+                dispatch_key="player_state",
+                coalesce=True,
+            )
+        )
+        router.register(
+            PushCommand("PUSH_BLUETOOTH_STATE_CHANGE", handler=_handle_bluetooth_change)
+        )
+        router.register(
+            PushCommand("PUSH_MEDIA_QUEUE_CHANGE", dispatch_key="queue_state")
+        )
+        router.register(
+            PushCommand(
+                "PUSH_NOTIFICATION_CHANGE",
+                handler=_handle_notification_change,
+                dispatch_key="notification_update",
+            )
+        )
+        router.register_unsupported(
+            [
+                "PUSH_DELETE_DOPPLER_ACTIVITIES",  # Delete Alexa history,
+                "PUSH_TODO_CHANGE",  # Update To-Do List
+                "PUSH_LIST_CHANGE",  # Clear a shopping list https://github.com/alandtse/alexa_media_player/issues/1190
+                "PUSH_LIST_ITEM_CHANGE",  # Update shopping list
+                "PUSH_CONTENT_FOCUS_CHANGE",  # Likely prime related refocus
+                "PUSH_DEVICE_SETUP_STATE_CHANGE",  # Likely device changes mid setup
+                "PUSH_MEDIA_PREFERENCE_CHANGE",  # Disliking or liking songs, https://github.com/alandtse/alexa_media_player/issues/1599
+                "MATTER_SETUP_NOTIFICATION",  # New command observed 2026-02-20
+            ]
+        )
+        return router
+
+    @callback
+    async def http2_handler(message_obj):
+        # pylint: disable=too-many-branches
+        """Handle http2 push messages.
+
+        This allows push notifications from Alexa to update last_called and media state.
+        Each command is resolved through the account's PushCommandRouter.
+        """
+
+        coordinator = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("coordinator")
+        account = hass.data[DATA_ALEXAMEDIA]["accounts"][email]
+        router = account.get("push_router")
+        if router is None:
+            router = account["push_router"] = _build_push_router()
 
         # ---------------------------------------------------------------------
         # Main http2push parsing / dispatch
@@ -2502,8 +2743,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             .get("payload", {})
             .get("renderingUpdates", [])
         )
-        existing_serials = set(_existing_serials(hass, login_obj))
-        existing_serials |= _entity_backed_serials(account)
+        existing_serials = get_serial_index(account)
         for item in updates:
             try:
                 resource = loads(item.get("resourceMetadata", ""))
@@ -2532,7 +2772,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 "http2_commands"
             ]
 
-            if command and json_payload:
+            if command and isinstance(json_payload, dict) and json_payload:
                 _LOGGER.debug(
                     "%s: Received http2push command: %s : %s",
                     hide_email(email),
@@ -2541,7 +2781,6 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 )
 
                 account["last_push_activity"] = time.time()
-                serial = None
                 command_time = time.time()
                 if command not in seen_commands:
                     _LOGGER.debug(
@@ -2549,224 +2788,10 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                     )
                 seen_commands[command] = command_time
 
-                if (
-                    "dopplerId" in json_payload
-                    and "deviceSerialNumber" in json_payload["dopplerId"]
-                ):
-                    serial = json_payload["dopplerId"]["deviceSerialNumber"]
-                elif (
-                    "key" in json_payload
-                    and "entryId" in json_payload["key"]
-                    and json_payload["key"]["entryId"].find("#") != -1
+                serial = router.extract_serial(command, json_payload)
+                if not await router.async_route(
+                    command, serial, json_payload, resource
                 ):
-                    serial = (json_payload["key"]["entryId"]).split("#")[2]
-                    json_payload["key"]["serialNumber"] = serial
-                else:
-                    serial = None
-
-                if command in (
-                    "PUSH_AUDIO_PLAYER_STATE",
-                    "PUSH_MEDIA_CHANGE",
-                    "PUSH_MEDIA_PROGRESS_CHANGE",
-                    "NotifyMediaSessionsUpdated",
-                    "NotifyNowPlayingUpdated",
-                ):
-                    if serial and serial in existing_serials:
-                        _LOGGER.debug(
-                            "Updating media_player: %s", hide_serial(json_payload)
-                        )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
-                        )
-                    elif command == "NotifyNowPlayingUpdated":
-                        _LOGGER.debug("Send NowPlaying: %s", hide_serial(json_payload))
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"now_playing": json_payload},
-                        )
-
-                elif command == "PUSH_VOLUME_CHANGE":
-                    try:
-                        ts = resource.get("timeStamp")
-                        ts_ms = int(ts) if ts else None
-
-                        if serial and isinstance(json_payload, dict):
-                            _handle_volume_change_activity(serial, json_payload, ts_ms)
-
-                    except Exception:
-                        _LOGGER.exception(
-                            "%s: http2_handler failed processing %s",
-                            hide_email(email),
-                            command,
-                        )
-
-                    if serial and serial in existing_serials:
-                        _LOGGER.debug(
-                            "Updating media_player volume: %s",
-                            hide_serial(json_payload),
-                        )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
-                        )
-
-                elif command == "PUSH_DOPPLER_CONNECTION_CHANGE":
-                    # Player availability update
-                    if serial and serial in existing_serials:
-                        _LOGGER.debug(
-                            "Updating media_player availability %s",
-                            hide_serial(json_payload),
-                        )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
-                        )
-
-                elif command == "PUSH_EQUALIZER_STATE_CHANGE":
-                    # Player equalizer update
-                    try:
-                        ts = resource.get("timeStamp")
-                        ts_ms = int(ts) if ts else None
-
-                        if serial and isinstance(json_payload, dict):
-                            _handle_equalizer_change_activity(
-                                serial, json_payload, ts_ms
-                            )
-
-                    except Exception:
-                        _LOGGER.exception(
-                            "%s: http2_handler failed processing %s",
-                            hide_email(email),
-                            command,
-                        )
-
-                    if serial and serial in existing_serials:
-                        _LOGGER.debug(
-                            "Updating media_player equalizer state %s",
-                            hide_serial(json_payload),
-                        )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"player_state": json_payload},
-                        )
-
-                elif command == "PUSH_BLUETOOTH_STATE_CHANGE":
-                    # Player bluetooth update
-                    bt_event = (
-                        json_payload.get("bluetoothEvent")
-                        if isinstance(json_payload, dict)
-                        else None
-                    )
-                    _LOGGER.debug("bt_event: %s", bt_event)
-                    bt_success = (
-                        json_payload.get("bluetoothEventSuccess")
-                        if isinstance(json_payload, dict)
-                        else None
-                    )
-                    _LOGGER.debug("bt_success: %s", bt_success)
-                    if (
-                        serial
-                        and serial in existing_serials
-                        and bt_success
-                        and bt_event
-                        and bt_event
-                        in {
-                            "DEVICE_CONNECTED",
-                            "DEVICE_DISCONNECTED",
-                            "STREAMING_STATE_CHANGED",
-                        }
-                    ):
-                        _LOGGER.debug(
-                            "Updating media_player bluetooth %s",
-                            hide_serial(json_payload),
-                        )
-                        bluetooth_state = await update_bluetooth_state(
-                            login_obj, serial
-                        )
-                        _LOGGER.debug(
-                            "bluetooth_state %s", hide_serial(bluetooth_state)
-                        )
-                        if bluetooth_state:
-                            async_dispatcher_send(
-                                hass,
-                                f"{DOMAIN}_{hide_email(email)}"[0:32],
-                                {"bluetooth_change": bluetooth_state},
-                            )
-
-                elif command == "PUSH_MEDIA_QUEUE_CHANGE":
-                    # Player availability update
-                    if serial and serial in existing_serials:
-                        _LOGGER.debug(
-                            "Updating media_player queue %s",
-                            hide_serial(json_payload),
-                        )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"queue_state": json_payload},
-                        )
-
-                elif command == "PUSH_NOTIFICATION_CHANGE":
-                    # Notification/alarm state changed on this device.
-                    # Queue a refresh with backoff to ride out alexa-side cooldowns.
-                    _schedule_notifications_refresh(
-                        hass,
-                        email,
-                        device_serial=serial,
-                        reason="PUSH_NOTIFICATION_CHANGE",
-                    )
-
-                    if serial and serial in existing_serials:
-                        _LOGGER.debug(
-                            "Updating mediaplayer notifications: %s",
-                            hide_serial(json_payload),
-                        )
-                        async_dispatcher_send(
-                            hass,
-                            f"{DOMAIN}_{hide_email(email)}"[0:32],
-                            {"notification_update": json_payload},
-                        )
-
-                elif command in [
-                    "PUSH_DELETE_DOPPLER_ACTIVITIES",  # Delete Alexa history,
-                ]:
-                    pass
-
-                elif command in [
-                    "PUSH_TODO_CHANGE",  # Update To-Do List
-                    "PUSH_LIST_CHANGE",  # Clear a shopping list https://github.com/alandtse/alexa_media_player/issues/1190
-                    "PUSH_LIST_ITEM_CHANGE",  # Update shopping list
-                ]:
-                    # To-do
-                    _LOGGER.debug("%s currently not supported", command)
-                    pass
-
-                elif command in [
-                    "PUSH_CONTENT_FOCUS_CHANGE",  # Likely prime related refocus
-                    "PUSH_DEVICE_SETUP_STATE_CHANGE",  # Likely device changes mid setup
-                ]:
-                    _LOGGER.debug("%s currently not supported", command)
-                    pass
-
-                elif command in [
-                    "PUSH_MEDIA_PREFERENCE_CHANGE",  # Disliking or liking songs, https://github.com/alandtse/alexa_media_player/issues/1599
-                ]:
-                    _LOGGER.debug("%s currently not supported", command)
-                    pass
-
-                elif command in [
-                    "MATTER_SETUP_NOTIFICATION",  # New command observed 2026-02-20
-                ]:
-                    _LOGGER.debug("%s: New command; currently not supported", command)
-                    pass
-
-                else:
                     _LOGGER.debug(
                         "Unhandled command: %s with data %s. Please report at %s",
                         command,
@@ -2815,10 +2840,7 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 if (
                     serial
                     and serial not in existing_serials
-                    and serial
-                    not in hass.data[DATA_ALEXAMEDIA]["accounts"][email][
-                        "excluded"
-                    ].keys()
+                    and not existing_serials.is_excluded(serial)
                 ):
                     _LOGGER.debug("Discovered new media_player %s", hide_serial(serial))
                     hass.data[DATA_ALEXAMEDIA]["accounts"][email]["new_devices"] = True
@@ -2890,11 +2912,15 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
                 "%s: HTTP2Push connection closed; retries exceeded; polling",
                 hide_email(email),
             )
-        coordinator = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("coordinator")
+        account = hass.data[DATA_ALEXAMEDIA]["accounts"][email]
+        coordinator = account.get("coordinator")
         if coordinator:
-            coordinator.update_interval = timedelta(
-                seconds=scan_interval * 10 if http2_enabled else scan_interval
-            )
+            if isinstance(coordinator, AlexaMediaCoordinator):
+                _adapt_poll_interval(account)
+            else:
+                coordinator.update_interval = timedelta(
+                    seconds=scan_interval * 10 if http2_enabled else scan_interval
+                )
             _LOGGER.debug(
                 "HTTP2push: %s, Polling interval: %s",
                 http2_enabled,
@@ -2955,6 +2981,11 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
 
     # Initialize the per-account probe worker exactly once here (not per push message).
     _init_last_called_probe_worker(hass.data[DATA_ALEXAMEDIA]["accounts"][email])
+    # Build the push routing table here so handlers bind to this login_obj.
+    old_router = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("push_router")
+    if old_router:
+        old_router.cancel_pending()
+    hass.data[DATA_ALEXAMEDIA]["accounts"][email]["push_router"] = _build_push_router()
 
     _t = time.monotonic()
     http2_enabled = hass.data[DATA_ALEXAMEDIA]["accounts"][email]["http2"] = (
@@ -2995,11 +3026,39 @@ async def setup_alexa(hass, config_entry, login_obj: AlexaLogin):
             coordinator.update_interval = timedelta(
                 seconds=scan_interval * 10 if http2_enabled else scan_interval
             )
+    snapshot = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("snapshot")
+    warm_boot = False
+    if hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("new_devices"):
+        if snapshot is not None:
+            _t = time.monotonic()
+            if warm_boot := await snapshot.async_load():
+                hass.data[DATA_ALEXAMEDIA]["accounts"][email][
+                    "warm_snapshot"
+                ] = snapshot
+            _LOGGER.debug(
+                "[BOOT] snapshot load (warm=%s) in %.2fs",
+                warm_boot,
+                time.monotonic() - _t,
+            )
+        else:
+            # Warm boot is disabled; drop any snapshot left from earlier runs.
+            hass.async_create_background_task(
+                DeviceSnapshot(hass, config_entry.entry_id).async_remove(),
+                f"{DOMAIN}_snapshot_remove_{hide_email(email)}",
+            )
     # Fetch initial data
     _LOGGER.debug("%s: setup_alexa: Starting coordinator refresh", hide_email(email))
     _t = time.monotonic()
     await coordinator.async_config_entry_first_refresh()
     _LOGGER.debug("[BOOT] first_refresh in %.2fs", time.monotonic() - _t)
+    if warm_boot:
+        # Reconcile the snapshot against live API data without blocking setup.
+        hass.data[DATA_ALEXAMEDIA]["accounts"][email]["snapshot_refresh_task"] = (
+            hass.async_create_background_task(
+                coordinator.async_refresh(),
+                f"{DOMAIN}_snapshot_reconcile_{hide_email(email)}",
+            )
+        )
 
     # Register services (fast - just registers callbacks)
     hass.data[DATA_ALEXAMEDIA]["services"] = alexa_services = AlexaMediaServices(
@@ -3049,6 +3108,7 @@ async def async_unload_entry(hass, entry) -> bool:
         "notifications_init_task",
         "last_called_init_task",
         "service_update_last_called_task",
+        "snapshot_refresh_task",
     ):
         accounts = hass.data.get(DATA_ALEXAMEDIA, {}).get("accounts", {})
         account = accounts.get(email)
@@ -3080,6 +3140,22 @@ async def async_unload_entry(hass, entry) -> bool:
             )
     hass.data[DATA_ALEXAMEDIA]["accounts"][email]["last_called_probe_task"] = None
 
+    push_router = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get("push_router")
+    if push_router:
+        push_router.cancel_pending()
+
+    scheduler = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get(
+        "notification_scheduler"
+    )
+    if scheduler:
+        scheduler.close()
+
+    notify_delivery = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get(
+        "notify_delivery"
+    )
+    if notify_delivery:
+        notify_delivery.close()
+
     debouncer = hass.data[DATA_ALEXAMEDIA]["accounts"][email].get(
         "confirm_refresh_debouncer"
     )
@@ -3101,7 +3177,8 @@ async def async_unload_entry(hass, entry) -> bool:
     await close_connections(hass, email)
     for listener in hass.data[DATA_ALEXAMEDIA]["accounts"][email][DATA_LISTENER]:
         listener()
-    hass.data[DATA_ALEXAMEDIA]["accounts"].pop(email)
+    account = hass.data[DATA_ALEXAMEDIA]["accounts"].pop(email)
+    remove_rate_limiter(hass, email, getattr(account.get("login_obj"), "url", None))
     # Clean up config flows in progress
     flows_to_remove = []
     if hass.data[DATA_ALEXAMEDIA].get("config_flows"):
@@ -3185,6 +3262,7 @@ async def async_remove_entry(hass, entry) -> bool:
                 )
         else:
             _LOGGER.error("Cookiefile not found: %s", obfuscated_cookiefile)
+    await DeviceSnapshot(hass, entry.entry_id).async_remove()
     _LOGGER.debug("Config entry %s removed.", obfuscated_email)
     return True
 
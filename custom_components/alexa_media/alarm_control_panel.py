@@ -27,6 +27,7 @@ from .const import (
     DEFAULT_QUEUE_DELAY,
     DOMAIN as ALEXA_DOMAIN,
 )
+from .coordinator import ChangeOnlyStateMixin
 from .helpers import _catch_login_errors, add_devices, safe_get
 
 try:
@@ -130,7 +131,9 @@ async def async_unload_entry(hass, entry) -> bool:
     return True
 
 
-class AlexaAlarmControlPanel(AlarmControlPanelEntity, AlexaMedia, CoordinatorEntity):
+class AlexaAlarmControlPanel(
+    ChangeOnlyStateMixin, AlarmControlPanelEntity, AlexaMedia, CoordinatorEntity
+):
     """Implementation of Alexa Media Player alarm control panel."""
 
     def __init__(self, login, coordinator, guard_entity, media_players=None) -> None:
@@ -255,6 +258,10 @@ class AlexaAlarmControlPanel(AlarmControlPanelEntity, AlexaMedia, CoordinatorEnt
         )
         return not last_refresh_success
 
+    def _coordinator_state(self):
+        """Return the alarm state, assumed state and attributes to compare."""
+        return self.state, self.assumed_state, dict(self._attrs)
+
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
@@ -9,16 +9,25 @@ https://community.home-assistant.io/t/echo-devices-alexa-as-media-player-testers
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 import json
 import logging
 import re
 from typing import Any, Optional, TypedDict
 
-from alexapy import AlexaAPI, AlexaLogin
+from alexapy import AlexaAPI, AlexaLogin, AlexapyLoginError
+from alexapy.errors import AlexapyTooManyRequestsError
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .const import (
+    ENTITY_STATE_CHUNK_SIZE,
+    ENTITY_STATE_CHUNK_TIMEOUT,
+    ENTITY_STATE_CONCURRENCY,
+)
 from .helpers import safe_get
+from .rate_limiter import RequestPriority, limited_call
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -225,6 +234,57 @@ def get_device_bridge(
 
 
 AlexaEntityData = dict[str, list["AlexaCapabilityState"]]
+IndexedCapState = tuple["AlexaCapabilityState", Optional[datetime]]
+
+
+def _parse_time_of_sample(value: Any) -> datetime | None:
+    """Return timeOfSample as a datetime, or None if missing or unparsable."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class CapabilityStateIndex(dict):
+    """Entity data with an index over its capability states.
+
+    Behaves like the plain ``AlexaEntityData`` mapping of entity id to
+    capability states. ``lookup`` returns the states matching an
+    (entity_id, namespace, name, instance) key together with their pre-parsed
+    ``timeOfSample`` without scanning. Treat it as read only; a new index is
+    built on every poll.
+    """
+
+    def __init__(self, data: AlexaEntityData | None = None) -> None:
+        """Initialize the index from entity data."""
+        super().__init__(data or {})
+        self._index: dict[tuple[str, str, str, str | None], list[IndexedCapState]] = {}
+        for entity_id, cap_states in self.items():
+            for cap_state in cap_states:
+                entry = (
+                    cap_state,
+                    _parse_time_of_sample(cap_state.get("timeOfSample")),
+                )
+                namespace = cap_state.get("namespace")
+                name = cap_state.get("name")
+                # instance=None lookups match every instance, in payload order
+                self._index.setdefault((entity_id, namespace, name, None), []).append(
+                    entry
+                )
+                instance = cap_state.get("instance")
+                if instance is not None:
+                    self._index.setdefault(
+                        (entity_id, namespace, name, str(instance)), []
+                    ).append(entry)
+
+    def lookup(
+        self, entity_id: str, namespace: str, name: str, instance: str | None = None
+    ) -> list[IndexedCapState]:
+        """Return the matching (capability state, time of sample) pairs."""
+        key = (entity_id, namespace, name, None if instance is None else str(instance))
+        return self._index.get(key, [])
 
 
 class AlexaEntity(TypedDict):
@@ -555,24 +615,100 @@ def parse_alexa_entities(
     }
 
 
+def _parse_entity_states(raw: Any) -> AlexaEntityData:
+    """Return the capability states of a get_entity_state response by entity id."""
+    entities: AlexaEntityData = {}
+    device_states = raw.get("deviceStates", []) if isinstance(raw, dict) else None
+    if device_states:
+        for device_state in device_states:
+            entity_id = safe_get(device_state, ["entity", "entityId"])
+            if entity_id:
+                entities[entity_id] = []
+                cap_states = device_state.get("capabilityStates", [])
+                for cap_state in cap_states:
+                    entities[entity_id].append(json.loads(cap_state))
+    return entities
+
+
 async def get_entity_data(
-    login_obj: AlexaLogin, entity_ids: list[str]
+    login_obj: AlexaLogin,
+    entity_ids: list[str],
+    *,
+    chunk_size: int = ENTITY_STATE_CHUNK_SIZE,
+    concurrency: int = ENTITY_STATE_CONCURRENCY,
+    timeout: float = ENTITY_STATE_CHUNK_TIMEOUT,
+    previous: AlexaEntityData | None = None,
+    hass: HomeAssistant | None = None,
 ) -> AlexaEntityData:
-    """Get and process the entity data into a more usable format."""
-
-    entities = {}
-    if entity_ids:
-        raw = await AlexaAPI.get_entity_state(login_obj, entity_ids=entity_ids)
-        device_states = raw.get("deviceStates", []) if isinstance(raw, dict) else None
-        if device_states:
-            for device_state in device_states:
-                entity_id = safe_get(device_state, ["entity", "entityId"])
-                if entity_id:
-                    entities[entity_id] = []
-                    cap_states = device_state.get("capabilityStates", [])
-                    for cap_state in cap_states:
-                        entities[entity_id].append(json.loads(cap_state))
-    return entities
+    """Get and process the entity data into a more usable format.
+
+    entity_ids are requested in chunks of chunk_size with at most concurrency
+    requests in flight. With hass, every chunk takes its own token from the
+    account's rate limiter at POLL priority, so a 429 pauses the bucket. A
+    chunk that fails, times out or returns malformed states is logged and its
+    entities keep their states from previous, so one bad chunk does not
+    discard the others. Login and rate limit errors are always raised, as is
+    the first error when every chunk failed.
+    """
+    entities: AlexaEntityData = {}
+    if not entity_ids:
+        return CapabilityStateIndex(entities)
+
+    chunk_size = max(1, chunk_size)
+    chunks = [
+        entity_ids[start : start + chunk_size]
+        for start in range(0, len(entity_ids), chunk_size)
+    ]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def request(chunk: list[str]) -> Any:
+        # The timeout covers the request only, not the wait for a token.
+        return await asyncio.wait_for(
+            AlexaAPI.get_entity_state(login_obj, entity_ids=chunk), timeout
+        )
+
+    async def fetch(chunk: list[str]) -> AlexaEntityData:
+        async with semaphore:
+            if hass is None:
+                raw = await request(chunk)
+            else:
+                raw = await limited_call(
+                    hass, login_obj, RequestPriority.POLL, request, chunk
+                )
+        return _parse_entity_states(raw)
+
+    results = await asyncio.gather(
+        *(fetch(chunk) for chunk in chunks), return_exceptions=True
+    )
+    errors: list[BaseException] = []
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            if isinstance(
+                result,
+                (
+                    AlexapyLoginError,
+                    AlexapyTooManyRequestsError,
+                    asyncio.CancelledError,
+                ),
+            ):
+                raise result
+            errors.append(result)
+            _LOGGER.warning(
+                "Entity state request for %s of %s entities failed: %s",
+                len(chunk),
+                len(entity_ids),
+                repr(result),
+            )
+            if previous:
+                for entity_id in chunk:
+                    if entity_id in previous:
+                        entities[entity_id] = previous[entity_id]
+            continue
+        entities.update(result)
+
+    if errors and len(errors) == len(chunks):
+        raise errors[0]
+    return CapabilityStateIndex(entities)
 
 
 def parse_temperature_from_coordinator(
@@ -695,29 +831,21 @@ def parse_value_from_coordinator(
     """Parse out values from coordinator for Alexa Entities."""
     if coordinator.data and entity_id in coordinator.data:
         found_match = False
-        for cap_state in coordinator.data[entity_id]:
-            cap_instance = cap_state.get("instance")
-            instance_match = instance is None or (
-                cap_instance is not None and str(cap_instance) == str(instance)
-            )
-            if (
-                cap_state.get("namespace") == namespace
-                and cap_state.get("name") == name
-                and instance_match
-            ):
-                found_match = True
-                if is_cap_state_still_acceptable(cap_state, since):
-                    return cap_state.get("value")
-                if debug:
-                    _LOGGER.debug(
-                        "Coordinator data for %s (%s/%s instance=%s) is too old; checking other matches.",
-                        entity_id,
-                        namespace,
-                        name,
-                        instance,
-                    )
-                # Keep searching in case a newer matching cap_state exists later.
-                continue
+        for cap_state, time_of_sample in _matching_cap_states(
+            coordinator.data, entity_id, namespace, name, instance
+        ):
+            found_match = True
+            if _is_sample_still_acceptable(time_of_sample, since):
+                return cap_state.get("value")
+            if debug:
+                _LOGGER.debug(
+                    "Coordinator data for %s (%s/%s instance=%s) is too old; checking other matches.",
+                    entity_id,
+                    namespace,
+                    name,
+                    instance,
+                )
+            # Keep searching in case a newer matching cap_state exists later.
         if debug and found_match:
             _LOGGER.debug(
                 "No acceptable coordinator data found for %s (%s/%s instance=%s).",
@@ -738,10 +866,41 @@ def parse_value_from_coordinator(
     return None
 
 
-def is_cap_state_still_acceptable(
-    cap_state: dict[str, Any], since: datetime | None
+def _matching_cap_states(
+    data: AlexaEntityData,
+    entity_id: str,
+    namespace: str,
+    name: str,
+    instance: str | None,
+) -> list[IndexedCapState]:
+    """Return the capability states of entity_id matching namespace/name/instance.
+
+    Uses the index when the data came from get_entity_data, otherwise scans the
+    entity's states and parses timeOfSample of the matches.
+    """
+    if isinstance(data, CapabilityStateIndex):
+        return data.lookup(entity_id, namespace, name, instance)
+    matches = []
+    for cap_state in data[entity_id]:
+        cap_instance = cap_state.get("instance")
+        instance_match = instance is None or (
+            cap_instance is not None and str(cap_instance) == str(instance)
+        )
+        if (
+            cap_state.get("namespace") == namespace
+            and cap_state.get("name") == name
+            and instance_match
+        ):
+            matches.append(
+                (cap_state, _parse_time_of_sample(cap_state.get("timeOfSample")))
+            )
+    return matches
+
+
+def _is_sample_still_acceptable(
+    time_of_sample: datetime | None, since: datetime | None
 ) -> bool:
-    """Determine if a particular capability state is still usable given its age."""
+    """Determine if a sample taken at time_of_sample is still usable."""
     if since is None:
         return True
 
@@ -750,15 +909,20 @@ def is_cap_state_still_acceptable(
     if datetime.now(timezone.utc) - since > _REQUESTED_STATE_TTL:
         return True
 
-    formatted_time_of_sample = cap_state.get("timeOfSample")
-    if not formatted_time_of_sample:
+    if time_of_sample is None:
         # If we can't prove the sample is newer than the requested state,
         # do not allow it to override optimistic/requested values.
         return False
 
-    try:
-        time_of_sample = datetime.fromisoformat(formatted_time_of_sample)
-    except ValueError:
-        return False
-
     return time_of_sample >= since
+
+
+def is_cap_state_still_acceptable(
+    cap_state: dict[str, Any], since: datetime | None
+) -> bool:
+    """Determine if a particular capability state is still usable given its age."""
+    if since is None:
+        return True
+    return _is_sample_still_acceptable(
+        _parse_time_of_sample(cap_state.get("timeOfSample")), since
+    )
@@ -12,6 +12,7 @@ import logging
 from alexapy import AlexaAPI, hide_email
 
 from .const import DATA_ALEXAMEDIA
+from .rate_limiter import RateLimitedAPI, RequestPriority
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,7 +25,12 @@ class AlexaMedia:
 
         # Class info
         self._login = login
-        self.alexa_api = AlexaAPI(device, login)
+        # Commands are user priority; state refreshes are polling.
+        self.alexa_api = RateLimitedAPI(
+            AlexaAPI(device, login),
+            self,
+            priorities={"get_state": RequestPriority.POLL},
+        )
         self.email = login.email
         self.account = hide_email(login.email)
 
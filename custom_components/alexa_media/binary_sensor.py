@@ -26,6 +26,7 @@ from . import (
 )
 from .alexa_entity import parse_detection_state_from_coordinator
 from .const import CONF_EXTENDED_ENTITY_DISCOVERY
+from .coordinator import ChangeOnlyStateMixin
 from .helpers import add_devices, safe_get
 
 _LOGGER = logging.getLogger(__name__)
@@ -83,7 +84,7 @@ async def async_unload_entry(hass, entry) -> bool:
     return True
 
 
-class AlexaContact(CoordinatorEntity, BinarySensorEntity):
+class AlexaContact(ChangeOnlyStateMixin, CoordinatorEntity, BinarySensorEntity):
     """A contact sensor controlled by an Echo."""
 
     _attr_device_class = BinarySensorDeviceClass.DOOR
@@ -126,3 +127,7 @@ class AlexaContact(CoordinatorEntity, BinarySensorEntity):
             self.coordinator.data and self.alexa_entity_id in self.coordinator.data
         )
         return not last_refresh_success
+
+    def _coordinator_state(self):
+        """Return the contact state and assumed state to compare."""
+        return self.is_on, self.assumed_state
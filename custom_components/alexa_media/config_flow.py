@@ -67,6 +67,7 @@ from .const import (
     CONF_QUEUE_DELAY,
     CONF_SECURITYCODE,
     CONF_TOTP_REGISTER,
+    CONF_WARM_BOOT,
     DATA_ALEXAMEDIA,
     DEFAULT_DEBUG,
     DEFAULT_EXTENDED_ENTITY_DISCOVERY,
@@ -74,6 +75,7 @@ from .const import (
     DEFAULT_PUBLIC_URL,
     DEFAULT_QUEUE_DELAY,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WARM_BOOT,
     DOMAIN,
     ISSUE_URL,
 )
@@ -983,6 +985,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     ),
                     bool,
                 ),
+                (
+                    vol.Optional(
+                        CONF_WARM_BOOT,
+                        default=self.config_entry.data.get(
+                            CONF_WARM_BOOT, DEFAULT_WARM_BOOT
+                        ),
+                    ),
+                    bool,
+                ),
                 (
                     vol.Optional(
                         CONF_DEBUG,
@@ -10,6 +10,7 @@ https://community.home-assistant.io/t/echo-devices-alexa-as-media-player-testers
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.const import (
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
@@ -50,6 +51,7 @@ CONF_EXCLUDE_DEVICES = "exclude_devices"
 CONF_QUEUE_DELAY = "queue_delay"
 CONF_PUBLIC_URL = "public_url"
 CONF_EXTENDED_ENTITY_DISCOVERY = "extended_entity_discovery"
+CONF_WARM_BOOT = "warm_boot"
 CONF_SECURITYCODE = "securitycode"
 CONF_OTPSECRET = "otp_secret"
 CONF_PROXY = "proxy"
@@ -69,6 +71,7 @@ DEFAULT_HASS_URL = "http://homeassistant.local:8123"
 DEFAULT_PUBLIC_URL = ""
 DEFAULT_QUEUE_DELAY = 1.5
 DEFAULT_SCAN_INTERVAL = 60
+DEFAULT_WARM_BOOT = False
 
 EPOCH_MS_THRESHOLD = 10_000_000_000
 
@@ -91,20 +94,95 @@ LAST_CALLED_RETRY_DELAY_S = 4.0  # wider retry cadence for delayed routine histo
 LAST_CALLED_RETRY_LIMIT = 2  # total attempts = 1 + retries (3 attempts)
 LAST_CALLED_STALE_FUDGE_MS = 5_000  # allow some clock/ordering jitter
 LAST_CALLED_SUCCESS_PACE_S = 4.0  # post-success pacing to avoid hammering
-LAST_CALLED_LOOKBACK_MS = 60_000
+LAST_CALLED_LOOKBACK_MS = 60_000  # history overlap kept below the high-water mark
+LAST_CALLED_HISTORY_WINDOW_MS = 15 * 60 * 1000  # wide window after errors
 LAST_CALLED_ITEMS = 10
 LAST_CALLED_COALESCE_WINDOW_MS = 2000
+LAST_CALLED_QUEUE_MAX_SIZE = 32  # queued activities per account, oldest dropped
+LAST_CALLED_QUEUE_MAX_AGE_S = 300.0  # give up on activity history never shows
+
+# Tuning constants for get_entity_data: entity ids per get_entity_state request,
+# requests in flight at once, and seconds before a single request is abandoned
+ENTITY_STATE_CHUNK_SIZE = 50
+ENTITY_STATE_CONCURRENCY = 3
+ENTITY_STATE_CHUNK_TIMEOUT = 8.0
 
 # Tuning constants for notification retries
 NOTIFICATION_COOLDOWN = 60
 NOTIFY_REFRESH_BACKOFF = 15.0
 NOTIFY_REFRESH_MAX_RETRIES = 3
+NOTIFICATION_SCHEDULE_PREVIEW = 5  # upcoming fires listed in diagnostics
 
 # push-health magic numbers
 HTTP2_ERROR_THRESHOLD = 5
 LAST_PUSH_INACTIVITY_SECONDS = 600.0
 LAST_PING_MAX_AGE_SECONDS = 900.0
 
+# Window for coalescing bursty push dispatches (progress/volume/equalizer) per
+# device; only the latest payload is sent when it closes. 0 disables coalescing.
+PUSH_COALESCE_WINDOW_S = 0.5
+
+# Dispatcher routing: per-serial event key -> entity types that consume it.
+# Event keys not listed here are global and go out on the account-wide signal.
+SERIAL_EVENT_ROUTES: dict[str, tuple[str, ...]] = {
+    "player_state": ("media_player",),
+    "parent_state": ("media_player",),
+    "bluetooth_change": ("media_player",),
+    "queue_state": ("media_player", "switch"),
+    "notification_update": ("sensor",),
+    "notifications_refreshed": ("sensor",),
+}
+
+# Lifetimes (seconds) of AlexaMetrics.api_cache entries by key prefix, i.e. the
+# part of the key before ":". Prefixes not listed use the cache default (30s).
+API_CACHE_TTLS: dict[str, float] = {
+    "devices": 30.0,
+}
+
+# Per-endpoint refresh cadence for the coordinator poll. "interval" is the
+# minimum time in seconds between fetches; push_covered endpoints are
+# invalidated by push events (bluetooth changes, the DND heuristic) and are
+# fetched on every poll while push is unhealthy.
+ENDPOINT_FETCH_POLICIES: dict[str, dict[str, Any]] = {
+    "bluetooth": {"interval": 900.0, "push_covered": True},
+    "preferences": {"interval": 3600.0, "push_covered": False},
+    "dnd": {"interval": 300.0, "push_covered": True},
+}
+
+# Token bucket shared by the AlexaAPI calls of an account (or of every account
+# on the same Amazon URL with RATE_LIMIT_SCOPE = "region"). A 429 pauses the
+# bucket for an exponentially growing backoff, reset by the next success.
+RATE_LIMIT_RATE = 2.0  # tokens per second
+RATE_LIMIT_BURST = 20
+RATE_LIMIT_SCOPE = "account"  # "account" or "region"
+RATE_LIMIT_BACKOFF_INITIAL_S = 5.0
+RATE_LIMIT_BACKOFF_MAX_S = 120.0
+
+# Adaptive coordinator poll interval, as multiples of the configured scan
+# interval. The chosen interval always stays within
+# [scan_interval, scan_interval * POLL_INTERVAL_MAX_FACTOR].
+POLL_INTERVAL_PUSH_FACTOR = 10  # push healthy, nothing playing
+POLL_INTERVAL_PLAYING_FACTOR = 5  # push healthy, a device is playing
+POLL_INTERVAL_QUIET_FACTOR = 20  # push healthy, no push for POLL_QUIET_AFTER_S
+POLL_INTERVAL_MAX_FACTOR = 30
+POLL_QUIET_AFTER_S = 1800.0
+# Each 429 within the window doubles the interval (up to 2**4)
+POLL_RATE_LIMIT_WINDOW_S = 900.0
+POLL_RATE_LIMIT_MAX_DOUBLINGS = 4
+
+# Notify deliveries of an account start in order and run at most
+# NOTIFY_DELIVERY_CONCURRENCY at a time. Senders wait while
+# NOTIFY_DELIVERY_MAX_QUEUED deliveries are pending; a delivery taking longer
+# than NOTIFY_DELIVERY_TIMEOUT seconds counts as failed.
+NOTIFY_DELIVERY_CONCURRENCY = 2
+NOTIFY_DELIVERY_MAX_QUEUED = 50
+NOTIFY_DELIVERY_TIMEOUT = 30.0
+
+# Warm boot snapshot (devices, parsed network entities, auth info) in .storage.
+# Saves are delayed so consecutive polls only write once.
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 30.0
+
 RECURRING_PATTERN = {
     None: "Never Repeat",
     "P1D": "Every day",
@@ -237,6 +315,12 @@ ALEXA_AIR_QUALITY_DEVICE_CLASS = {
 }
 
 UPLOAD_PATH = "www/alexa_tts"
+# Announcement audio converted for Alexa is cached in UPLOAD_PATH. Files unused
+# for TRANSCODE_CACHE_MAX_AGE seconds are deleted, then the least recently used
+# until the folder is below TRANSCODE_CACHE_MAX_BYTES.
+TRANSCODE_CACHE_MAX_BYTES = 50 * 1024 * 1024
+TRANSCODE_CACHE_MAX_AGE = 7 * 24 * 3600
+TRANSCODE_TIMEOUT = 60.0  # download and conversion of one file
 
 # Note: Some of these are likely wrong
 MODEL_IDS = {
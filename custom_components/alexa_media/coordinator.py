@@ -3,18 +3,39 @@
 Optimizations:
 - Debouncer for request coalescing
 - Type-safe runtime data integration
+- Device fingerprints so unchanged media players are not refreshed
+- Per-endpoint fetch scheduling so slow-changing API data is polled less often
+- Adaptive poll interval driven by push health, playback and rate limiting
+- Change-only state writes for coordinator-backed entities
 """
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import timedelta
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
 
+from homeassistant.core import callback
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN, SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    ENDPOINT_FETCH_POLICIES,
+    POLL_INTERVAL_MAX_FACTOR,
+    POLL_INTERVAL_PLAYING_FACTOR,
+    POLL_INTERVAL_PUSH_FACTOR,
+    POLL_INTERVAL_QUIET_FACTOR,
+    POLL_QUIET_AFTER_S,
+    POLL_RATE_LIMIT_MAX_DOUBLINGS,
+    POLL_RATE_LIMIT_WINDOW_S,
+    SCAN_INTERVAL,
+)
+from .metrics import get_metrics
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -27,12 +48,219 @@ _LOGGER = logging.getLogger(__name__)
 REQUEST_REFRESH_DEBOUNCE_COOLDOWN = 1.5
 
 
+def device_fingerprint(device: dict[str, Any], *extra: Any) -> str | None:
+    """Return a stable digest of a device dict and any extra context.
+
+    Returns None if the data cannot be serialized, which callers should treat
+    as "changed".
+    """
+    try:
+        payload = json.dumps(
+            [device, extra], sort_keys=True, default=str, separators=(",", ":")
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class FetchScheduler:
+    """Per-endpoint refresh bookkeeping for coordinator polls.
+
+    Each endpoint has a minimum interval between fetches. An endpoint is due
+    when it has never been fetched, was invalidated (e.g. by a push event),
+    its interval elapsed, or it is push covered and push is unhealthy.
+    Endpoints without a policy are always due.
+    """
+
+    def __init__(self, policies: Mapping[str, Mapping[str, Any]]) -> None:
+        """Initialize scheduler.
+
+        Args:
+            policies: endpoint -> {"interval": seconds, "push_covered": bool}
+        """
+        self._policies: dict[str, tuple[float, bool]] = {
+            endpoint: (
+                float(policy.get("interval", 0.0)),
+                bool(policy.get("push_covered", False)),
+            )
+            for endpoint, policy in policies.items()
+        }
+        self._last_fetch: dict[str, float] = {}
+        self._invalidated: set[str] = set()
+        self._fetches: dict[str, int] = {}
+        self._skips: dict[str, int] = {}
+
+    def due(
+        self, endpoint: str, push_healthy: bool = True, now: float | None = None
+    ) -> bool:
+        """Return whether endpoint should be fetched on this poll."""
+        policy = self._policies.get(endpoint)
+        last_fetch = self._last_fetch.get(endpoint)
+        if policy is None or last_fetch is None or endpoint in self._invalidated:
+            return True
+        interval, push_covered = policy
+        if push_covered and not push_healthy:
+            return True
+        now = time.monotonic() if now is None else now
+        return now - last_fetch >= interval
+
+    def select(self, endpoints: Iterable[str], push_healthy: bool = True) -> list[str]:
+        """Return the due endpoints and count the others as skipped."""
+        now = time.monotonic()
+        selected = []
+        for endpoint in endpoints:
+            if self.due(endpoint, push_healthy, now):
+                selected.append(endpoint)
+            else:
+                self._skips[endpoint] = self._skips.get(endpoint, 0) + 1
+        return selected
+
+    def mark_fetched(self, endpoint: str) -> None:
+        """Record a successful fetch of endpoint."""
+        self._last_fetch[endpoint] = time.monotonic()
+        self._invalidated.discard(endpoint)
+        self._fetches[endpoint] = self._fetches.get(endpoint, 0) + 1
+
+    def invalidate(self, endpoint: str) -> None:
+        """Make endpoint due on the next poll."""
+        self._invalidated.add(endpoint)
+
+    def invalidate_all(self) -> None:
+        """Make every endpoint due on the next poll."""
+        self._invalidated.update(self._policies)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-endpoint intervals, fetch ages and counters."""
+        now = time.monotonic()
+        stats = {}
+        for endpoint in self._policies.keys() | self._last_fetch.keys():
+            interval, push_covered = self._policies.get(endpoint, (0.0, False))
+            last_fetch = self._last_fetch.get(endpoint)
+            stats[endpoint] = {
+                "interval": interval,
+                "push_covered": push_covered,
+                "last_fetch_age": (
+                    round(now - last_fetch, 1) if last_fetch is not None else None
+                ),
+                "invalidated": endpoint in self._invalidated,
+                "fetches": self._fetches.get(endpoint, 0),
+                "skips": self._skips.get(endpoint, 0),
+            }
+        return dict(sorted(stats.items()))
+
+
+class PollIntervalController:
+    """Pick the coordinator poll interval from push, playback and 429 signals.
+
+    Without a push connection, or while push is connected but not healthy,
+    the account is polled at the scan interval. With healthy push the
+    interval is relaxed, less so while a device is playing, and further when
+    nothing has been pushed for a long time and nothing is playing. Recent
+    429 responses double the result per response. The interval is clamped to
+    [scan_interval, scan_interval * POLL_INTERVAL_MAX_FACTOR].
+    """
+
+    def __init__(self, scan_interval: float) -> None:
+        """Initialize controller.
+
+        Args:
+            scan_interval: Configured polling interval in seconds
+        """
+        self.min_interval = float(scan_interval)
+        self.max_interval = float(scan_interval) * POLL_INTERVAL_MAX_FACTOR
+        self.interval = self.min_interval
+        self.reasons: list[str] = ["push_down"]
+        self._signals: dict[str, Any] = {
+            "push_connected": False,
+            "push_healthy": False,
+            "last_push_activity": 0.0,
+            "playing": 0,
+        }
+        self._rate_limited: deque[float] = deque()
+        self._changes = 0
+
+    def record_rate_limited(self) -> None:
+        """Record a 429 response from the Alexa API."""
+        self._rate_limited.append(time.monotonic())
+
+    def _recent_rate_limits(self) -> int:
+        """Drop 429s older than the window and return how many remain."""
+        cutoff = time.monotonic() - POLL_RATE_LIMIT_WINDOW_S
+        while self._rate_limited and self._rate_limited[0] < cutoff:
+            self._rate_limited.popleft()
+        return len(self._rate_limited)
+
+    def evaluate(self, now: float | None = None, **signals: Any) -> float:
+        """Update the given signals and return the new interval in seconds.
+
+        Args:
+            now: Wall clock time compared with last_push_activity
+            **signals: push_connected, push_healthy, last_push_activity
+                (time.time() of the last push, 0 if none) and playing (count
+                of playing media players); omitted signals keep their value
+        """
+        self._signals.update(signals)
+        push_connected = bool(self._signals["push_connected"])
+        push_healthy = bool(self._signals["push_healthy"])
+        last_push = float(self._signals["last_push_activity"] or 0.0)
+        playing = int(self._signals["playing"] or 0)
+        now = time.time() if now is None else now
+
+        if not push_connected:
+            factor, reasons = 1, ["push_down"]
+        elif not push_healthy:
+            # A connected but silent or erroring socket is the usual way push
+            # degrades, so poll at the scan interval until it recovers.
+            factor, reasons = 1, ["push_stale"]
+        elif playing:
+            factor, reasons = POLL_INTERVAL_PLAYING_FACTOR, ["push_healthy"]
+        elif last_push and now - last_push >= POLL_QUIET_AFTER_S:
+            factor, reasons = POLL_INTERVAL_QUIET_FACTOR, ["push_healthy", "quiet"]
+        else:
+            factor, reasons = POLL_INTERVAL_PUSH_FACTOR, ["push_healthy"]
+        if push_connected and playing:
+            reasons.append(f"playing:{playing}")
+
+        interval = self.min_interval * factor
+        if rate_limited := self._recent_rate_limits():
+            interval *= 2 ** min(rate_limited, POLL_RATE_LIMIT_MAX_DOUBLINGS)
+            reasons.append(f"rate_limited:{rate_limited}")
+        if interval > self.max_interval:
+            interval = self.max_interval
+            reasons.append("max_interval")
+
+        if interval != self.interval:
+            self._changes += 1
+        self.interval = interval
+        self.reasons = reasons
+        return interval
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the chosen interval, its reasons and the signals behind it."""
+        last_push = float(self._signals["last_push_activity"] or 0.0)
+        return {
+            "interval": self.interval,
+            "reasons": list(self.reasons),
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "push_connected": bool(self._signals["push_connected"]),
+            "push_healthy": bool(self._signals["push_healthy"]),
+            "last_push_age": (round(time.time() - last_push, 1) if last_push else None),
+            "playing": int(self._signals["playing"] or 0),
+            "recent_rate_limits": self._recent_rate_limits(),
+            "changes": self._changes,
+        }
+
+
 class AlexaMediaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Alexa Media Player.
 
     Features:
     - Debounced refresh requests to avoid API hammering
     - Type-safe integration with runtime_data
+    - Per-device fingerprints to skip no-op entity refreshes
+    - Per-endpoint fetch scheduler for the account's AlexaAPI calls
+    - Adaptive poll interval controller
     """
 
     def __init__(
@@ -52,11 +280,16 @@ class AlexaMediaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         self.runtime_data = runtime_data
         self._scan_interval = scan_interval or SCAN_INTERVAL.total_seconds()
+        self._device_fingerprints: dict[str, str] = {}
+        self.fetch_scheduler = FetchScheduler(ENDPOINT_FETCH_POLICIES)
+        self.poll_interval = PollIntervalController(self._scan_interval)
 
         # Calculate update interval based on HTTP2 status
         http2_enabled = runtime_data.http2 is not None if runtime_data else False
         update_interval = timedelta(
-            seconds=self._scan_interval * 10 if http2_enabled else self._scan_interval
+            seconds=self.poll_interval.evaluate(
+                push_connected=http2_enabled, push_healthy=http2_enabled
+            )
         )
 
         # Initialize debouncer for request coalescing
@@ -87,13 +320,83 @@ class AlexaMediaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         When HTTP2 is enabled, we can poll less frequently since we get push updates.
         """
-        new_interval = timedelta(
-            seconds=self._scan_interval * 10 if enabled else self._scan_interval
-        )
+        self.adapt_interval(push_connected=enabled, push_healthy=enabled)
+
+    def record_rate_limited(self) -> None:
+        """Record a 429 response so the next interval backs off."""
+        self.poll_interval.record_rate_limited()
+
+    def adapt_interval(self, **signals: Any) -> timedelta:
+        """Re-evaluate the poll interval and apply it if it changed.
+
+        Accepts the signals of PollIntervalController.evaluate.
+        """
+        new_interval = timedelta(seconds=self.poll_interval.evaluate(**signals))
         if self.update_interval != new_interval:
             self.update_interval = new_interval
             _LOGGER.debug(
-                "Updated polling interval: %s (HTTP2: %s)",
+                "Updated polling interval: %s (%s)",
                 new_interval,
-                enabled,
+                ", ".join(self.poll_interval.reasons),
             )
+        return new_interval
+
+    def device_changed(self, serial: str, device: dict[str, Any], *extra: Any) -> bool:
+        """Return whether a device dict changed since it was last applied.
+
+        The new fingerprint is remembered, so each change is reported once.
+        Pass anything else the entity derives state from as ``extra``.
+        """
+        fingerprint = device_fingerprint(device, *extra)
+        if fingerprint is not None and self._device_fingerprints.get(serial) == (
+            fingerprint
+        ):
+            return False
+        if fingerprint is None:
+            self._device_fingerprints.pop(serial, None)
+        else:
+            self._device_fingerprints[serial] = fingerprint
+        return True
+
+    def forget_device(self, serial: str) -> None:
+        """Drop the stored fingerprint so the next refresh is applied."""
+        self._device_fingerprints.pop(serial, None)
+
+
+_UNWRITTEN = object()
+
+
+class ChangeOnlyStateMixin:
+    """Skip coordinator-driven state writes when the entity state is unchanged.
+
+    Mix in before CoordinatorEntity. ``_coordinator_state`` returns the values
+    written on an update, the entity state unless a subclass also compares
+    attributes; availability is always compared too.
+    Written and suppressed writes are counted per platform in AlexaMetrics.
+    """
+
+    _last_coordinator_state: Any = _UNWRITTEN
+
+    def _coordinator_state(self) -> Any:
+        """Return the comparable state written on a coordinator update."""
+        return getattr(self, "state", None)
+
+    @callback
+    def _reset_coordinator_state(self) -> None:
+        """Make the next coordinator update write, e.g. after an optimistic write."""
+        self._last_coordinator_state = _UNWRITTEN
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if it differs from the last coordinator write."""
+        state = (self.available, self._coordinator_state())
+        changed = state != self._last_coordinator_state
+        metrics = get_metrics(self.hass)
+        if metrics is not None:
+            entity_id = getattr(self, "entity_id", None)
+            platform = entity_id.split(".", 1)[0] if entity_id else type(self).__name__
+            metrics.record_state_write(platform, suppressed=not changed)
+        if not changed:
+            return
+        self._last_coordinator_state = state
+        super()._handle_coordinator_update()
@@ -0,0 +1,94 @@
+"""Per-poll device state lookups for Alexa Media Player.
+
+Indexes the bluetooth, device preference and DND responses by serial once per
+poll so merging them into device dicts is a dict lookup per device.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+BLUETOOTH_STATES = "bluetoothStates"
+DEVICE_PREFERENCES = "devicePreferences"
+DND_STATUS_LIST = "doNotDisturbDeviceStatusList"
+
+
+def index_by_serial(
+    response: Any, list_key: str, serial_key: str = "deviceSerialNumber"
+) -> dict[str, dict[str, Any]]:
+    """Return the entries of response[list_key] keyed by serial.
+
+    The first entry for a serial wins, matching the previous linear scans.
+    Missing or malformed responses yield an empty map.
+    """
+    index: dict[str, dict[str, Any]] = {}
+    if not isinstance(response, dict):
+        return index
+    for entry in response.get(list_key) or []:
+        if isinstance(entry, dict) and (serial := entry.get(serial_key)):
+            index.setdefault(serial, entry)
+    return index
+
+
+@dataclass
+class DeviceStateIndex:
+    """Serial-keyed bluetooth, preference and DND entries for one account."""
+
+    bluetooth: dict[str, dict[str, Any]] = field(default_factory=dict)
+    preferences: dict[str, dict[str, Any]] = field(default_factory=dict)
+    dnd: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_responses(
+        cls,
+        bluetooth: Any,
+        preferences: Any,
+        dnd: Any,
+        previous: DeviceStateIndex | None = None,
+    ) -> DeviceStateIndex:
+        """Build the index from raw AlexaAPI responses.
+
+        Responses that are None (not fetched on this poll or failed) reuse the
+        entries of the previous index, if given.
+        """
+
+        def part(response: Any, list_key: str, name: str) -> dict[str, dict[str, Any]]:
+            if response is None and previous is not None:
+                return getattr(previous, name)
+            return index_by_serial(response, list_key)
+
+        return cls(
+            bluetooth=part(bluetooth, BLUETOOTH_STATES, "bluetooth"),
+            preferences=part(preferences, DEVICE_PREFERENCES, "preferences"),
+            dnd=part(dnd, DND_STATUS_LIST, "dnd"),
+        )
+
+    def update_bluetooth(self, bluetooth: Any) -> None:
+        """Replace the bluetooth entries from a fresh get_bluetooth response."""
+        if bluetooth is not None:
+            self.bluetooth = index_by_serial(bluetooth, BLUETOOTH_STATES)
+
+    def update_dnd(self, dnd: Any) -> None:
+        """Replace the DND entries from a fresh get_dnd_state response."""
+        if dnd is not None:
+            self.dnd = index_by_serial(dnd, DND_STATUS_LIST)
+
+    def merge(self, device: dict[str, Any]) -> None:
+        """Merge the indexed state for device["serialNumber"] into device."""
+        serial = device["serialNumber"]
+        if (b_state := self.bluetooth.get(serial)) is not None:
+            device["bluetooth_state"] = b_state
+        if (pref := self.preferences.get(serial)) is not None:
+            device["locale"] = pref["locale"]
+            device["timeZoneId"] = pref["timeZoneId"]
+        if (dnd := self.dnd.get(serial)) is not None:
+            device["dnd"] = dnd["enabled"]
+
+    def get_stats(self) -> dict[str, int]:
+        """Get index statistics."""
+        return {
+            "bluetooth": len(self.bluetooth),
+            "preferences": len(self.preferences),
+            "dnd": len(self.dnd),
+        }
@@ -23,6 +23,16 @@ from .const import (
     DOMAIN,
     TO_REDACT,
 )
+from .coordinator import FetchScheduler, PollIntervalController
+from .last_called import (
+    CustomerHistoryWindow,
+    LastCalledActivityQueue,
+    LastCalledHistoryMatcher,
+)
+from .notifications import NotificationScheduler
+from .notify_delivery import NotifyDeliveryQueue
+from .rate_limiter import AlexaRateLimiter, rate_limiter_key
+from .transcode import AudioTranscoder
 
 
 # --------------------
@@ -229,6 +239,14 @@ def _summarize_coordinator(coordinator: DataUpdateCoordinator) -> dict:
         "last_update": _safe_dt(getattr(coordinator, "last_update", None)),
     }
 
+    fetch_scheduler = getattr(coordinator, "fetch_scheduler", None)
+    if isinstance(fetch_scheduler, FetchScheduler):
+        data["fetch_schedule"] = fetch_scheduler.get_stats()
+
+    poll_interval = getattr(coordinator, "poll_interval", None)
+    if isinstance(poll_interval, PollIntervalController):
+        data["poll_interval"] = poll_interval.get_stats()
+
     try:
         data["data_summary"] = _summarize_coordinator_data(
             getattr(coordinator, "data", None)
@@ -351,6 +369,56 @@ def _summarize_amp_domain(domain_data: Any, config_entry: ConfigEntry) -> dict:
     return out
 
 
+def _summarize_amp_account(domain_data: Any, config_entry: ConfigEntry) -> dict:
+    """Return counters of the account-level engines (queues, schedulers)."""
+    out: dict[str, Any] = {}
+    if not isinstance(domain_data, Mapping):
+        return out
+    accounts = domain_data.get("accounts")
+    account = (
+        accounts.get(config_entry.data.get("email"))
+        if isinstance(accounts, Mapping)
+        else None
+    )
+    out["present"] = isinstance(account, Mapping)
+    if not out["present"]:
+        return out
+
+    queue = account.get("last_called_activity_queue")
+    if isinstance(queue, LastCalledActivityQueue):
+        out["last_called_queue"] = queue.get_stats()
+    matcher = account.get("last_called_history_matcher")
+    if isinstance(matcher, LastCalledHistoryMatcher):
+        out["last_called_matcher"] = matcher.get_stats()
+    window = account.get("last_called_history_window")
+    if isinstance(window, CustomerHistoryWindow):
+        out["last_called_history_window"] = window.get_stats()
+    scheduler = account.get("notification_scheduler")
+    if isinstance(scheduler, NotificationScheduler):
+        out["notification_scheduler"] = scheduler.get_stats()
+    notify_delivery = account.get("notify_delivery")
+    if isinstance(notify_delivery, NotifyDeliveryQueue):
+        out["notify_delivery"] = notify_delivery.get_stats()
+
+    limiters = domain_data.get("rate_limiters")
+    limiter = (
+        limiters.get(
+            rate_limiter_key(
+                config_entry.data.get("email"), config_entry.data.get("url")
+            )
+        )
+        if isinstance(limiters, Mapping)
+        else None
+    )
+    if isinstance(limiter, AlexaRateLimiter):
+        out["rate_limiter"] = limiter.get_stats()
+    transcoder = domain_data.get("transcoder")
+    if isinstance(transcoder, AudioTranscoder):
+        out["tts_transcoder"] = transcoder.get_stats()
+
+    return out
+
+
 # --------------------
 # Diagnostics entry points
 # --------------------
@@ -401,6 +469,7 @@ async def async_get_config_entry_diagnostics(
             # AMP-specific summaries (useful when coordinator_count == 0)
             "amp_entry_runtime_summary": _summarize_amp_entry_runtime(entry_runtime),
             "amp_domain_summary": _summarize_amp_domain(domain_data, config_entry),
+            "amp_account_summary": _summarize_amp_account(domain_data, config_entry),
         },
     }
 
@@ -30,5 +30,9 @@ class TimeoutException(Exception):
         super().__init__(f"Timeout exception: {message}")
 
 
+class TranscodeException(Exception):
+    """Audio transcoding exception"""
+
+
 class UnexpectedApiException(Exception):
     """Unexpected API exception"""
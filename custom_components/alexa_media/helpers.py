@@ -17,13 +17,17 @@ from alexapy import AlexapyLoginCloseRequested, AlexapyLoginError, hide_email
 from alexapy.alexalogin import AlexaLogin
 from dictor import dictor
 from homeassistant.const import CONF_EMAIL, CONF_URL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConditionErrorMessage
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.instance_id import async_get as async_get_instance_id
 import wrapt
 
-from .const import DATA_ALEXAMEDIA, EXCEPTION_TEMPLATE
+from .const import DATA_ALEXAMEDIA, DOMAIN, EXCEPTION_TEMPLATE, SERIAL_EVENT_ROUTES
 
 _LOGGER = logging.getLogger(__name__)
 ArgType = TypeVar("ArgType")
@@ -311,9 +315,17 @@ def retry_async(
 
 @wrapt.decorator
 async def _catch_login_errors(func, instance, args, kwargs) -> Any:
-    """Detect AlexapyLoginError and attempt relogin."""
+    """Detect AlexapyLoginError and attempt relogin.
+
+    The error is swallowed unless the call passes raise_login_errors=True, in
+    which case it is re-raised once the relogin attempt is done.
+    """
 
     result = None
+    raise_login_errors = False
+    if "raise_login_errors" in kwargs:
+        kwargs = dict(kwargs)
+        raise_login_errors = kwargs.pop("raise_login_errors")
     if instance is None and args:
         instance = args[0]
     if hasattr(instance, "check_login_changes"):
@@ -329,6 +341,8 @@ async def _catch_login_errors(func, instance, args, kwargs) -> Any:
             func.__module__[func.__module__.find(".") + 1 :],
             func.__name__,
         )
+        if raise_login_errors:
+            raise
         return None
     except AlexapyLoginError as ex:
         login = None
@@ -361,6 +375,8 @@ async def _catch_login_errors(func, instance, args, kwargs) -> Any:
                     func.__name__,
                     hide_email(email),
                 )
+                if raise_login_errors:
+                    raise
                 return None
             _LOGGER.debug(
                 "%s.%s: detected bad login for %s: %s",
@@ -374,6 +390,8 @@ async def _catch_login_errors(func, instance, args, kwargs) -> Any:
         except NameError:
             hass = None
         report_relogin_required(hass, login, email)
+        if raise_login_errors:
+            raise
         return None
     return result
 
@@ -400,39 +418,70 @@ def report_relogin_required(hass, login, email) -> bool:
     return False
 
 
-def _existing_serials(hass, login_obj) -> list:
-    """Retrieve existing serial numbers for a given login object."""
-    email: str = login_obj.email
-    if (
-        DATA_ALEXAMEDIA in hass.data
-        and "accounts" in hass.data[DATA_ALEXAMEDIA]
-        and email in hass.data[DATA_ALEXAMEDIA]["accounts"]
-    ):
-        existing_serials = list(
-            hass.data[DATA_ALEXAMEDIA]["accounts"][email]["entities"][
-                "media_player"
-            ].keys()
-        )
-        device_data = (
-            hass.data[DATA_ALEXAMEDIA]["accounts"][email]
-            .get("devices", {})
-            .get("media_player", {})
-        )
-        for serial in existing_serials[:]:
-            device = device_data.get(serial, {})
-            if "appDeviceList" in device and device["appDeviceList"]:
-                apps = [
-                    x["serialNumber"]
-                    for x in device["appDeviceList"]
-                    if "serialNumber" in x
-                ]
-                existing_serials.extend(apps)
-    else:
-        _LOGGER.warning(
-            "No accounts data found for %s. Skipping serials retrieval.", email
+def account_signal(email: str) -> str:
+    """Return the account-wide dispatcher signal for global events."""
+    return f"{DOMAIN}_{hide_email(email)}"[0:32]
+
+
+def serial_signal(email: str, entity_type: str, serial: str) -> str:
+    """Return the dispatcher signal for one entity type of one device serial."""
+    return f"{account_signal(email)}_{entity_type}_{serial}"
+
+
+@callback
+def dispatch_account_event(hass: HomeAssistant, email: str, event: dict) -> None:
+    """Send a global event to every entity listening on the account signal."""
+    async_dispatcher_send(hass, account_signal(email), event)
+
+
+@callback
+def dispatch_serial_event(
+    hass: HomeAssistant, email: str, serial: str, event: dict
+) -> None:
+    """Send a per-device event only to the entities subscribed to ``serial``.
+
+    The entity types that receive the event are looked up in
+    ``SERIAL_EVENT_ROUTES``; unknown event keys fall back to the account signal.
+    """
+    routed = False
+    for event_key in event:
+        for entity_type in SERIAL_EVENT_ROUTES.get(event_key, ()):
+            async_dispatcher_send(
+                hass, serial_signal(email, entity_type, serial), event
+            )
+            routed = True
+    if not routed:
+        dispatch_account_event(hass, email, event)
+
+
+@callback
+def connect_device_signals(
+    hass: HomeAssistant,
+    email: str,
+    entity_type: str,
+    serial: str | None,
+    target: Callable[[dict], Any],
+    account_wide: bool = True,
+) -> Callable[[], None]:
+    """Subscribe ``target`` to a device's serial signal and the account signal.
+
+    Returns a single callable that removes every subscription made here.
+    """
+    unsubs = []
+    if serial:
+        unsubs.append(
+            async_dispatcher_connect(
+                hass, serial_signal(email, entity_type, serial), target
+            )
         )
-        existing_serials = []
-    return existing_serials
+    if account_wide:
+        unsubs.append(async_dispatcher_connect(hass, account_signal(email), target))
+
+    def _unsubscribe() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    return _unsubscribe
 
 
 async def calculate_uuid(hass, email: str, url: str) -> dict:
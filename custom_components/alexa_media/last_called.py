@@ -0,0 +1,435 @@
+"""Last-called activity tracking for Alexa Media Player.
+
+Push events that suggest a voice interaction are queued per account keyed by
+(device serial, customer id) until the probe worker finds the matching
+customer history record.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from operator import attrgetter
+import time
+from typing import Any, Container, Iterable, Mapping
+
+from .const import (
+    LAST_CALLED_HISTORY_WINDOW_MS,
+    LAST_CALLED_LOOKBACK_MS,
+    LAST_CALLED_QUEUE_MAX_AGE_S,
+    LAST_CALLED_QUEUE_MAX_SIZE,
+    LAST_CALLED_STALE_FUDGE_MS,
+)
+
+ActivityKey = tuple[str, str | None]
+
+IGNORED_UTTERANCE_TYPES = frozenset(
+    {
+        "DEVICE_ARBITRATION",
+        "ASR_TIMEOUT",
+        "WAKE_WORD_ONLY",
+    }
+)
+
+
+def valid_voice_summary(summary: object) -> bool:
+    """Return True if summary looks like a real spoken utterance."""
+    if not isinstance(summary, str):
+        return False
+    summary = summary.strip()
+    return bool(summary) and any(ch.isalnum() for ch in summary)
+
+
+def valid_utterance_type(record: dict) -> bool:
+    """Filter utterance types similar to Node-RED/alexa-remote logic."""
+    return record.get("utteranceType") not in IGNORED_UTTERANCE_TYPES
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedActivity:
+    """A push activity waiting for its customer history record."""
+
+    serial: str
+    customer_id: str | None
+    activity_ts: int
+    command: str
+    queued_at: float
+
+    @property
+    def key(self) -> ActivityKey:
+        """Return the (serial, customer_id) queue key."""
+        return self.serial, self.customer_id
+
+
+class LastCalledActivityQueue:
+    """Bounded, insertion-ordered activity queue with O(1) upsert and remove.
+
+    Entries are immutable, so a snapshot is a plain list of the current
+    entries and stays consistent while pushes update the queue. Entries older
+    than max_age are expired; when full, the oldest entry is dropped.
+    """
+
+    def __init__(
+        self,
+        max_size: int = LAST_CALLED_QUEUE_MAX_SIZE,
+        max_age: float = LAST_CALLED_QUEUE_MAX_AGE_S,
+    ) -> None:
+        """Initialize queue.
+
+        Args:
+            max_size: Maximum number of queued activities
+            max_age: Seconds after which an unresolved activity is expired
+        """
+        self._entries: OrderedDict[ActivityKey, QueuedActivity] = OrderedDict()
+        self._max_size = max_size
+        self._max_age = max_age
+        self._queued = 0
+        self._merged = 0
+        self._resolved = 0
+        self._unresolved = 0
+        self._expired = 0
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        """Return the number of queued activities."""
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        """Return whether any activity is queued."""
+        return bool(self._entries)
+
+    def upsert(
+        self,
+        serial: str,
+        customer_id: str | None,
+        activity_ts: int | None,
+        command: str,
+    ) -> None:
+        """Queue an activity or refresh the queued one for the same key.
+
+        A refreshed entry keeps the earliest activity timestamp, like
+        alexa-remote does for a queued burst, and takes the latest command.
+        """
+        if not serial:
+            return
+        try:
+            ts = int(activity_ts) if activity_ts is not None else 0
+        except (TypeError, ValueError):
+            ts = 0
+
+        now = time.monotonic()
+        self.expire(now)
+        key = (serial, customer_id)
+        if (item := self._entries.get(key)) is not None:
+            if ts and (item.activity_ts == 0 or ts < item.activity_ts):
+                item = replace(item, activity_ts=ts)
+            self._entries[key] = replace(item, command=command)
+            self._merged += 1
+            return
+
+        if len(self._entries) >= self._max_size:
+            self._entries.popitem(last=False)
+            self._dropped += 1
+        self._entries[key] = QueuedActivity(serial, customer_id, ts, command, now)
+        self._queued += 1
+
+    def snapshot(self) -> list[QueuedActivity]:
+        """Expire stale entries and return the current entries, oldest first."""
+        self.expire()
+        return list(self._entries.values())
+
+    def remove(self, keys: Iterable[ActivityKey], resolved: bool = True) -> int:
+        """Remove entries by key and count them as resolved or unresolved.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                removed += 1
+        if resolved:
+            self._resolved += removed
+        else:
+            self._unresolved += removed
+        return removed
+
+    def expire(self, now: float | None = None) -> int:
+        """Drop entries queued longer than max_age ago.
+
+        Returns:
+            Number of entries expired
+        """
+        cutoff = (time.monotonic() if now is None else now) - self._max_age
+        expired = 0
+        # Entries are kept in queue order, so expired ones are at the front.
+        while self._entries:
+            key, item = next(iter(self._entries.items()))
+            if item.queued_at > cutoff:
+                break
+            del self._entries[key]
+            expired += 1
+        self._expired += expired
+        return expired
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue size and lifetime counters."""
+        now = time.monotonic()
+        oldest = next(iter(self._entries.values()), None)
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "oldest_age": round(now - oldest.queued_at, 1) if oldest else None,
+            "queued": self._queued,
+            "merged": self._merged,
+            "resolved": self._resolved,
+            "unresolved": self._unresolved,
+            "expired": self._expired,
+            "dropped": self._dropped,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedRecord:
+    """The fields of a customer history record used for matching."""
+
+    ts: int
+    serial: str
+    summary: str
+    response: str | None
+
+
+def _record_cache_key(record: dict) -> tuple[Any, ...]:
+    """Return the raw fields a parsed record is derived from."""
+    return (
+        record.get("creationTimestamp"),
+        record.get("deviceSerialNumber"),
+        record.get("utteranceType"),
+        (record.get("description") or {}).get("summary"),
+        record.get("alexaResponse"),
+    )
+
+
+def parse_history_record(record: dict) -> ParsedRecord | None:
+    """Parse a raw customer history record.
+
+    Returns:
+        None if the record cannot resolve a last_called activity
+    """
+    serial = record.get("deviceSerialNumber")
+    if not serial or not valid_utterance_type(record):
+        return None
+    summary = ((record.get("description") or {}).get("summary") or "").strip()
+    if not valid_voice_summary(summary):
+        return None
+    try:
+        ts = int(record.get("creationTimestamp") or 0)
+    except (TypeError, ValueError):
+        return None
+    response = (record.get("alexaResponse") or "").strip() or None
+    return ParsedRecord(ts, serial, summary, response)
+
+
+class LastCalledHistoryMatcher:
+    """Match customer history records against queued last_called activity.
+
+    Queued activity is indexed by serial and records are walked newest first,
+    stopping at the first match or once no older record can match. Parsed
+    records are cached between probe retries, which mostly return the same
+    records; the cache only keeps records of the latest response.
+    """
+
+    def __init__(self) -> None:
+        """Initialize matcher."""
+        self._parsed: dict[tuple[Any, ...], ParsedRecord | None] = {}
+        self._newest_first: list[ParsedRecord] = []
+        self._parse_hits = 0
+        self._parse_misses = 0
+
+    def _parse(self, records: Iterable[Any]) -> list[ParsedRecord]:
+        """Return the usable records, newest first, reusing cached parses."""
+        previous = self._parsed
+        parsed: dict[tuple[Any, ...], ParsedRecord | None] = {}
+        misses = 0
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            key = _record_cache_key(record)
+            if key in parsed:
+                continue
+            if key in previous:
+                parsed[key] = previous[key]
+            else:
+                parsed[key] = parse_history_record(record)
+                misses += 1
+        self._parse_hits += len(parsed) - misses
+        self._parse_misses += misses
+        self._parsed = parsed
+        # An unchanged window keeps the previous ordering.
+        if misses or len(parsed) != len(previous):
+            self._newest_first = sorted(
+                (item for item in parsed.values() if item is not None),
+                key=attrgetter("ts"),
+                reverse=True,
+            )
+        return self._newest_first
+
+    def match(
+        self,
+        records: list[dict] | None,
+        queue_snapshot: list[QueuedActivity],
+        existing_serials: Container[str],
+        watermark: int = 0,
+        last_pushed_activity: Mapping[str, Any] | None = None,
+    ) -> tuple[dict | None, set[ActivityKey]]:
+        """Select the newest record that resolves a queued activity.
+
+        Args:
+            records: Raw customer history records
+            queue_snapshot: Queued activity, oldest first
+            existing_serials: Serials of known devices
+            watermark: Records at or before this ms timestamp were applied
+            last_pushed_activity: serial -> ms timestamp of the last applied
+                activity for that device
+
+        Returns:
+            The last_called payload and the resolved queue key, or (None, set())
+        """
+        if not records or not queue_snapshot:
+            return None, set()
+
+        # Records are walked newest first, so stop at the first one that is
+        # already applied or older than every queued activity (less the fudge).
+        # An activity without a timestamp accepts any record.
+        queued_by_serial: dict[str, list[QueuedActivity]] = {}
+        oldest_ts = 0
+        untimed = False
+        for item in queue_snapshot:
+            if not item.serial:
+                continue
+            queued_by_serial.setdefault(item.serial, []).append(item)
+            if not item.activity_ts:
+                untimed = True
+            elif not oldest_ts or item.activity_ts < oldest_ts:
+                oldest_ts = item.activity_ts
+        if not queued_by_serial:
+            return None, set()
+        floor = None if untimed else oldest_ts - LAST_CALLED_STALE_FUDGE_MS
+        last_pushed_activity = last_pushed_activity or {}
+
+        for record in self._parse(records):
+            if record.ts <= watermark or (floor is not None and record.ts < floor):
+                break
+            queued = queued_by_serial.get(record.serial)
+            if not queued or record.serial not in existing_serials:
+                continue
+            if record.ts <= int(last_pushed_activity.get(record.serial) or 0):
+                continue
+            for item in queued:
+                # Future enhancement: customer/user matching. The push payload
+                # includes destinationUserId, but the raw history records do not
+                # expose a matching user identifier yet.
+                if item.activity_ts and record.ts < (
+                    item.activity_ts - LAST_CALLED_STALE_FUDGE_MS
+                ):
+                    continue
+                payload = {
+                    "serialNumber": record.serial,
+                    "timestamp": record.ts,
+                    "summary": record.summary,
+                    "response": record.response,
+                }
+                return payload, {item.key}
+        return None, set()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get parse cache counters."""
+        return {
+            "cached_records": len(self._parsed),
+            "parse_hits": self._parse_hits,
+            "parse_misses": self._parse_misses,
+        }
+
+
+class CustomerHistoryWindow:
+    """Customer history request window of the last_called probe worker.
+
+    Tracks the newest record timestamp seen (the high-water mark) so a probe
+    only asks for records newer than that, less a small overlap for records
+    Amazon files late. The first probe, and any probe after an error or an
+    unresolved activity, uses the wide window around the queued activity.
+    """
+
+    def __init__(
+        self,
+        span_ms: int = max(LAST_CALLED_LOOKBACK_MS, LAST_CALLED_HISTORY_WINDOW_MS),
+        overlap_ms: int = LAST_CALLED_LOOKBACK_MS,
+    ) -> None:
+        """Initialize window.
+
+        Args:
+            span_ms: Wide window before the earliest queued activity (or now)
+            overlap_ms: How far below the high-water mark incremental fetches go
+        """
+        self.high_water_ms = 0
+        self._span_ms = span_ms
+        self._overlap_ms = overlap_ms
+        self._widen = True
+        self._incremental = 0
+        self._wide = 0
+        self._widened = 0
+        self._records = 0
+
+    def bounds(
+        self, earliest_ts: int, now_ms: int, watermark: int = 0
+    ) -> tuple[int, int]:
+        """Return (start_time, end_time) in ms for the next history request.
+
+        Args:
+            earliest_ts: Earliest queued activity timestamp, 0 if unknown
+            now_ms: Current time in ms
+            watermark: Timestamp of the last applied last_called record
+        """
+        end_time = now_ms + self._span_ms
+        wide_start = (
+            max(0, earliest_ts - self._span_ms)
+            if earliest_ts
+            else now_ms - self._span_ms
+        )
+        high_water = max(self.high_water_ms, watermark)
+        if self._widen or not high_water:
+            self._wide += 1
+            return wide_start, end_time
+        self._incremental += 1
+        return max(wide_start, high_water - self._overlap_ms), end_time
+
+    def record_response(self, records: list[Any]) -> None:
+        """Advance the high-water mark past the records of a good response."""
+        self._widen = False
+        self._records += len(records)
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            try:
+                ts = int(record.get("creationTimestamp") or 0)
+            except (TypeError, ValueError):
+                continue
+            if ts > self.high_water_ms:
+                self.high_water_ms = ts
+
+    def widen(self) -> None:
+        """Use the wide window for the next request (after errors)."""
+        if not self._widen:
+            self._widened += 1
+        self._widen = True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get request counters and the current high-water mark."""
+        return {
+            "high_water_ms": self.high_water_ms,
+            "next_wide": self._widen,
+            "incremental_requests": self._incremental,
+            "wide_requests": self._wide,
+            "widened": self._widened,
+            "records": self._records,
+        }
@@ -8,6 +8,7 @@ https://community.home-assistant.io/t/echo-devices-alexa-as-media-player-testers
 """
 
 import datetime
+from functools import lru_cache
 import logging
 from math import sqrt
 from typing import Optional
@@ -43,7 +44,9 @@ from .alexa_entity import (
     parse_power_from_coordinator,
 )
 from .const import CONF_EXTENDED_ENTITY_DISCOVERY
+from .coordinator import ChangeOnlyStateMixin
 from .helpers import add_devices, safe_get
+from .rate_limiter import RequestPriority, limited_call
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -124,7 +127,7 @@ def color_modes(details) -> list:
     return [ColorMode.ONOFF]
 
 
-class AlexaLight(CoordinatorEntity, LightEntity):
+class AlexaLight(ChangeOnlyStateMixin, CoordinatorEntity, LightEntity):
     """A light controlled by an Echo."""
 
     def __init__(self, coordinator, login, details):
@@ -224,6 +227,17 @@ class AlexaLight(CoordinatorEntity, LightEntity):
         )
         return not last_refresh_success
 
+    def _coordinator_state(self):
+        """Return the power, brightness and color state to compare."""
+        return (
+            self.is_on,
+            self.brightness,
+            self.color_mode,
+            self.color_temp_kelvin,
+            self.hs_color,
+            self.assumed_state,
+        )
+
     async def _set_state(self, power_on, brightness=None, kelvin=None, hs_color=None):
         # This is "rounding" on kelvin to the closest value Alexa is willing to acknowledge the existence of.
         # The alternative implementation would be to use effects instead.
@@ -242,7 +256,11 @@ class AlexaLight(CoordinatorEntity, LightEntity):
             adjusted_hs = None
             color_name = None
 
-        response = await AlexaAPI.set_light_state(
+        response = await limited_call(
+            self.hass,
+            self._login,
+            RequestPriority.USER,
+            AlexaAPI.set_light_state,
             self._login,
             self.alexa_entity_id,
             power_on,
@@ -274,6 +292,7 @@ class AlexaLight(CoordinatorEntity, LightEntity):
         self._requested_state_at = datetime.datetime.now(
             datetime.timezone.utc
         )  # must be set last so that previous getters work properly
+        self._reset_coordinator_state()
         self.schedule_update_ha_state()
 
         # Confirm quickly, but debounce to avoid spamming during slider drags.
@@ -498,10 +517,93 @@ def alexa_color_name_to_rgb(color_name: str) -> tuple[int, int, int]:
     return color_name_to_rgb(color_name.replace("_", ""))
 
 
+# Side of the RGB cells of the nearest-color index
+_COLOR_CELL_SIZE = 16
+# (name, rgb, hs) of each Alexa color, in ALEXA_COLORS order
+_ALEXA_COLOR_TABLE = tuple(
+    (name, rgb, color_RGB_to_hs(*rgb)) for name, rgb in ALEXA_COLORS.items()
+)
+# RGB cell -> colors that can be the nearest for some RGB value in the cell
+_color_cell_candidates: dict[tuple[int, int, int], tuple] = {}
+
+
+def _axis_deltas(value: int, low: int, high: int) -> tuple[int, int]:
+    """Return the min and max squared distance from value to [low, high]."""
+    nearest = min(max(value, low), high)
+    farthest = max(value - low, high - value)
+    return (value - nearest) ** 2, farthest**2
+
+
+# axis -> cell index -> (min, max) squared distances of each Alexa color
+_AXIS_DELTAS = tuple(
+    tuple(
+        tuple(
+            zip(
+                *(
+                    _axis_deltas(entry[1][axis], low, low + _COLOR_CELL_SIZE - 1)
+                    for entry in _ALEXA_COLOR_TABLE
+                )
+            )
+        )
+        for low in range(0, 256, _COLOR_CELL_SIZE)
+    )
+    for axis in range(3)
+)
+
+
+def _cell_candidates(cell: tuple[int, int, int]) -> tuple:
+    """Return the Alexa colors that may be nearest to a point in cell.
+
+    The red mean weights of the red and blue terms lie between 2 and 3, which
+    bounds the distance from a color to any point of the cell. Colors whose
+    lower bound exceeds the smallest upper bound can never win and are
+    dropped, so searching the rest gives the same result as the full scan.
+    """
+    if (candidates := _color_cell_candidates.get(cell)) is not None:
+        return candidates
+    red_near, red_far = _AXIS_DELTAS[0][cell[0]]
+    green_near, green_far = _AXIS_DELTAS[1][cell[1]]
+    blue_near, blue_far = _AXIS_DELTAS[2][cell[2]]
+    limit = (
+        min(
+            3 * red + 4 * green + 3 * blue
+            for red, green, blue in zip(red_far, green_far, blue_far)
+        )
+        + 1e-6
+    )
+    candidates = _color_cell_candidates[cell] = tuple(
+        entry
+        for entry, red, green, blue in zip(
+            _ALEXA_COLOR_TABLE, red_near, green_near, blue_near
+        )
+        if 2 * red + 4 * green + 2 * blue <= limit
+    )
+    return candidates
+
+
+@lru_cache(maxsize=4096)
+def _nearest_alexa_color(
+    rgb: tuple[int, int, int],
+) -> tuple[tuple[float, float], str]:
+    """Return (hs, name) of the Alexa color nearest to an RGB value."""
+    cell = (
+        rgb[0] // _COLOR_CELL_SIZE,
+        rgb[1] // _COLOR_CELL_SIZE,
+        rgb[2] // _COLOR_CELL_SIZE,
+    )
+    name, _, alexa_hs = min(
+        _cell_candidates(cell), key=lambda entry: red_mean(entry[1], rgb)
+    )
+    return alexa_hs, name
+
+
 def rgb_to_alexa_color(
     rgb: tuple[int, int, int],
 ) -> tuple[Optional[tuple[float, float]], Optional[str]]:
     """Convert a given RGB value into the closest Alexa color."""
+    red, green, blue = rgb
+    if all(isinstance(value, int) and 0 <= value <= 255 for value in rgb):
+        return _nearest_alexa_color((red, green, blue))
     name, alexa_rgb = min(
         ALEXA_COLORS.items(),
         key=lambda alexa_color: red_mean(alexa_color[1], rgb),
@@ -510,6 +612,22 @@ def rgb_to_alexa_color(
     return color_RGB_to_hs(red, green, blue), name
 
 
+@lru_cache(maxsize=1024)
+def _hs_to_alexa_color(
+    hue: float, saturation: float
+) -> tuple[Optional[tuple[float, float]], Optional[str]]:
+    """Convert hue/saturation into the closest Alexa color, memoised."""
+    return rgb_to_alexa_color(color_hs_to_RGB(hue, saturation))
+
+
+@lru_cache(maxsize=1024)
+def _hsb_to_alexa_color(
+    hue: float, saturation: float, brightness: float
+) -> tuple[Optional[tuple[float, float]], Optional[str]]:
+    """Convert hue/saturation/brightness into the closest Alexa color, memoised."""
+    return rgb_to_alexa_color(color_hsb_to_RGB(hue, saturation, brightness))
+
+
 def hs_to_alexa_color(
     hs_color: Optional[tuple[float, float]],
 ) -> tuple[Optional[tuple[float, float]], Optional[str]]:
@@ -517,7 +635,7 @@ def hs_to_alexa_color(
     if hs_color is None:
         return None, None
     hue, saturation = hs_color
-    return rgb_to_alexa_color(color_hs_to_RGB(hue, saturation))
+    return _hs_to_alexa_color(hue, saturation)
 
 
 def hsb_to_alexa_color(
@@ -527,4 +645,4 @@ def hsb_to_alexa_color(
     if hsb is None:
         return None, None
     hue, saturation, brightness = hsb
-    return rgb_to_alexa_color(color_hsb_to_RGB(hue, saturation, brightness))
+    return _hsb_to_alexa_color(hue, saturation, brightness)
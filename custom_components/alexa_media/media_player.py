@@ -11,9 +11,7 @@ import asyncio
 import logging
 import os
 import re
-import subprocess
 from typing import Any, Optional
-import urllib.request
 
 from homeassistant import util
 from homeassistant.components import media_source
@@ -32,10 +30,6 @@ from homeassistant.const import CONF_EMAIL, CONF_NAME, CONF_PASSWORD, STATE_UNAV
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.discovery import async_load_platform
-from homeassistant.helpers.dispatcher import (
-    async_dispatcher_connect,
-    async_dispatcher_send,
-)
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util import slugify
 
@@ -60,8 +54,19 @@ from .const import (
     STREAMING_ERROR_MESSAGE,
     UPLOAD_PATH,
 )
-from .exceptions import TimeoutException
-from .helpers import _catch_login_errors, add_devices, is_http2_enabled, safe_get
+from .exceptions import TimeoutException, TranscodeException
+from .helpers import (
+    _catch_login_errors,
+    add_devices,
+    connect_device_signals,
+    dispatch_serial_event,
+    is_http2_enabled,
+    safe_get,
+)
+from .notify import invalidate_notify_targets
+from .sequence_batch import parallel_sequence
+from .serial_index import get_serial_index
+from .transcode import get_transcoder
 
 SUPPORT_ALEXA = (
     MediaPlayerEntityFeature.PAUSE
@@ -127,6 +132,7 @@ async def async_setup_platform(hass, config, add_devices_callback, discovery_inf
     if account is None:
         raise ConfigEntryNotReady
     account_dict = hass.data[DATA_ALEXAMEDIA]["accounts"][account]
+    serial_index = get_serial_index(account_dict)
     entry_setup = len(account_dict["entities"]["media_player"])
     media_players = account_dict["devices"]["media_player"]
     alexa_client = None
@@ -153,6 +159,7 @@ async def async_setup_platform(hass, config, add_devices_callback, discovery_inf
                     "media_player"
                 ][key]
             ) = alexa_client
+            serial_index.add_player(key, device)
         else:
             _LOGGER.debug(
                 "%s: Skipping already added device: %s:%s",
@@ -223,9 +230,11 @@ async def async_unload_entry(hass, entry) -> bool:
     account = entry.data[CONF_EMAIL]
     _LOGGER.debug("%s: Attempting to unload media players", hide_email(account))
     account_dict = hass.data[DATA_ALEXAMEDIA]["accounts"][account]
-    for device in account_dict["entities"]["media_player"].values():
+    serial_index = get_serial_index(account_dict)
+    for serial, device in account_dict["entities"]["media_player"].items():
         _LOGGER.debug("%s: Removing %s", hide_email(account), device)
         await device.async_remove()
+        serial_index.remove_player(serial)
     return True
 
 
@@ -309,9 +318,11 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         """Perform tasks after loading."""
         # Register event handler on bus
         await self.refresh(self._device)
-        self._listener = async_dispatcher_connect(
+        self._listener = connect_device_signals(
             self.hass,
-            f"{ALEXA_DOMAIN}_{hide_email(self._login.email)}"[0:32],
+            self._login.email,
+            "media_player",
+            self.device_serial_number,
             self._handle_event,
         )
         # Register to coordinator:
@@ -321,11 +332,13 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         )
         if coordinator:
             coordinator.async_add_listener(self.update)
+        invalidate_notify_targets(self.hass)
 
     async def async_will_remove_from_hass(self):
         """Prepare to remove entity."""
         # Register event handler on bus
         self._listener()
+        invalidate_notify_targets(self.hass)
         email = self._login.email
         coordinator = self.hass.data[DATA_ALEXAMEDIA]["accounts"][email].get(
             "coordinator"
@@ -735,9 +748,10 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                         "Updating player info by parent (http2): %s",
                         hide_serial(json_payload),
                     )
-                    async_dispatcher_send(
+                    dispatch_serial_event(
                         self.hass,
-                        f"{ALEXA_DOMAIN}_{hide_email(self._login.email)}"[0:32],
+                        self._login.email,
+                        device_id,
                         {"parent_state": json_payload},
                     )
 
@@ -834,6 +848,8 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
 
         """
         if device is not None:
+            if self._device_name != device["accountName"]:
+                invalidate_notify_targets(self.hass)
             self._device_name = device["accountName"]
             self._device_family = device["deviceFamily"]
             self._device_type = device["deviceType"]
@@ -958,9 +974,10 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                                 "Updating player info by parent (API Call): %s",
                                 hide_serial(json_payload),
                             )
-                            async_dispatcher_send(
+                            dispatch_serial_event(
                                 self.hass,
-                                f"{ALEXA_DOMAIN}_{hide_email(self._login.email)}"[0:32],
+                                self._login.email,
+                                device_id,
                                 {"parent_state": json_payload},
                             )
 
@@ -1700,12 +1717,14 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             await self.async_update()
 
     @_catch_login_errors
-    async def async_send_tts(self, message, **kwargs):
+    async def async_send_tts(self, message, wait=False, **kwargs):
         """Send TTS to Device.
 
         NOTE: Does not work on WHA Groups.
+
+        The request runs in the background unless wait is set.
         """
-        if self.hass:
+        if self.hass and not wait:
             self.hass.async_create_task(
                 self.alexa_api.send_tts(
                     message, customer_id=self._customer_id, **kwargs
@@ -1717,9 +1736,9 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             )
 
     @_catch_login_errors
-    async def async_send_announcement(self, message, **kwargs):
+    async def async_send_announcement(self, message, wait=False, **kwargs):
         """Send announcement to the media player."""
-        if self.hass:
+        if self.hass and not wait:
             self.hass.async_create_task(
                 self.alexa_api.send_announcement(
                     message, customer_id=self._customer_id, **kwargs
@@ -1731,9 +1750,9 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             )
 
     @_catch_login_errors
-    async def async_send_mobilepush(self, message, **kwargs):
+    async def async_send_mobilepush(self, message, wait=False, **kwargs):
         """Send push to the media player's associated mobile devices."""
-        if self.hass:
+        if self.hass and not wait:
             self.hass.async_create_task(
                 self.alexa_api.send_mobilepush(
                     message, customer_id=self._customer_id, **kwargs
@@ -1745,9 +1764,9 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             )
 
     @_catch_login_errors
-    async def async_send_dropin_notification(self, message, **kwargs):
+    async def async_send_dropin_notification(self, message, wait=False, **kwargs):
         """Send notification dropin to the media player's associated mobile devices."""
-        if self.hass:
+        if self.hass and not wait:
             self.hass.async_create_task(
                 self.alexa_api.send_dropin_notification(
                     message, customer_id=self._customer_id, **kwargs
@@ -1758,62 +1777,53 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                 message, customer_id=self._customer_id, **kwargs
             )
 
+    @_catch_login_errors
+    async def async_run_sequence_nodes(self, nodes, wait=False):
+        """Run operation nodes of one or more devices as a single sequence.
+
+        The nodes run in parallel and are sent without waiting for the
+        alexapy sequence queue.
+        """
+        sequence = parallel_sequence(nodes)
+        if self.hass and not wait:
+            self.hass.async_create_task(
+                self.alexa_api.run_behavior(sequence, queue_delay=0)
+            )
+        else:
+            await self.alexa_api.run_behavior(sequence, queue_delay=0)
+
     @_catch_login_errors
     async def async_play_tts_cloud_say(self, public_url, media_id, **kwargs):
-        file_name = media_id
+        source = media_id
         if media_source.is_media_source_id(media_id):
             media = await media_source.async_resolve_media(
                 self.hass, media_id, self.entity_id
             )
-            file_name = media.url[media.url.rindex("/") : media.url.rindex(".")]
             media_id = async_process_play_media_url(self.hass, media.url)
 
         if kwargs.get(ATTR_MEDIA_ANNOUNCE):
-            input_file_path = self.hass.config.path(
-                f"{UPLOAD_PATH}{file_name}_input.mp3"
-            )
-            output_file_name = f"{file_name}_output.mp3"
-            output_file_path = self.hass.config.path(f"{UPLOAD_PATH}{output_file_name}")
-
-            # file might already exist -> the same tts is cached from previous calls
-            if not os.path.exists(output_file_path):
-                await self.hass.async_add_executor_job(
-                    urllib.request.urlretrieve, media_id, input_file_path
+            try:
+                output_file_name = await get_transcoder(self.hass).async_get(
+                    source, media_id
                 )
-                command = [
-                    "ffmpeg",
-                    "-i",
-                    input_file_path,
-                    "-ac",
-                    "2",
-                    "-codec:a",
-                    "libmp3lame",
-                    "-b:a",
-                    "48k",
-                    "-ar",
-                    "24000",
-                    "-write_xing",
-                    "0",
-                    output_file_path,
-                ]
-                if subprocess.run(command, check=True).returncode != 0:
-                    _LOGGER.error(
-                        "%s: %s:ffmpeg command FAILED converting %s to %s",
-                        hide_email(self._login.email),
-                        self,
-                        input_file_path,
-                        output_file_path,
-                    )
+            except TranscodeException as ex:
+                _LOGGER.error(
+                    "%s: %s:Unable to prepare announcement audio: %s",
+                    hide_email(self._login.email),
+                    self,
+                    ex,
+                )
+                return
 
             _LOGGER.debug(
-                "%s: %s:Playing %slocal/alexa_tts%s",
+                "%s: %s:Playing %slocal/alexa_tts/%s",
                 hide_email(self._login.email),
                 self,
                 public_url,
                 output_file_name,
             )
             await self.async_send_tts(
-                f"<audio src='{public_url}local/alexa_tts{output_file_name}' />"
+                f"<audio src='{public_url}local/alexa_tts/{output_file_name}' />"
             )
         else:
             await self.async_send_tts(STREAMING_ERROR_MESSAGE)
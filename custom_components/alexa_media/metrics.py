@@ -5,14 +5,17 @@ Provides boot time tracking and intelligent data caching.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
+import json
 import logging
+import sys
 import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import API_CACHE_TTLS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,24 +46,74 @@ class BootMetrics:
         }
 
 
+def _estimate_size(value: Any) -> int:
+    """Return an approximate size in bytes of a JSON-like value."""
+    try:
+        return len(json.dumps(value, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+def _key_prefix(key: str) -> str:
+    """Return the stats prefix of a cache key (text before the first ':')."""
+    prefix, sep, _ = key.partition(":")
+    return prefix if sep else "default"
+
+
 class DataCache:
-    """Simple TTL cache for API responses.
+    """LRU cache with per-key TTLs for API responses.
 
-    Reduces redundant API calls during startup and normal operation.
+    Entries are kept in access order so eviction of the least recently used
+    entry is O(1). Expired entries are dropped when read and by a lazy sweep
+    that runs at most once per default TTL. Keys of the form
+    ``<prefix>:<rest>`` are tracked per prefix in the statistics, and prefixes
+    can be given their own default lifetime.
     """
 
-    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 128) -> None:
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 128,
+        max_bytes: int | None = None,
+        prefix_ttls: dict[str, float] | None = None,
+    ) -> None:
         """Initialize cache with TTL.
 
         Args:
-            ttl_seconds: Time-to-live for cached entries
-            max_entries: Maximum number of entries before evicting oldest
+            ttl_seconds: Default time-to-live for cached entries
+            max_entries: Maximum number of entries before evicting the least
+                recently used
+            max_bytes: Optional approximate size budget; enables size accounting
+            prefix_ttls: Default time-to-live per key prefix
         """
-        self._cache: dict[str, tuple[Any, float]] = {}
+        # key -> (value, expires_at, size)
+        self._cache: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
         self._ttl = ttl_seconds
+        self._prefix_ttls = dict(prefix_ttls or {})
         self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._next_sweep = time.monotonic() + ttl_seconds
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._prefix_stats: dict[str, list[int]] = {}  # prefix -> [hits, misses]
+
+    def _record(self, key: str, hit: bool) -> None:
+        """Count a hit or miss overall and for the key prefix."""
+        stats = self._prefix_stats.setdefault(_key_prefix(key), [0, 0])
+        if hit:
+            self._hits += 1
+            stats[0] += 1
+        else:
+            self._misses += 1
+            stats[1] += 1
+
+    def _drop(self, key: str) -> None:
+        """Remove key and release its size."""
+        _, _, size = self._cache.pop(key)
+        self._bytes -= size
 
     def get(self, key: str) -> Any | None:
         """Get value from cache if not expired.
@@ -71,21 +124,23 @@ class DataCache:
         Returns:
             Cached value or None if expired/missing
         """
-        if key not in self._cache:
-            self._misses += 1
+        entry = self._cache.get(key)
+        if entry is None:
+            self._record(key, hit=False)
             return None
 
-        value, timestamp = self._cache[key]
-        if time.monotonic() - timestamp > self._ttl:
-            # Expired
-            del self._cache[key]
-            self._misses += 1
+        value, expires_at, _ = entry
+        if time.monotonic() >= expires_at:
+            self._drop(key)
+            self._expirations += 1
+            self._record(key, hit=False)
             return None
 
-        self._hits += 1
+        self._cache.move_to_end(key)
+        self._record(key, hit=True)
         return value
 
-    def cache_set(self, key: str, value: Any) -> None:
+    def cache_set(self, key: str, value: Any, ttl: float | None = None) -> None:
         """Store value in cache.
 
         Note: Stores a direct reference (not a copy) for performance.
@@ -96,32 +151,84 @@ class DataCache:
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Lifetime in seconds; defaults to the prefix or cache TTL
+        """
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+        if ttl is None:
+            ttl = self._prefix_ttls.get(_key_prefix(key), self._ttl)
+        size = _estimate_size(value) if self._max_bytes is not None else 0
+        if key in self._cache:
+            self._drop(key)
+        self._cache[key] = (value, now + ttl, size)
+        self._bytes += size
+        while len(self._cache) > self._max_entries or (
+            self._max_bytes is not None
+            and self._bytes > self._max_bytes
+            and len(self._cache) > 1
+        ):
+            self._drop(next(iter(self._cache)))
+            self._evictions += 1
+
+    def sweep(self, now: float | None = None) -> int:
+        """Drop every expired entry.
+
+        Returns:
+            Number of entries removed
         """
-        if len(self._cache) >= self._max_entries and key not in self._cache:
-            oldest_key = min(self._cache, key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-        self._cache[key] = (value, time.monotonic())
+        now = time.monotonic() if now is None else now
+        expired = [key for key, entry in self._cache.items() if now >= entry[1]]
+        for key in expired:
+            self._drop(key)
+        self._expirations += len(expired)
+        self._next_sweep = now + self._ttl
+        return len(expired)
 
     def invalidate(self, key: str) -> None:
         """Remove key from cache."""
-        self._cache.pop(key, None)
+        if key in self._cache:
+            self._drop(key)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Remove every key with the given stats prefix."""
+        for key in [key for key in self._cache if _key_prefix(key) == prefix]:
+            self._drop(key)
 
     def clear(self) -> None:
         """Clear all cached entries."""
         self._cache.clear()
+        self._bytes = 0
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._prefix_stats.clear()
 
-    def get_stats(self) -> dict[str, int]:
+    def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         total = self._hits + self._misses
         hit_rate = (self._hits / total * 100) if total > 0 else 0
-        return {
+        stats: dict[str, Any] = {
             "entries": len(self._cache),
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate_percent": round(hit_rate, 1),
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "prefixes": {
+                prefix: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate_percent": round(hits / (hits + misses) * 100, 1),
+                }
+                for prefix, (hits, misses) in self._prefix_stats.items()
+            },
         }
+        if self._max_bytes is not None:
+            stats["bytes"] = self._bytes
+            stats["max_bytes"] = self._max_bytes
+        return stats
 
 
 class AlexaMetrics:
@@ -131,8 +238,19 @@ class AlexaMetrics:
         """Initialize metrics collector."""
         self.hass = hass
         self.boot_metrics: BootMetrics | None = None
-        self.api_cache = DataCache(ttl_seconds=30.0)
+        self.api_cache = DataCache(ttl_seconds=30.0, prefix_ttls=API_CACHE_TTLS)
         self._api_calls: dict[str, tuple[int, float]] = {}  # count, total_time
+        self._push_commands: dict[str, tuple[int, float]] = {}  # count, total_time
+        self._unknown_push_commands: dict[str, int] = {}
+        self._coalesced_push_commands: dict[str, int] = {}
+        self._device_refreshes = {"applied": 0, "skipped": 0}
+        self._state_writes: dict[str, dict[str, int]] = {}
+        self._notification_refreshes = {
+            "refreshes": 0,
+            "sensors_updated": 0,
+            "sensors_skipped": 0,
+            "last_skipped": 0,
+        }
 
     def start_boot_tracking(self) -> None:
         """Start tracking boot performance."""
@@ -157,6 +275,66 @@ class AlexaMetrics:
         count, total = self._api_calls[endpoint]
         self._api_calls[endpoint] = (count + 1, total + duration)
 
+    def record_push_command(
+        self, command: str, duration: float, known: bool = True
+    ) -> None:
+        """Record HTTP2 push command handling metrics.
+
+        Args:
+            command: Push command name
+            duration: Time spent handling the command in seconds
+            known: False if the command has no registered route
+        """
+        if not known:
+            self._unknown_push_commands[command] = (
+                self._unknown_push_commands.get(command, 0) + 1
+            )
+            return
+        count, total = self._push_commands.get(command, (0, 0.0))
+        self._push_commands[command] = (count + 1, total + duration)
+
+    def record_push_coalesced(self, command: str) -> None:
+        """Record a push dispatch superseded inside the coalescing window."""
+        self._coalesced_push_commands[command] = (
+            self._coalesced_push_commands.get(command, 0) + 1
+        )
+
+    def get_push_stats(self) -> dict[str, Any]:
+        """Get HTTP2 push command statistics, busiest first."""
+        commands = {}
+        for command, (count, total) in sorted(
+            self._push_commands.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            commands[command] = {
+                "count": count,
+                "total_time": round(total, 6),
+                "avg_time": round(total / count, 6) if count > 0 else 0,
+            }
+        return {
+            "commands": commands,
+            "unknown": dict(self._unknown_push_commands),
+            "coalesced": dict(self._coalesced_push_commands),
+        }
+
+    def record_device_refresh(self, applied: bool) -> None:
+        """Record whether a coordinator media player refresh was applied."""
+        self._device_refreshes["applied" if applied else "skipped"] += 1
+
+    def record_notification_refresh(self, updated: int, skipped: int) -> None:
+        """Record how many notification sensors a snapshot refresh woke or skipped."""
+        stats = self._notification_refreshes
+        stats["refreshes"] += 1
+        stats["sensors_updated"] += updated
+        stats["sensors_skipped"] += skipped
+        stats["last_skipped"] = skipped
+
+    def record_state_write(self, platform: str, suppressed: bool) -> None:
+        """Record a coordinator update that wrote or skipped an entity state."""
+        counts = self._state_writes.setdefault(
+            platform, {"written": 0, "suppressed": 0}
+        )
+        counts["suppressed" if suppressed else "written"] += 1
+
     def get_api_stats(self) -> dict[str, Any]:
         """Get API call statistics."""
         stats = {}
@@ -168,12 +346,28 @@ class AlexaMetrics:
             }
         return stats
 
+    def get_rate_limit_stats(self) -> dict[str, Any]:
+        """Get queue depth and wait time statistics of the API rate limiters."""
+        domain_data = getattr(self.hass, "data", {}).get(DOMAIN)
+        if not isinstance(domain_data, dict):
+            return {}
+        limiters = domain_data.get("rate_limiters") or {}
+        return {limiter.name: limiter.get_stats() for limiter in limiters.values()}
+
     def get_full_report(self) -> dict[str, Any]:
         """Get complete metrics report."""
         return {
             "boot": self.boot_metrics.get_summary() if self.boot_metrics else None,
             "cache": self.api_cache.get_stats(),
             "api_calls": self.get_api_stats(),
+            "push_commands": self.get_push_stats(),
+            "device_refreshes": dict(self._device_refreshes),
+            "notification_refreshes": dict(self._notification_refreshes),
+            "state_writes": {
+                platform: dict(counts)
+                for platform, counts in self._state_writes.items()
+            },
+            "rate_limits": self.get_rate_limit_stats(),
         }
 
 
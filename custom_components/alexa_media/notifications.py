@@ -0,0 +1,270 @@
+"""Notification snapshot diffing and scheduling for Alexa Media Player.
+
+Fingerprints every (serial, type) bucket of the processed notifications
+snapshot so a refresh only wakes the sensors whose bucket actually changed,
+and keeps the fire times of all notification sensors of an account in one
+queue backed by a single Home Assistant timer.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+import datetime
+import hashlib
+import heapq
+import json
+import logging
+from operator import attrgetter
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_ALEXAMEDIA, NOTIFICATION_SCHEDULE_PREVIEW
+
+_LOGGER = logging.getLogger(__name__)
+
+NOTIFICATION_SENSOR_TYPES = ("Alarm", "Timer", "Reminder")
+
+BucketKey = tuple[str, str]
+BucketVersions = dict[BucketKey, dict[Any, Hashable]]
+
+
+def notification_fingerprint(notification: Mapping[str, Any]) -> Hashable:
+    """Return a value that changes whenever the notification changes.
+
+    Alexa bumps ``version`` on every edit, so it is used together with the
+    status when present. Notifications without a version fall back to a digest
+    of the whole payload.
+    """
+    version = notification.get("version")
+    if version is not None:
+        return (version, notification.get("status"))
+    payload = json.dumps(notification, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def bucket_versions(notifications: Mapping[str, Any] | None) -> BucketVersions:
+    """Return {(serial, type): {notificationIndex: fingerprint}} for a snapshot.
+
+    Non-dict entries such as ``process_timestamp`` are ignored.
+    """
+    versions: BucketVersions = {}
+    for serial, types in (notifications or {}).items():
+        if not isinstance(types, dict):
+            continue
+        for n_type, bucket in types.items():
+            if isinstance(bucket, dict):
+                versions[(serial, n_type)] = {
+                    n_id: notification_fingerprint(notification)
+                    for n_id, notification in bucket.items()
+                }
+    return versions
+
+
+def changed_buckets(
+    previous: BucketVersions | None, current: BucketVersions
+) -> dict[str, set[str]]:
+    """Return {serial: {types}} for buckets added, removed or modified.
+
+    Without a previous snapshot every current bucket counts as changed.
+    """
+    previous = previous or {}
+    changed: dict[str, set[str]] = {}
+    for key in previous.keys() | current.keys():
+        if previous.get(key) != current.get(key):
+            serial, n_type = key
+            changed.setdefault(serial, set()).add(n_type)
+    return changed
+
+
+def count_notification_sensors(
+    sensors: Mapping[str, Any] | None, changed: Mapping[str, set[str]]
+) -> tuple[int, int]:
+    """Return (updated, skipped) notification sensor counts for a refresh.
+
+    ``sensors`` is the account's ``entities["sensor"]`` map of serial to
+    {type: sensor}.
+    """
+    updated = skipped = 0
+    for serial, by_type in (sensors or {}).items():
+        if not isinstance(by_type, dict):
+            continue
+        types = changed.get(serial, ())
+        for n_type in NOTIFICATION_SENSOR_TYPES:
+            if n_type not in by_type:
+                continue
+            if n_type in types:
+                updated += 1
+            else:
+                skipped += 1
+    return updated, skipped
+
+
+@dataclass(slots=True)
+class ScheduledFire:
+    """A pending fire of one notification sensor."""
+
+    when: datetime.datetime
+    seq: int
+    action: Callable[[datetime.datetime], None]
+    label: str
+
+
+class NotificationScheduler:
+    """Priority queue of notification fire times for one account.
+
+    Only the earliest pending fire is armed with Home Assistant, so sensors
+    rescheduling on a refresh do not create and cancel a timer each. Replaced
+    and cancelled entries are dropped lazily from the heap.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._entries: dict[Hashable, ScheduledFire] = {}
+        self._heap: list[tuple[datetime.datetime, int, Hashable]] = []
+        self._seq = 0
+        self._unsub: CALLBACK_TYPE | None = None
+        self._armed_at: datetime.datetime | None = None
+        self._scheduled = 0
+        self._cancelled = 0
+        self._fired = 0
+        self._timer_arms = 0
+
+    @callback
+    def schedule(
+        self,
+        key: Hashable,
+        when: datetime.datetime,
+        action: Callable[[datetime.datetime], None],
+        label: str | None = None,
+    ) -> CALLBACK_TYPE:
+        """Schedule action(when) for key, replacing any pending fire of key.
+
+        Returns a callable that cancels this fire only.
+        """
+        when = dt_util.as_utc(when)
+        self._seq += 1
+        entry = ScheduledFire(when, self._seq, action, label or str(key))
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (when, entry.seq, key))
+        self._scheduled += 1
+        self._compact()
+        self._arm()
+
+        @callback
+        def _cancel() -> None:
+            self.cancel(key, entry.seq)
+
+        return _cancel
+
+    @callback
+    def cancel(self, key: Hashable, seq: int | None = None) -> None:
+        """Cancel the pending fire of key, if it is still the one given."""
+        entry = self._entries.get(key)
+        if entry is None or (seq is not None and entry.seq != seq):
+            return
+        del self._entries[key]
+        self._cancelled += 1
+        self._arm()
+
+    def _is_live(self, seq: int, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.seq == seq
+
+    def _next_time(self) -> datetime.datetime | None:
+        """Return the earliest live fire time, dropping stale heap entries."""
+        while self._heap:
+            when, seq, key = self._heap[0]
+            if self._is_live(seq, key):
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    def _compact(self) -> None:
+        """Rebuild the heap when stale entries outnumber live ones."""
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [
+                (entry.when, entry.seq, key) for key, entry in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    @callback
+    def _arm(self) -> None:
+        """Point the Home Assistant timer at the earliest pending fire."""
+        when = self._next_time()
+        if when == self._armed_at:
+            return
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._armed_at = when
+        if when is not None:
+            self._unsub = async_track_point_in_utc_time(self._hass, self._fire, when)
+            self._timer_arms += 1
+
+    @callback
+    def _fire(self, now: datetime.datetime) -> None:
+        """Run every action that is due and re-arm for the next one."""
+        self._unsub = None
+        self._armed_at = None
+        now = max(dt_util.as_utc(now), dt_util.utcnow())
+        while (when := self._next_time()) is not None and when <= now:
+            _, _, key = heapq.heappop(self._heap)
+            entry = self._entries.pop(key)
+            self._fired += 1
+            try:
+                entry.action(when)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error firing notification event %s", entry.label)
+        self._arm()
+
+    def upcoming(
+        self, limit: int = NOTIFICATION_SCHEDULE_PREVIEW
+    ) -> list[dict[str, str]]:
+        """Return the next limit fires, earliest first."""
+        return [
+            {"label": entry.label, "when": entry.when.isoformat()}
+            for entry in heapq.nsmallest(
+                limit, self._entries.values(), key=attrgetter("when", "seq")
+            )
+        ]
+
+    @callback
+    def close(self) -> None:
+        """Cancel the timer and drop every pending fire."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._armed_at = None
+        self._entries.clear()
+        self._heap.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "pending": len(self._entries),
+            "scheduled": self._scheduled,
+            "cancelled": self._cancelled,
+            "fired": self._fired,
+            "timer_arms": self._timer_arms,
+            "armed_at": self._armed_at.isoformat() if self._armed_at else None,
+            "next_fires": self.upcoming(),
+        }
+
+
+def get_notification_scheduler(
+    hass: HomeAssistant, email: str
+) -> NotificationScheduler | None:
+    """Return the notification scheduler of an account, creating it if needed."""
+    accounts = hass.data.get(DATA_ALEXAMEDIA, {}).get("accounts", {})
+    account = accounts.get(email)
+    if not isinstance(account, dict):
+        return None
+    scheduler = account.get("notification_scheduler")
+    if scheduler is None:
+        scheduler = account["notification_scheduler"] = NotificationScheduler(hass)
+    return scheduler
@@ -8,8 +8,10 @@ https://community.home-assistant.io/t/echo-devices-alexa-as-media-player-testers
 """
 
 import asyncio
+import functools
 import json
 import logging
+from typing import Any
 
 from alexapy.helpers import hide_email, hide_serial
 from homeassistant.components.notify import (
@@ -21,6 +23,7 @@ from homeassistant.components.notify import (
     BaseNotificationService,
 )
 from homeassistant.const import CONF_EMAIL
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.group import expand_entity_ids
 import voluptuous as vol
 
@@ -32,9 +35,82 @@ from .const import (
     NOTIFY_URL,
 )
 from .helpers import retry_async
+from .notify_delivery import get_notify_delivery_queue, summarize_results
+from .sequence_batch import BATCH_NODE_BUILDERS
 
 _LOGGER = logging.getLogger(__name__)
 
+NOTIFY_TARGETS_REVISION = "notify_targets_revision"
+
+
+def invalidate_notify_targets(hass) -> None:
+    """Mark the cached notify target index as stale.
+
+    Media players call this when they are added, removed or renamed so the
+    next lookup rebuilds the index.
+    """
+    if hass is None or DATA_ALEXAMEDIA not in hass.data:
+        return
+    data = hass.data[DATA_ALEXAMEDIA]
+    data[NOTIFY_TARGETS_REVISION] = data.get(NOTIFY_TARGETS_REVISION, 0) + 1
+
+
+class NotifyTargetIndex:
+    """Lookup of media players by entity, name, unique_id, entity_id and serial.
+
+    Built once from every account's media players and reused until the
+    revision or the set of media player dicts changes.
+    """
+
+    def __init__(self, signature: tuple, accounts: dict[str, Any]) -> None:
+        """Index the media players of accounts."""
+        self.signature = signature
+        self.by_account: dict[str, list] = {}
+        self.devices: list = []
+        self._lookup: dict[Any, list] = {}
+        for email, account_dict in accounts.items():
+            if "entities" not in account_dict:
+                continue
+            players = [
+                entity
+                for entity in account_dict["entities"]["media_player"].values()
+                if entity is not None
+            ]
+            self.by_account[email] = players
+            self.devices.extend(players)
+            for alexa in players:
+                keys = (
+                    alexa,
+                    alexa.name,
+                    alexa.unique_id,
+                    alexa.entity_id,
+                    alexa.device_serial_number,
+                )
+                for key in dict.fromkeys(key for key in keys if key is not None):
+                    self._lookup.setdefault(key, []).append(alexa)
+
+    @staticmethod
+    def signature_for(data: dict[str, Any]) -> tuple:
+        """Return the cache key for hass.data[DATA_ALEXAMEDIA]."""
+        return (
+            data.get(NOTIFY_TARGETS_REVISION, 0),
+            tuple(
+                (
+                    email,
+                    id(players := account_dict.get("entities", {}).get("media_player")),
+                    len(players or ()),
+                )
+                for email, account_dict in (data.get("accounts") or {}).items()
+            ),
+        )
+
+    def get(self, item: Any) -> list:
+        """Return the media players matching item, in account order."""
+        try:
+            return self._lookup.get(item, [])
+        except TypeError:
+            return []
+
 
 @retry_async(limit=5, delay=2, catch_exceptions=True)
 async def async_get_service(hass, config, discovery_info=None):
@@ -83,11 +159,24 @@ async def async_unload_entry(hass, entry) -> bool:
 class AlexaNotificationService(BaseNotificationService):
     """Implement Alexa Media Player notification service."""
 
+    _target_index: NotifyTargetIndex | None = None
+
     def __init__(self, hass):
         """Initialize the service."""
         self.hass = hass
         self.last_called = True
 
+    def _index(self) -> NotifyTargetIndex:
+        """Return the target index, rebuilding it if media players changed."""
+        data = self.hass.data[DATA_ALEXAMEDIA]
+        signature = NotifyTargetIndex.signature_for(data)
+        index = self._target_index
+        if index is None or index.signature != signature:
+            index = self._target_index = NotifyTargetIndex(
+                signature, data.get("accounts") or {}
+            )
+        return index
+
     def convert(self, names, type_="entities", filter_matches=False):
         """Return a list of converted Alexa devices based on names.
 
@@ -112,36 +201,20 @@ class AlexaNotificationService(BaseNotificationService):
         devices = []
         if isinstance(names, str):
             names = [names]
+        index = self._index()
         for item in names:
-            matched = False
-            for alexa in self.devices:
-                # _LOGGER.debug(
-                #     "Testing item: %s against (%s, %s, %s, %s)",
-                #     item,
-                #     alexa,
-                #     alexa.name,
-                #     hide_serial(alexa.unique_id),
-                #     alexa.entity_id,
-                # )
-                if item in (
-                    alexa,
-                    alexa.name,
-                    alexa.unique_id,
-                    alexa.entity_id,
-                    alexa.device_serial_number,
-                ):
-                    if type_ == "entities":
-                        converted = alexa
-                    elif type_ == "serialnumbers":
-                        converted = alexa.device_serial_number
-                    elif type_ == "names":
-                        converted = alexa.name
-                    elif type_ == "entity_ids":
-                        converted = alexa.entity_id
-                    devices.append(converted)
-                    matched = True
-                    # _LOGGER.debug("Converting: %s to (%s): %s", item, type_, converted)
-            if not filter_matches and not matched:
+            matches = index.get(item)
+            for alexa in matches:
+                if type_ == "entities":
+                    converted = alexa
+                elif type_ == "serialnumbers":
+                    converted = alexa.device_serial_number
+                elif type_ == "names":
+                    converted = alexa.name
+                elif type_ == "entity_ids":
+                    converted = alexa.entity_id
+                devices.append(converted)
+            if not filter_matches and not matches:
                 devices.append(item)
         return devices
 
@@ -149,12 +222,10 @@ class AlexaNotificationService(BaseNotificationService):
     def targets(self):
         """Return a dictionary of Alexa devices."""
         devices = {}
-        for email, account_dict in self.hass.data[DATA_ALEXAMEDIA]["accounts"].items():
-            if "entities" not in account_dict:
-                continue
+        for email, players in self._index().by_account.items():
             last_called_entity = None
-            for _, entity in account_dict["entities"]["media_player"].items():
-                if entity is None or entity.entity_id is None:
+            for entity in players:
+                if entity.entity_id is None:
                     continue
                 entity_name = (entity.entity_id).split(".")[1]
                 devices[entity_name] = entity.unique_id
@@ -187,15 +258,7 @@ class AlexaNotificationService(BaseNotificationService):
     @property
     def devices(self):
         """Return a list of Alexa devices."""
-        devices = []
-        if (
-            "accounts" not in self.hass.data[DATA_ALEXAMEDIA]
-            or not self.hass.data[DATA_ALEXAMEDIA]["accounts"].items()
-        ):
-            return devices
-        for _, account_dict in self.hass.data[DATA_ALEXAMEDIA]["accounts"].items():
-            devices = devices + list(account_dict["entities"]["media_player"].values())
-        return devices
+        return list(self._index().devices)
 
     async def async_send_message(self, message="", **kwargs):
         # pylint: disable=too-many-branches
@@ -278,88 +341,66 @@ class AlexaNotificationService(BaseNotificationService):
             expanded_targets.append(target)
 
         entities = self.convert(expanded_targets, type_="entities")
-        tasks = []
+        # Resolve the targets once; every branch below only needs membership.
+        index = self._index()
+        matched = [alexa for item in entities for alexa in index.get(item)]
+        matched_set = set(matched)
+        serials = [alexa.device_serial_number for alexa in matched]
+        serial_set = set(serials)
+        data_type = data.get("type", "tts")
+        senders = {
+            "tts": ("async_send_tts", {}),
+            "push": ("async_send_mobilepush", {"title": title}),
+            "dropin_notification": ("async_send_dropin_notification", {"title": title}),
+        }
+        deliveries = []
         for account, account_dict in self.hass.data[DATA_ALEXAMEDIA][
             "accounts"
         ].items():
-            data_type = data.get("type", "tts")
+            queue_delay = account_dict.get("options", {}).get(
+                CONF_QUEUE_DELAY, DEFAULT_QUEUE_DELAY
+            )
+            batch = []
             for alexa in account_dict["entities"]["media_player"].values():
-                if data_type == "tts":
-                    targets = self.convert(
-                        entities, type_="entities", filter_matches=True
-                    )
-                    # _LOGGER.debug("TTS entities: %s", targets)
-                    if alexa in targets and alexa.available:
-                        _LOGGER.debug("TTS by %s : %s", alexa, message)
-                        tasks.append(
-                            alexa.async_send_tts(
-                                message,
-                                queue_delay=self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                    account
-                                ]["options"].get(CONF_QUEUE_DELAY, DEFAULT_QUEUE_DELAY),
-                            )
+                if data_type in senders:
+                    if alexa in matched_set and alexa.available:
+                        _LOGGER.debug(
+                            "%s by %s: %s %s", data_type, alexa, title, message
                         )
+                        batch.append(alexa)
                 elif data_type == "announce":
-                    targets = self.convert(
-                        entities, type_="serialnumbers", filter_matches=True
-                    )
                     # _LOGGER.debug(
                     #     "Announce targets: %s entities: %s",
-                    #     list(map(hide_serial, targets)),
+                    #     list(map(hide_serial, serials)),
                     #     entities,
                     # )
-                    if alexa.device_serial_number in targets and alexa.available:
+                    if alexa.device_serial_number in serial_set and alexa.available:
                         _LOGGER.debug(
                             ("%s: Announce by %s to targets: %s: %s"),
                             hide_email(account),
                             alexa,
-                            list(map(hide_serial, targets)),
+                            list(map(hide_serial, serials)),
                             message,
                         )
-                        tasks.append(
-                            alexa.async_send_announcement(
-                                message,
-                                targets=targets,
-                                title=title,
-                                method=(data["method"] if "method" in data else "all"),
-                                queue_delay=self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                    account
-                                ]["options"].get(CONF_QUEUE_DELAY, DEFAULT_QUEUE_DELAY),
+                        deliveries.append(
+                            (
+                                account,
+                                [alexa],
+                                functools.partial(
+                                    alexa.async_send_announcement,
+                                    message,
+                                    wait=True,
+                                    raise_login_errors=True,
+                                    targets=serials,
+                                    title=title,
+                                    method=(
+                                        data["method"] if "method" in data else "all"
+                                    ),
+                                    queue_delay=queue_delay,
+                                ),
                             )
                         )
                         break
-                elif data_type == "push":
-                    targets = self.convert(
-                        entities, type_="entities", filter_matches=True
-                    )
-                    if alexa in targets and alexa.available:
-                        _LOGGER.debug("Push by %s: %s %s", alexa, title, message)
-                        tasks.append(
-                            alexa.async_send_mobilepush(
-                                message,
-                                title=title,
-                                queue_delay=self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                    account
-                                ]["options"].get(CONF_QUEUE_DELAY, DEFAULT_QUEUE_DELAY),
-                            )
-                        )
-                elif data_type == "dropin_notification":
-                    targets = self.convert(
-                        entities, type_="entities", filter_matches=True
-                    )
-                    if alexa in targets and alexa.available:
-                        _LOGGER.debug(
-                            "Notification dropin by %s: %s %s", alexa, title, message
-                        )
-                        tasks.append(
-                            alexa.async_send_dropin_notification(
-                                message,
-                                title=title,
-                                queue_delay=self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                    account
-                                ]["options"].get(CONF_QUEUE_DELAY, DEFAULT_QUEUE_DELAY),
-                            )
-                        )
                 else:
                     errormessage = (
                         f"{account}: Data value `type={data_type}` is not implemented. "
@@ -367,4 +408,71 @@ class AlexaNotificationService(BaseNotificationService):
                     )
                     _LOGGER.debug(errormessage)
                     raise vol.Invalid(errormessage)
-        await asyncio.gather(*tasks)
+            if len(batch) == 1:
+                method, extra = senders[data_type]
+                send = functools.partial(
+                    getattr(batch[0], method),
+                    message,
+                    wait=True,
+                    raise_login_errors=True,
+                    queue_delay=queue_delay,
+                    **extra,
+                )
+                deliveries.append((account, batch, send))
+            elif batch:
+                # One parallel sequence per account instead of one per device
+                _LOGGER.debug(
+                    "%s: Batching %s to %s devices in one sequence",
+                    hide_email(account),
+                    data_type,
+                    len(batch),
+                )
+                build = BATCH_NODE_BUILDERS[data_type]
+                send = functools.partial(
+                    batch[0].async_run_sequence_nodes,
+                    [build(alexa, message, title=title) for alexa in batch],
+                    wait=True,
+                    raise_login_errors=True,
+                )
+                deliveries.append((account, batch, send))
+        return await self._async_deliver(deliveries, wait=bool(data.get("wait")))
+
+    async def _async_deliver(self, deliveries, wait=False):
+        """Queue deliveries on their account's notify queue.
+
+        With wait set, the call waits for every delivery, fires an
+        alexa_media_notify_results event with the aggregated results and
+        raises HomeAssistantError if any of them failed. Home Assistant's
+        notify service discards the return value, so the event is how callers
+        see per-target results.
+        """
+        futures = []
+        for account, players, send in deliveries:
+            queue = get_notify_delivery_queue(self.hass, account)
+            targets = [alexa.entity_id or str(alexa.name) for alexa in players]
+            if queue is None:
+                _LOGGER.debug(
+                    "%s: Account unloaded; dropping notify to %s",
+                    hide_email(account),
+                    targets,
+                )
+                continue
+            futures.append(await queue.submit(targets, send))
+        if not wait:
+            return None
+        results = summarize_results(
+            result for batch in await asyncio.gather(*futures) for result in batch
+        )
+        _LOGGER.debug("Notify delivery results: %s", results)
+        self.hass.bus.async_fire("alexa_media_notify_results", event_data=results)
+        if results["failed"]:
+            raise HomeAssistantError(
+                f"Alexa notify failed for {results['failed']} of "
+                f"{len(results['results'])} targets: "
+                + ", ".join(
+                    f"{result['target']} ({result['error']})"
+                    for result in results["results"]
+                    if not result["ok"]
+                )
+            )
+        return results
@@ -0,0 +1,264 @@
+"""Notify delivery queues for Alexa Media Player.
+
+Every account sends its notify deliveries through one ordered queue worked by
+a fixed number of workers, so a message to many Echos cannot flood the Alexa
+API and callers can optionally wait for the aggregated results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from alexapy import hide_email
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_ALEXAMEDIA,
+    NOTIFY_DELIVERY_CONCURRENCY,
+    NOTIFY_DELIVERY_MAX_QUEUED,
+    NOTIFY_DELIVERY_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DeliveryResult:
+    """Outcome of one notify delivery."""
+
+    target: str
+    ok: bool
+    latency: float
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result as a JSON-friendly dict."""
+        return {
+            "target": self.target,
+            "ok": self.ok,
+            "latency": round(self.latency, 3),
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True, eq=False)
+class _DeliveryJob:
+    """A queued delivery and the future its results are reported on."""
+
+    targets: tuple[str, ...]
+    send: Callable[[], Awaitable[Any]]
+    future: asyncio.Future[list[DeliveryResult]]
+    queued_at: float
+
+
+class NotifyDeliveryQueue:
+    """Ordered notify delivery queue with bounded concurrency for one account.
+
+    Deliveries start in the order they were submitted. Submitting waits while
+    max_queued deliveries are pending, and each delivery is cut off after
+    timeout seconds.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        concurrency: int = NOTIFY_DELIVERY_CONCURRENCY,
+        max_queued: int = NOTIFY_DELIVERY_MAX_QUEUED,
+        timeout: float = NOTIFY_DELIVERY_TIMEOUT,
+    ) -> None:
+        """Initialize queue.
+
+        Args:
+            name: Label used in logs
+            concurrency: Number of deliveries running at once
+            max_queued: Pending deliveries before submit waits
+            timeout: Seconds before a delivery is counted as failed
+        """
+        self.name = name
+        self._concurrency = max(1, concurrency)
+        self._max_queued = max_queued
+        self._timeout = timeout
+        # Created on first submit so the queue binds to the running loop
+        self._queue: asyncio.Queue[_DeliveryJob] | None = None
+        self._workers: set[asyncio.Task[None]] = set()
+        self._running: set[_DeliveryJob] = set()
+        self._targets: dict[str, dict[str, Any]] = {}
+        self._submitted = 0
+        self._delivered = 0
+        self._failed = 0
+        self._max_depth = 0
+        self._wait_total = 0.0
+
+    async def submit(
+        self, targets: str | Sequence[str], send: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Future[list[DeliveryResult]]:
+        """Queue send() for targets and return a future for their results.
+
+        A send covering several targets, such as a batched sequence, yields
+        one result per target.
+        """
+        if isinstance(targets, str):
+            targets = (targets,)
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue(self._max_queued)
+        job = _DeliveryJob(tuple(targets), send, loop.create_future(), time.monotonic())
+        self._start_workers(loop)
+        await self._queue.put(job)
+        self._start_workers(loop)
+        self._submitted += 1
+        self._max_depth = max(self._max_depth, self._queue.qsize())
+        return job.future
+
+    def _start_workers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start workers up to the concurrency limit."""
+        while len(self._workers) < self._concurrency:
+            task = loop.create_task(
+                self._worker(), name=f"alexa_media notify {self.name}"
+            )
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+
+    async def _worker(self) -> None:
+        """Run queued deliveries one at a time and exit once the queue is empty.
+
+        Workers only live while there is work, so an idle account has no
+        pending tasks; submit starts new ones as needed.
+        """
+        assert self._queue is not None
+        try:
+            while not self._queue.empty():
+                job = self._queue.get_nowait()
+                self._running.add(job)
+                try:
+                    result = await self._deliver(job)
+                finally:
+                    self._running.discard(job)
+                    self._queue.task_done()
+                if not job.future.done():
+                    job.future.set_result(result)
+        finally:
+            # Leave the pool before returning, not in the done callback, so a
+            # submit in between starts a replacement worker.
+            self._workers.discard(asyncio.current_task())  # type: ignore[arg-type]
+
+    async def _deliver(self, job: _DeliveryJob) -> list[DeliveryResult]:
+        """Await one delivery and record its latency for each target."""
+        start = time.monotonic()
+        self._wait_total += start - job.queued_at
+        error = None
+        try:
+            async with asyncio.timeout(self._timeout):
+                await job.send()
+        except TimeoutError:
+            error = f"timed out after {self._timeout}s"
+        except Exception as ex:  # pylint: disable=broad-except
+            error = f"{type(ex).__name__}: {ex}"
+        latency = time.monotonic() - start
+        if error:
+            _LOGGER.debug(
+                "%s: Notify to %s failed: %s",
+                self.name,
+                ", ".join(job.targets),
+                error,
+            )
+        results = [
+            DeliveryResult(target, error is None, latency, error)
+            for target in job.targets
+        ]
+        for result in results:
+            self._record(result)
+        return results
+
+    def _record(self, result: DeliveryResult) -> None:
+        """Update the totals and the per-target statistics."""
+        stats = self._targets.setdefault(
+            result.target,
+            {
+                "delivered": 0,
+                "failed": 0,
+                "total_time": 0.0,
+                "max_time": 0.0,
+                "last_error": None,
+            },
+        )
+        stats["total_time"] += result.latency
+        stats["max_time"] = max(stats["max_time"], result.latency)
+        if result.ok:
+            stats["delivered"] += 1
+            self._delivered += 1
+        else:
+            stats["failed"] += 1
+            stats["last_error"] = result.error
+            self._failed += 1
+
+    def queue_depth(self) -> int:
+        """Return the number of deliveries waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def close(self) -> None:
+        """Stop the workers and cancel every pending delivery."""
+        for task in list(self._workers):
+            task.cancel()
+        self._workers.clear()
+        pending = list(self._running)
+        self._running.clear()
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for job in pending:
+            job.future.cancel()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get delivery statistics."""
+        finished = self._delivered + self._failed
+        return {
+            "submitted": self._submitted,
+            "delivered": self._delivered,
+            "failed": self._failed,
+            "queue_depth": self.queue_depth(),
+            "max_queue_depth": self._max_depth,
+            "avg_wait": round(self._wait_total / finished, 3) if finished else 0,
+            "targets": {
+                target: {
+                    "delivered": stats["delivered"],
+                    "failed": stats["failed"],
+                    "avg_time": round(
+                        stats["total_time"] / (stats["delivered"] + stats["failed"]),
+                        3,
+                    ),
+                    "max_time": round(stats["max_time"], 3),
+                    "last_error": stats["last_error"],
+                }
+                for target, stats in self._targets.items()
+            },
+        }
+
+
+def summarize_results(results: Iterable[DeliveryResult]) -> dict[str, Any]:
+    """Return the aggregated outcome of a notify call."""
+    results = list(results)
+    failed = [result for result in results if not result.ok]
+    return {
+        "delivered": len(results) - len(failed),
+        "failed": len(failed),
+        "results": [result.as_dict() for result in results],
+    }
+
+
+def get_notify_delivery_queue(
+    hass: HomeAssistant, email: str
+) -> NotifyDeliveryQueue | None:
+    """Return the notify delivery queue of an account, creating it if needed."""
+    accounts = hass.data.get(DATA_ALEXAMEDIA, {}).get("accounts", {})
+    account = accounts.get(email)
+    if not isinstance(account, dict):
+        return None
+    queue = account.get("notify_delivery")
+    if queue is None:
+        queue = account["notify_delivery"] = NotifyDeliveryQueue(name=hide_email(email))
+    return queue
@@ -0,0 +1,197 @@
+"""HTTP2 push command routing for Alexa Media Player.
+
+Maps push command names to serial extraction, handling and dispatch so
+``http2_handler`` resolves each message with a single dict lookup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import inspect
+import logging
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable
+
+from alexapy import hide_serial
+
+if TYPE_CHECKING:
+    from .metrics import AlexaMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+PushHandler = Callable[[str | None, dict, dict], Awaitable[None] | None]
+
+
+def extract_push_serial(json_payload: dict) -> str | None:
+    """Return the device serial a push payload refers to.
+
+    Payloads either carry ``dopplerId.deviceSerialNumber`` or a
+    ``key.entryId`` of the form ``<customer>#<type>#<serial>``; in the latter
+    case the serial is also copied to ``key.serialNumber`` for listeners.
+    """
+    doppler_id = json_payload.get("dopplerId")
+    if isinstance(doppler_id, dict) and "deviceSerialNumber" in doppler_id:
+        return doppler_id["deviceSerialNumber"]
+    key = json_payload.get("key")
+    if isinstance(key, dict) and "#" in (key.get("entryId") or ""):
+        serial = key["entryId"].split("#")[2]
+        key["serialNumber"] = serial
+        return serial
+    return None
+
+
+@dataclass(frozen=True)
+class PushCommand:
+    """Routing entry for one push command.
+
+    Attributes:
+        name: Push command name, e.g. ``PUSH_VOLUME_CHANGE``
+        handler: Optional callable run first with (serial, payload, resource)
+        dispatch_key: Event key sent to the device's serial signal when the
+            serial is known, e.g. ``player_state``
+        serial_extractor: Callable returning the serial from the payload
+        supported: False for commands that are recognised but ignored
+        coalesce: Whether bursts of this command may be coalesced per serial
+            so only the latest payload is dispatched once the window closes
+    """
+
+    name: str
+    handler: PushHandler | None = None
+    dispatch_key: str | None = None
+    serial_extractor: Callable[[dict], str | None] = extract_push_serial
+    supported: bool = True
+    coalesce: bool = False
+
+
+class PushCommandRouter:
+    """Registry and executor for HTTP2 push commands of one account."""
+
+    def __init__(
+        self,
+        dispatch: Callable[[str, dict], None],
+        is_known_serial: Callable[[str], bool],
+        metrics: AlexaMetrics | None = None,
+        coalesce_window: float = 0.0,
+    ) -> None:
+        """Initialize router.
+
+        Args:
+            dispatch: Callable sending an event to a device serial
+            is_known_serial: Callable returning whether a serial has entities
+            metrics: Optional metrics collector for per-command statistics
+            coalesce_window: Seconds to hold coalescable dispatches; 0 disables
+        """
+        self._commands: dict[str, PushCommand] = {}
+        self._dispatch = dispatch
+        self._is_known_serial = is_known_serial
+        self._metrics = metrics
+        self._coalesce_window = coalesce_window
+        # serial -> command -> (event, timer handle); dict order is arrival order
+        self._pending: dict[str, dict[str, tuple[dict, asyncio.TimerHandle]]] = {}
+
+    def __contains__(self, command: object) -> bool:
+        """Return whether command is registered."""
+        return command in self._commands
+
+    def register(self, command: PushCommand) -> None:
+        """Register a push command."""
+        self._commands[command.name] = command
+
+    def register_unsupported(self, names: Iterable[str]) -> None:
+        """Register commands that are recognised but not handled."""
+        for name in names:
+            self.register(PushCommand(name, supported=False))
+
+    def get(self, command: str) -> PushCommand | None:
+        """Return the routing entry for command."""
+        return self._commands.get(command)
+
+    def extract_serial(self, command: str, json_payload: dict) -> str | None:
+        """Return the device serial for a push payload."""
+        entry = self._commands.get(command)
+        extractor = entry.serial_extractor if entry else extract_push_serial
+        return extractor(json_payload)
+
+    async def async_route(
+        self,
+        command: str,
+        serial: str | None,
+        json_payload: dict,
+        resource: dict,
+    ) -> bool:
+        """Run the handler and dispatch for command.
+
+        Returns:
+            True if the command is registered, False if it is unknown
+        """
+        start = time.perf_counter()
+        entry = self._commands.get(command)
+        if entry is None:
+            if self._metrics:
+                self._metrics.record_push_command(command, 0.0, known=False)
+            return False
+        try:
+            if not entry.supported:
+                _LOGGER.debug("%s currently not supported", command)
+                return True
+            if entry.handler is not None:
+                result = entry.handler(serial, json_payload, resource)
+                if inspect.isawaitable(result):
+                    await result
+            if entry.dispatch_key and serial and self._is_known_serial(serial):
+                event = {entry.dispatch_key: json_payload}
+                if entry.coalesce and self._coalesce_window > 0:
+                    self._hold(serial, command, event)
+                else:
+                    # Keep per-serial ordering: anything held goes out first.
+                    self.flush(serial)
+                    _LOGGER.debug(
+                        "Sending %s for %s: %s",
+                        entry.dispatch_key,
+                        command,
+                        hide_serial(json_payload),
+                    )
+                    self._dispatch(serial, event)
+            return True
+        finally:
+            if self._metrics:
+                self._metrics.record_push_command(command, time.perf_counter() - start)
+
+    def _hold(self, serial: str, command: str, event: dict) -> None:
+        """Keep the latest event for (serial, command) until the window closes."""
+        pending = self._pending.setdefault(serial, {})
+        if command in pending:
+            handle = pending[command][1]
+            pending[command] = (event, handle)
+            if self._metrics:
+                self._metrics.record_push_coalesced(command)
+            return
+        handle = asyncio.get_running_loop().call_later(
+            self._coalesce_window, self.flush, serial
+        )
+        pending[command] = (event, handle)
+
+    def flush(self, serial: str | None = None) -> None:
+        """Dispatch held events for serial, or for every serial if None."""
+        serials = [serial] if serial is not None else list(self._pending)
+        for key in serials:
+            pending = self._pending.pop(key, None)
+            if not pending:
+                continue
+            for command, (event, handle) in pending.items():
+                handle.cancel()
+                _LOGGER.debug(
+                    "Sending coalesced %s for %s: %s",
+                    next(iter(event)),
+                    command,
+                    hide_serial(event),
+                )
+                self._dispatch(key, event)
+
+    def cancel_pending(self) -> None:
+        """Drop every held event without dispatching it."""
+        for pending in self._pending.values():
+            for _, handle in pending.values():
+                handle.cancel()
+        self._pending.clear()
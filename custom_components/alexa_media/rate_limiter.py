@@ -0,0 +1,341 @@
+"""Shared rate limiting of Alexa API calls for Alexa Media Player.
+
+Every AlexaAPI call of an account waits for a token from one bucket. Waiting
+calls are served by priority (user commands, then push follow-ups, then
+polling) and a 429 pauses the whole bucket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from enum import IntEnum
+import functools
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Mapping, TypeVar
+
+from alexapy import hide_email
+from alexapy.errors import AlexapyTooManyRequestsError
+
+from .const import (
+    DATA_ALEXAMEDIA,
+    RATE_LIMIT_BACKOFF_INITIAL_S,
+    RATE_LIMIT_BACKOFF_MAX_S,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_RATE,
+    RATE_LIMIT_SCOPE,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class RequestPriority(IntEnum):
+    """Priority of an Alexa API call; lower values are served first."""
+
+    USER = 0
+    PUSH = 1
+    POLL = 2
+
+
+class AlexaRateLimiter:
+    """Token bucket with prioritized waiters and a global 429 backoff."""
+
+    def __init__(
+        self,
+        name: str = "",
+        rate: float = RATE_LIMIT_RATE,
+        burst: int = RATE_LIMIT_BURST,
+    ) -> None:
+        """Initialize limiter.
+
+        Args:
+            name: Label used in logs and metrics
+            rate: Tokens added per second
+            burst: Bucket size
+        """
+        self.name = name
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._backoff_until = 0.0
+        self._backoff_level = 0
+        self._rate_limited = 0
+        self._max_depth = 0
+        self._stats = {
+            priority: {"requests": 0, "waited": 0, "wait_total": 0.0, "wait_max": 0.0}
+            for priority in RequestPriority
+        }
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        self._tokens = min(
+            float(self._burst), self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _try_take(self, now: float) -> bool:
+        """Take a token if the bucket is not paused and has one."""
+        if now < self._backoff_until:
+            return False
+        self._refill(now)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _schedule(self) -> None:
+        """Wake waiters when the next token is available."""
+        if self._timer is not None or not self._waiters:
+            return
+        now = time.monotonic()
+        self._refill(now)
+        delay = max(
+            self._backoff_until - now,
+            (1 - self._tokens) / self._rate,
+            0.0,
+        )
+        self._timer = asyncio.get_running_loop().call_later(delay, self._drain)
+
+    def _drain(self) -> None:
+        """Hand tokens to waiters in priority order."""
+        self._timer = None
+        now = time.monotonic()
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_take(now):
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        self._schedule()
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.POLL) -> float:
+        """Wait for a token.
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        if not self._waiters and self._try_take(start):
+            self._record(priority, 0.0)
+            return 0.0
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._max_depth = max(self._max_depth, self.queue_depth)
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The token was handed over before the caller was cancelled.
+                self._tokens = min(float(self._burst), self._tokens + 1)
+            raise
+        waited = time.monotonic() - start
+        self._record(priority, waited)
+        return waited
+
+    def _record(self, priority: RequestPriority, waited: float) -> None:
+        """Record a granted request."""
+        stats = self._stats[priority]
+        stats["requests"] += 1
+        if waited > 0:
+            stats["waited"] += 1
+            stats["wait_total"] += waited
+            stats["wait_max"] = max(stats["wait_max"], waited)
+
+    def report_rate_limited(self) -> None:
+        """Pause the bucket after a 429, doubling the pause while 429s repeat."""
+        now = time.monotonic()
+        backoff = min(
+            RATE_LIMIT_BACKOFF_INITIAL_S * 2**self._backoff_level,
+            RATE_LIMIT_BACKOFF_MAX_S,
+        )
+        self._backoff_level += 1
+        self._backoff_until = max(self._backoff_until, now + backoff)
+        self._tokens = 0.0
+        self._updated = now
+        self._rate_limited += 1
+        _LOGGER.debug(
+            "%s: Alexa API rate limited; pausing requests for %.0fs",
+            self.name,
+            backoff,
+        )
+
+    def report_success(self) -> None:
+        """Reset the backoff after a successful call."""
+        self._backoff_level = 0
+
+    async def call(
+        self,
+        priority: RequestPriority,
+        func: Callable[..., Awaitable[_T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> _T:
+        """Wait for a token, then await func(*args, **kwargs)."""
+        await self.acquire(priority)
+        try:
+            result = await func(*args, **kwargs)
+        except AlexapyTooManyRequestsError:
+            self.report_rate_limited()
+            raise
+        self.report_success()
+        return result
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of calls waiting for a token."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def close(self) -> None:
+        """Cancel the wake-up timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bucket state, queue depth and wait times per priority."""
+        now = time.monotonic()
+        self._refill(now)
+        priorities = {}
+        for priority, stats in self._stats.items():
+            waited = stats["waited"]
+            priorities[priority.name.lower()] = {
+                "requests": stats["requests"],
+                "waited": waited,
+                "avg_wait": round(stats["wait_total"] / waited, 3) if waited else 0,
+                "max_wait": round(stats["wait_max"], 3),
+            }
+        return {
+            "tokens": round(self._tokens, 2),
+            "rate": self._rate,
+            "burst": self._burst,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_depth,
+            "rate_limited": self._rate_limited,
+            "backoff_remaining": round(max(0.0, self._backoff_until - now), 1),
+            "priorities": priorities,
+        }
+
+
+def rate_limiter_key(email: str, url: str | None) -> str:
+    """Return the registry key of the limiter used by an account."""
+    if RATE_LIMIT_SCOPE == "region" and url:
+        return f"url:{url}"
+    return email
+
+
+def get_rate_limiter(hass: HomeAssistant, login: Any) -> AlexaRateLimiter | None:
+    """Return the limiter for a login, creating it if needed.
+
+    Returns None while the integration data is not set up.
+    """
+    domain_data = hass.data.get(DATA_ALEXAMEDIA)
+    if not isinstance(domain_data, dict):
+        return None
+    email = getattr(login, "email", None)
+    if not email:
+        return None
+    url = getattr(login, "url", None)
+    limiters: dict[str, AlexaRateLimiter] = domain_data.setdefault("rate_limiters", {})
+    key = rate_limiter_key(email, url)
+    if (limiter := limiters.get(key)) is None:
+        limiter = limiters[key] = AlexaRateLimiter(
+            name=url if key != email else hide_email(email)
+        )
+    return limiter
+
+
+def remove_rate_limiter(hass: HomeAssistant, email: str, url: str | None) -> None:
+    """Drop the limiter of an unloaded account.
+
+    A limiter shared by region is kept while another account still uses it.
+    """
+    domain_data = hass.data.get(DATA_ALEXAMEDIA, {})
+    key = rate_limiter_key(email, url)
+    for account in (domain_data.get("accounts") or {}).values():
+        other = account.get("login_obj") if isinstance(account, dict) else None
+        other_email = getattr(other, "email", None)
+        if (
+            other_email
+            and other_email != email
+            and rate_limiter_key(other_email, getattr(other, "url", None)) == key
+        ):
+            return
+    limiters = domain_data.get("rate_limiters") or {}
+    if (limiter := limiters.pop(key, None)) is not None:
+        limiter.close()
+
+
+async def limited_call(
+    hass: HomeAssistant,
+    login: Any,
+    priority: RequestPriority,
+    func: Callable[..., Awaitable[_T]],
+    *args: Any,
+    **kwargs: Any,
+) -> _T:
+    """Await func(*args, **kwargs) through the login's rate limiter."""
+    limiter = get_rate_limiter(hass, login)
+    if limiter is None:
+        return await func(*args, **kwargs)
+    return await limiter.call(priority, func, *args, **kwargs)
+
+
+class RateLimitedAPI:
+    """AlexaAPI proxy whose coroutine methods go through the rate limiter.
+
+    The limiter is looked up on each call from the owner's hass and _login, so
+    calls made before the entity is added to hass are not limited.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        owner: Any,
+        priorities: Mapping[str, RequestPriority] | None = None,
+        default: RequestPriority = RequestPriority.USER,
+    ) -> None:
+        """Initialize proxy.
+
+        Args:
+            api: AlexaAPI instance
+            owner: Entity providing hass and _login
+            priorities: Method name -> priority overrides
+            default: Priority of all other methods
+        """
+        self._api = api
+        self._owner = owner
+        self._priorities = dict(priorities or {})
+        self._default = default
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the API attribute, wrapping coroutine methods."""
+        attr = getattr(self._api, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        priority = self._priorities.get(name, self._default)
+
+        @functools.wraps(attr)
+        async def _limited(*args: Any, **kwargs: Any) -> Any:
+            hass = getattr(self._owner, "hass", None)
+            if hass is None:
+                return await attr(*args, **kwargs)
+            login = getattr(self._owner, "_login", None)
+            return await limited_call(hass, login, priority, attr, *args, **kwargs)
+
+        return _limited
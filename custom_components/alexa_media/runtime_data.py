@@ -114,7 +114,9 @@ class AlexaRuntimeData:
                 CONF_PUBLIC_URL,
                 CONF_QUEUE_DELAY,
                 CONF_SCAN_INTERVAL,
+                CONF_WARM_BOOT,
                 DEFAULT_SCAN_INTERVAL,
+                DEFAULT_WARM_BOOT,
             )
 
             self.options = {
@@ -136,6 +138,9 @@ class AlexaRuntimeData:
                 CONF_EXTENDED_ENTITY_DISCOVERY: self.config_entry.data.get(
                     CONF_EXTENDED_ENTITY_DISCOVERY, DEFAULT_EXTENDED_ENTITY_DISCOVERY
                 ),
+                CONF_WARM_BOOT: self.config_entry.data.get(
+                    CONF_WARM_BOOT, DEFAULT_WARM_BOOT
+                ),
                 CONF_DEBUG: self.config_entry.data.get(CONF_DEBUG, False),
             }
 
@@ -8,6 +8,7 @@ https://community.home-assistant.io/t/echo-devices-alexa-as-media-player-testers
 """
 
 import datetime
+import heapq
 import logging
 from typing import Callable, ClassVar, Optional
 
@@ -20,7 +21,6 @@ from homeassistant.const import UnitOfTemperature, __version__ as HA_VERSION
 from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady, NoEntitySpecifiedError
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt
@@ -50,7 +50,16 @@ from .const import (
     RECURRING_PATTERN,
     RECURRING_PATTERN_ISO_SET,
 )
-from .helpers import add_devices, alarm_just_dismissed, is_http2_enabled, safe_get
+from .coordinator import ChangeOnlyStateMixin
+from .helpers import (
+    add_devices,
+    alarm_just_dismissed,
+    connect_device_signals,
+    is_http2_enabled,
+    safe_get,
+)
+from .notifications import get_notification_scheduler
+from .serial_index import get_serial_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -77,6 +86,7 @@ async def async_setup_platform(hass, config, add_devices_callback, discovery_inf
     exclude_filter = config.get(CONF_EXCLUDE_DEVICES, [])
     debug = bool(config.get(CONF_DEBUG, False))
     account_dict = hass.data[DATA_ALEXAMEDIA]["accounts"][account]
+    serial_index = get_serial_index(account_dict)
     _LOGGER.debug("%s: Loading sensors", hide_email(account))
     if "sensor" not in account_dict["entities"]:
         hass.data[DATA_ALEXAMEDIA]["accounts"][account]["entities"]["sensor"] = {}
@@ -90,6 +100,7 @@ async def async_setup_platform(hass, config, add_devices_callback, discovery_inf
             raise ConfigEntryNotReady
         if key not in (account_dict["entities"]["sensor"]):
             account_dict["entities"]["sensor"][key] = {}
+            serial_index.add_entity_backed(key)
             for n_type, class_ in SENSOR_TYPES.items():
                 notifications = account_dict.get("notifications") or {}
                 key_notifications = notifications.get(key, {})
@@ -185,6 +196,7 @@ async def async_unload_entry(hass, entry) -> bool:
 
         if not sensors:
             account_dict["entities"]["sensor"].pop(key, None)
+            get_serial_index(account_dict).remove_entity_backed(key)
 
     return True
 
@@ -231,6 +243,7 @@ async def create_temperature_sensors(
 
         account_dict["entities"]["sensor"].setdefault(serial, {})
         account_dict["entities"]["sensor"][serial]["Temperature"] = sensor
+        get_serial_index(account_dict).add_entity_backed(serial)
         devices.append(sensor)
 
     return devices
@@ -311,6 +324,7 @@ async def create_air_quality_sensors(
                 debug=debug,
             )
             account_dict["entities"]["sensor"].setdefault(serial, {})
+            get_serial_index(account_dict).add_entity_backed(serial)
             account_dict["entities"]["sensor"][serial].setdefault("Air_Quality", {})
             account_dict["entities"]["sensor"][serial]["Air_Quality"][
                 sensor.unique_id
@@ -336,7 +350,7 @@ def lookup_device_info(account_dict, device_serial):
     return None
 
 
-class TemperatureSensor(SensorEntity, CoordinatorEntity):
+class TemperatureSensor(ChangeOnlyStateMixin, SensorEntity, CoordinatorEntity):
     """A temperature sensor reported by an Echo or an AIAQM endpoint."""
 
     _attr_has_entity_name = True
@@ -393,6 +407,10 @@ class TemperatureSensor(SensorEntity, CoordinatorEntity):
 
         _LOGGER.debug("Coordinator init: %s Temperature", self._device_name)
 
+    def _coordinator_state(self):
+        """Return the temperature and its unit to compare."""
+        return self._attr_native_value, self._attr_native_unit_of_measurement
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -445,7 +463,7 @@ AIR_QUALITY_TRANSLATION_KEYS = {
 }
 
 
-class AirQualitySensor(SensorEntity, CoordinatorEntity):
+class AirQualitySensor(ChangeOnlyStateMixin, SensorEntity, CoordinatorEntity):
     """An air quality sensor reported by an Amazon indoor air quality monitor."""
 
     _attr_has_entity_name = True
@@ -512,6 +530,10 @@ class AirQualitySensor(SensorEntity, CoordinatorEntity):
         self._instance = instance
         _LOGGER.debug("Coordinator init: %s %s", self._device_name, self._sensor_name)
 
+    def _coordinator_state(self):
+        """Return the air quality value to compare."""
+        return self._attr_native_value
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -601,6 +623,9 @@ class AlexaMediaNotificationSensor(SensorEntity):
         self._status: Optional[str] = None
         self._amz_id: Optional[str] = None
         self._version: Optional[str] = None
+        self._entry_cache: dict[tuple, tuple] = {}
+        self._by_id: dict = {}
+        self._upcoming: list = []
 
     def _coerce_datetime(self, value) -> Optional[datetime.datetime]:
         """Best-effort conversion of Alexa datetime-ish values to aware datetime."""
@@ -679,18 +704,23 @@ class AlexaMediaNotificationSensor(SensorEntity):
         return False
 
     def _select_next_alarm(self, now):
-        """Select next alarm, preferring future active alarms over skipped past ones."""
-        future_active = []
-        skipped_past = []
+        """Select next alarm, preferring future active alarms over skipped past ones.
 
-        for item in self._active:
-            when = self._coerce_datetime(item[1].get(self._sensor_property))
-            if when is not None and when > now:
-                future_active.append(item)
-            else:
-                skipped_past.append((item, when))
+        Alarms that are already past are popped off the upcoming heap, so each
+        one is only skipped once per rebuild.
+        """
+        upcoming = self._upcoming
+        while upcoming and upcoming[0][0] <= now:
+            heapq.heappop(upcoming)
+
+        skipped_past = []
+        if self._debug:
+            for item in self._active:
+                when = self._coerce_datetime(item[1].get(self._sensor_property))
+                if when is None or when <= now:
+                    skipped_past.append((item, when))
 
-        if self._debug and skipped_past:
+        if skipped_past:
             summary = [
                 {
                     "id": v.get("id"),
@@ -709,22 +739,96 @@ class AlexaMediaNotificationSensor(SensorEntity):
                 summary,
             )
 
+        if upcoming:
+            return upcoming[0][2][1]
+        return self._active[0][1] if self._active else None
+
+    def _entry_key(self, n_id, notification: dict) -> tuple:
+        """Return the cache key of a raw notification.
+
+        Alexa bumps ``version`` on edits; the raw trigger time and snooze time
+        are included because timers count down without a version change.
+        """
         return (
-            future_active[0][1]
-            if future_active
-            else (self._active[0][1] if self._active else None)
+            notification.get("id", n_id),
+            notification.get("version"),
+            notification.get("status"),
+            notification.get(self._sensor_property),
+            notification.get("snoozedToTime"),
         )
 
+    def _entry_recheck_time(self, item: dict) -> Optional[datetime.datetime]:
+        """Return when a normalized entry must be recomputed, or None if never.
+
+        Only snoozes and recurring alarms depend on the current time; both are
+        stable until ``now`` passes the time computed for them.
+        """
+        status = item.get("status")
+        if status == "SNOOZED":
+            return self._coerce_datetime(item.get("snoozedToTime"))
+        if status == "ON" and (item.get("rRuleData") or item.get("recurringPattern")):
+            return self._coerce_datetime(item.get(self._sensor_property)) or dt.now()
+        return None
+
+    def _normalize_entry(self, n_id, notification: dict) -> tuple:
+        """Return the normalized (n_id, notification) pair and its recheck time.
+
+        Works on a copy so the account-wide snapshot is never mutated.
+        """
+        value = (n_id, dict(notification))
+        value = self._fix_alarm_date_time(value)
+        value = self._normalize_alarm_snooze_state(value)
+        value = self._update_recurring_alarm(value)
+        return value, self._entry_recheck_time(value[1])
+
+    def _normalize_entries(self, now) -> bool:
+        """Normalize the raw notifications, reusing cached entries.
+
+        Returns True when any entry was added, removed or recomputed.
+        """
+        cache = {}
+        changed = False
+        for n_id, notification in (self._n_dict or {}).items():
+            key = self._entry_key(n_id, notification)
+            cached = self._entry_cache.get(key)
+            if cached is None or (cached[1] is not None and now >= cached[1]):
+                cached = self._normalize_entry(n_id, notification)
+                changed = True
+            cache[key] = cached
+        changed = changed or cache.keys() != self._entry_cache.keys()
+        self._entry_cache = cache
+        return changed
+
+    def _build_upcoming(self) -> None:
+        """Rebuild the heap of active alarms keyed by their trigger time."""
+        self._upcoming = []
+        if self._type != "Alarm":
+            return
+        for seq, item in enumerate(self._active):
+            when = self._coerce_datetime(item[1].get(self._sensor_property))
+            if when is not None:
+                self._upcoming.append((when, seq, item))
+        heapq.heapify(self._upcoming)
+
     def _process_raw_notifications(self):
-        # Build full list for this device/type
-        self._all = (
-            list(map(self._fix_alarm_date_time, self._n_dict.items()))
-            if self._n_dict
-            else []
-        )
-        self._all = list(map(self._normalize_alarm_snooze_state, self._all))
-        self._all = list(map(self._update_recurring_alarm, self._all))
-        self._all = sorted(self._all, key=lambda x: x[1][self._sensor_property])
+        now = dt.now()
+        # Previous "next" for change detection
+        self._prior_value = self._next if self._active else None
+
+        # Build full list for this device/type; unchanged entries are reused
+        if self._normalize_entries(now):
+            self._all = sorted(
+                (value for value, _ in self._entry_cache.values()),
+                key=lambda x: x[1][self._sensor_property],
+            )
+            self._by_id = {
+                value[1].get("id"): value[1] for value in reversed(self._all)
+            }
+            # Filter ACTIVE (ON / SNOOZED, excluding expired snoozes)
+            self._active = list(
+                filter(lambda item: self._is_active_notification(item, now), self._all)
+            )
+            self._build_upcoming()
 
         # DEBUG: log ALL notifications for this device/type
         if self._debug and self._all:
@@ -758,16 +862,6 @@ class AlexaMediaNotificationSensor(SensorEntity):
                 self._type,
             )
 
-        # Previous "next" for change detection
-        self._prior_value = self._next if self._active else None
-
-        now = dt.now()
-
-        # Filter ACTIVE (ON / SNOOZED, excluding expired snoozes)
-        self._active = list(
-            filter(lambda item: self._is_active_notification(item, now), self._all)
-        )
-
         if self._type == "Alarm":
             self._next = self._select_next_alarm(now)
         else:
@@ -808,10 +902,7 @@ class AlexaMediaNotificationSensor(SensorEntity):
             )
 
         # Track dismissal and schedule events (existing behavior)
-        alarm = next(
-            (alarm[1] for alarm in self._all if alarm[1].get("id") == self._amz_id),
-            None,
-        )
+        alarm = self._by_id.get(self._amz_id) if self._amz_id else None
         if alarm_just_dismissed(alarm, self._status, self._version):
             self._dismissed = dt.now().isoformat()
 
@@ -831,12 +922,20 @@ class AlexaMediaNotificationSensor(SensorEntity):
                     self,
                     dt.as_utc(self._attr_native_value) - dt.utcnow(),
                 )
-                self._tracker = async_track_point_in_utc_time(
-                    self.hass,
-                    self._trigger_event,
-                    dt.as_utc(self._attr_native_value),
+                self._tracker = self._schedule_trigger(
+                    dt.as_utc(self._attr_native_value)
                 )
 
+    def _schedule_trigger(self, when: datetime.datetime) -> Callable:
+        """Schedule _trigger_event on the account scheduler and return its cancel."""
+        scheduler = get_notification_scheduler(self.hass, self._account)
+        if scheduler is None:
+            return async_track_point_in_utc_time(self.hass, self._trigger_event, when)
+        return scheduler.schedule(
+            self.unique_id, when, self._trigger_event, label=self.entity_id
+        )
+
+    @callback
     def _trigger_event(self, time_date) -> None:
         _LOGGER.debug(
             "%s:Firing %s at %s",
@@ -844,7 +943,7 @@ class AlexaMediaNotificationSensor(SensorEntity):
             "alexa_media_notification_event",
             dt.as_local(time_date),
         )
-        self.hass.bus.fire(
+        self.hass.bus.async_fire(
             "alexa_media_notification_event",
             event_data={
                 "email": hide_email(self._account),
@@ -964,9 +1063,11 @@ class AlexaMediaNotificationSensor(SensorEntity):
             pass
         self._process_raw_notifications()
         # Register event handler on bus
-        self._listener = async_dispatcher_connect(
+        self._listener = connect_device_signals(
             self.hass,
-            f"{ALEXA_DOMAIN}_{hide_email(self._account)}"[0:32],
+            self._account,
+            "sensor",
+            self._client.device_serial_number,
             self._handle_event,
         )
         await self.async_update()
@@ -981,8 +1082,8 @@ class AlexaMediaNotificationSensor(SensorEntity):
     def _handle_event(self, event):
         """Handle events.
 
-        This will update PUSH_ACTIVITY, NOTIFICATION_UPDATE, or a global
-        notifications refresh event to see if the sensor should be updated.
+        This will update PUSH_ACTIVITY, NOTIFICATION_UPDATE, or a
+        notifications refresh event that names this sensor's type.
         """
         try:
             if not self.enabled:
@@ -990,10 +1091,15 @@ class AlexaMediaNotificationSensor(SensorEntity):
         except AttributeError:
             pass
 
-        # Global refresh: any time we rebuild the notifications snapshot
+        # Snapshot refresh: sent per serial with the changed types, or as a
+        # bare True to force every sensor to refresh
         if "notifications_refreshed" in event:
-            _LOGGER.debug("Force-refreshing notification sensor %s", self)
-            self.schedule_update_ha_state(True)
+            refreshed = event["notifications_refreshed"]
+            if not isinstance(refreshed, dict) or self._type in refreshed.get(
+                "types", ()
+            ):
+                _LOGGER.debug("Refreshing notification sensor %s", self)
+                self.schedule_update_ha_state(True)
             return
 
         if "notification_update" in event:
@@ -0,0 +1,117 @@
+"""Batched notify sequences for Alexa Media Player.
+
+Builds the operation nodes that alexapy's send_tts, send_mobilepush and
+send_dropin_notification queue for a single device, so a notify call can run
+them for every targeted device of an account in one parallel sequence request.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+OPERATION_NODE = "com.amazon.alexa.behaviors.model.OpaquePayloadOperationNode"
+PARALLEL_NODE = "com.amazon.alexa.behaviors.model.ParallelNode"
+DEFAULT_LOCALE = "en-US"
+
+
+def _customer_id(alexa: Any) -> str | None:
+    """Return the customer id alexapy would send for alexa."""
+    customer_id = getattr(alexa, "_customer_id", None)
+    if customer_id is None:
+        customer_id = getattr(getattr(alexa, "_login", None), "customer_id", None)
+    return customer_id
+
+
+def operation_node(alexa: Any, sequence: str, **payload: Any) -> dict[str, Any]:
+    """Return the node alexapy's send_sequence builds for alexa.
+
+    Payload values of None remove the key, and string values prefixed with
+    ``root_`` are moved to the node itself, as in send_sequence.
+    """
+    operation_payload: dict[str, Any] = {
+        "deviceType": alexa._device_type,  # pylint: disable=protected-access
+        "deviceSerialNumber": alexa.device_serial_number,
+        "locale": alexa._locale or DEFAULT_LOCALE,  # pylint: disable=protected-access
+        "customerId": _customer_id(alexa),
+    }
+    node: dict[str, Any] = {
+        "@type": OPERATION_NODE,
+        "type": sequence,
+        "operationPayload": operation_payload,
+    }
+    for key, value in payload.items():
+        if value is None:
+            operation_payload.pop(key, None)
+        elif isinstance(value, str) and value.startswith("root_"):
+            operation_payload.pop(key, None)
+            node[key] = value[5:]
+        else:
+            operation_payload[key] = value
+    return node
+
+
+def tts_node(alexa: Any, message: str, **_: Any) -> dict[str, Any]:
+    """Return the Alexa.Speak (or canned TTS) node for alexa."""
+    if message.startswith("alexa.cannedtts.speak"):
+        return operation_node(
+            alexa,
+            "Alexa.CannedTts.Speak",
+            cannedTtsStringId=message,
+            skillId="amzn1.ask.1p.saysomething",
+        )
+    return operation_node(
+        alexa,
+        "Alexa.Speak",
+        textToSpeak=message,
+        target={
+            "customerId": _customer_id(alexa),
+            "devices": alexa.alexa_api.process_targets(),
+        },
+        skillId="amzn1.ask.1p.saysomething",
+    )
+
+
+def mobilepush_node(
+    alexa: Any, message: str, title: str = "AlexaAPI Message", **_: Any
+) -> dict[str, Any]:
+    """Return the Alexa.Notifications.SendMobilePush node for alexa."""
+    return operation_node(
+        alexa,
+        "Alexa.Notifications.SendMobilePush",
+        notificationMessage=message,
+        alexaUrl="#v2/behaviors",
+        title=title,
+        skillId="amzn1.ask.1p.routines.messaging",
+    )
+
+
+def dropin_node(
+    alexa: Any, message: str, title: str = "AlexaAPI Dropin Notification", **_: Any
+) -> dict[str, Any]:
+    """Return the Alexa.Notifications.DropIn node for alexa."""
+    return operation_node(
+        alexa,
+        "Alexa.Notifications.DropIn",
+        notificationMessage=message,
+        alexaUrl="#v2/comms/conversation-list?showDropInDialog=true",
+        title=title,
+        skillId="root_amzn1.ask.1p.action.dropin",
+        deviceType=None,
+        deviceSerialNumber=None,
+        locale=None,
+    )
+
+
+# notify data.type -> builder of the node sent to one device
+BATCH_NODE_BUILDERS = {
+    "tts": tts_node,
+    "push": mobilepush_node,
+    "dropin_notification": dropin_node,
+}
+
+
+def parallel_sequence(nodes: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return a start node running nodes at the same time."""
+    if len(nodes) == 1:
+        return nodes[0]
+    return {"@type": PARALLEL_NODE, "nodesToExecute": list(nodes)}
@@ -0,0 +1,146 @@
+"""Per-account serial index for Alexa Media Player.
+
+Keeps the set of known device serials up to date as entities are created so
+push handling and polling can test membership without rebuilding lists.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SerialIndex:
+    """Incrementally maintained serial lookups for one Alexa account.
+
+    A serial is "known" when it belongs to a media player entity, to an app
+    device (appDeviceList) of such a player, or to an entity-backed device
+    such as an AIAQM sensor. Excluded devices are tracked separately.
+    """
+
+    def __init__(self, excluded: dict[str, Any] | None = None) -> None:
+        """Initialize an empty index.
+
+        Args:
+            excluded: Existing serial -> device mapping of excluded devices
+        """
+        self.excluded: dict[str, Any] = excluded if excluded is not None else {}
+        self._players: set[str] = set()
+        self._entity_backed: set[str] = set()
+        self._app_parents: dict[str, str] = {}
+        self._device_apps: dict[str, tuple[str, ...]] = {}
+
+    def __contains__(self, serial: object) -> bool:
+        """Return whether serial belongs to a known device."""
+        if serial in self._players or serial in self._entity_backed:
+            return True
+        parent = self._app_parents.get(serial)  # type: ignore[arg-type]
+        return parent is not None and parent in self._players
+
+    @property
+    def players(self) -> frozenset[str]:
+        """Return serials that have a media player entity."""
+        return frozenset(self._players)
+
+    def serials(self) -> set[str]:
+        """Return every known serial (players, their apps and entity-backed)."""
+        known = set(self._players) | self._entity_backed
+        known.update(
+            app for app, parent in self._app_parents.items() if parent in self._players
+        )
+        return known
+
+    def parent_of(self, serial: str) -> str | None:
+        """Return the parent serial of an app device serial, if any."""
+        return self._app_parents.get(serial)
+
+    def is_excluded(self, serial: str) -> bool:
+        """Return whether serial was excluded by include/exclude filters."""
+        return serial in self.excluded
+
+    def set_device(self, serial: str, device: dict[str, Any]) -> None:
+        """Record the app devices of a devices["media_player"] entry."""
+        apps = tuple(
+            app["serialNumber"]
+            for app in device.get("appDeviceList") or []
+            if isinstance(app, dict) and app.get("serialNumber")
+        )
+        if self._device_apps.get(serial) == apps:
+            return
+        for app in self._device_apps.pop(serial, ()):
+            if self._app_parents.get(app) == serial:
+                del self._app_parents[app]
+        if apps:
+            self._device_apps[serial] = apps
+            for app in apps:
+                self._app_parents[app] = serial
+
+    def add_player(self, serial: str, device: dict[str, Any] | None = None) -> None:
+        """Mark serial as having a media player entity."""
+        self._players.add(serial)
+        if device is not None:
+            self.set_device(serial, device)
+
+    def remove_player(self, serial: str) -> None:
+        """Remove the media player entity mark for serial."""
+        self._players.discard(serial)
+
+    def add_entity_backed(self, serial: str) -> None:
+        """Mark serial as backing non-media-player entities (e.g. AIAQM)."""
+        if isinstance(serial, str) and serial:
+            self._entity_backed.add(serial)
+
+    def remove_entity_backed(self, serial: str) -> None:
+        """Remove the entity-backed mark for serial."""
+        self._entity_backed.discard(serial)
+
+    def exclude(self, device: dict[str, Any]) -> None:
+        """Record a filtered device and its app devices as excluded."""
+        for app in device.get("appDeviceList") or []:
+            if isinstance(app, dict) and app.get("serialNumber"):
+                self.excluded[app["serialNumber"]] = device
+        self.excluded[device["serialNumber"]] = device
+
+    def rebuild(self, account: dict[str, Any]) -> None:
+        """Rebuild the index from a legacy account dict."""
+        self._players.clear()
+        self._entity_backed.clear()
+        self._app_parents.clear()
+        self._device_apps.clear()
+        entities = account.get("entities") or {}
+        devices = (account.get("devices") or {}).get("media_player") or {}
+        for serial, device in devices.items():
+            if isinstance(device, dict):
+                self.set_device(serial, device)
+        for serial in entities.get("media_player") or {}:
+            self._players.add(serial)
+        sensors = entities.get("sensor")
+        if isinstance(sensors, dict):
+            for serial in sensors:
+                self.add_entity_backed(serial)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get index statistics."""
+        return {
+            "players": len(self._players),
+            "app_devices": len(self._app_parents),
+            "entity_backed": len(self._entity_backed),
+            "excluded": len(self.excluded),
+        }
+
+
+def get_serial_index(account: dict[str, Any]) -> SerialIndex:
+    """Return the serial index for an account dict, creating it if needed.
+
+    Accounts created before the index existed are rebuilt once from their
+    entities and devices.
+    """
+    index = account.get("serial_index")
+    if not isinstance(index, SerialIndex):
+        index = SerialIndex(account.setdefault("excluded", {}))
+        index.rebuild(account)
+        account["serial_index"] = index
+        _LOGGER.debug("Built serial index: %s", index.get_stats())
+    return index
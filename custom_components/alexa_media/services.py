@@ -31,6 +31,7 @@ from .const import (
     SERVICE_UPDATE_LAST_CALLED,
 )
 from .helpers import _catch_login_errors, report_relogin_required, safe_get
+from .rate_limiter import RequestPriority, limited_call
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -319,8 +320,14 @@ class AlexaMediaServices:
         async def _collect_history_for_account(login_obj) -> None:
             """Collect history entries for a single account matching the target device."""
             # Get the history records. Input: time_from, time_to (both None here).
-            history_data = await AlexaAPI.get_customer_history_records(
-                login_obj, None, None
+            history_data = await limited_call(
+                self.hass,
+                login_obj,
+                RequestPriority.USER,
+                AlexaAPI.get_customer_history_records,
+                login_obj,
+                None,
+                None,
             )
             if not history_data:
                 return
@@ -0,0 +1,153 @@
+"""Persistent device snapshot for warm restarts of Alexa Media Player.
+
+Keeps the last good devices list, parsed network entities and auth info in
+``.storage`` so platforms can create entities at boot before the Alexa API
+has answered; the first live poll then reconciles against fresh data.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+from .coordinator import device_fingerprint
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def snapshot_signature(
+    devices: list[dict[str, Any]], entities: dict[str, list[dict[str, Any]]]
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Return the device serials and network entity ids a snapshot describes.
+
+    Two snapshots with the same signature create the same entities, so only
+    a signature change requires reloading platforms.
+    """
+    serials = frozenset(
+        device["serialNumber"]
+        for device in devices or []
+        if isinstance(device, dict) and device.get("serialNumber")
+    )
+    entity_ids = frozenset(
+        entity["id"]
+        for entries in (entities or {}).values()
+        if isinstance(entries, list)
+        for entity in entries
+        if isinstance(entity, dict) and entity.get("id")
+    )
+    return serials, entity_ids
+
+
+class DeviceSnapshot:
+    """Last good device data of one config entry, persisted with Store."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize snapshot.
+
+        Args:
+            hass: Home Assistant instance
+            entry_id: Config entry the snapshot belongs to
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._data: dict[str, Any] = {"devices": [], "entities": {}, "auth_info": None}
+        self._fingerprint: str | None = None
+
+    @property
+    def devices(self) -> list[dict[str, Any]]:
+        """Return the snapshot devices list (get_devices output)."""
+        return self._data["devices"]
+
+    @property
+    def entities(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the snapshot parse_alexa_entities output."""
+        return self._data["entities"]
+
+    @property
+    def auth_info(self) -> dict[str, Any] | None:
+        """Return the snapshot auth info."""
+        return self._data["auth_info"]
+
+    @property
+    def signature(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Return the serials and entity ids described by the snapshot."""
+        return snapshot_signature(self.devices, self.entities)
+
+    async def async_load(self) -> bool:
+        """Load the stored snapshot.
+
+        Returns:
+            True if a usable snapshot with at least one device was loaded
+        """
+        try:
+            data = await self._store.async_load()
+        except (HomeAssistantError, ValueError) as err:
+            _LOGGER.debug("Ignoring unreadable device snapshot: %s", err)
+            return False
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("devices"), list)
+            or not data["devices"]
+            or not isinstance(data.get("entities"), dict)
+            or not isinstance(data.get("auth_info"), (dict, type(None)))
+        ):
+            return False
+        self._data = {
+            "devices": data["devices"],
+            "entities": data["entities"],
+            "auth_info": data["auth_info"],
+        }
+        self._fingerprint = device_fingerprint(self._data)
+        _LOGGER.debug(
+            "Loaded device snapshot with %s devices saved %.0fs ago",
+            len(self.devices),
+            time.time() - data.get("saved_at", time.time()),
+        )
+        return True
+
+    def async_update(
+        self,
+        devices: list[dict[str, Any]] | None = None,
+        entities: dict[str, list[dict[str, Any]]] | None = None,
+        auth_info: dict[str, Any] | None = None,
+    ) -> bool:
+        """Record fresh API data and schedule a save if anything changed.
+
+        Parts passed as None keep their previous value.
+
+        Returns:
+            True if the snapshot changed
+        """
+        if devices is not None:
+            self._data["devices"] = devices
+        if entities is not None:
+            self._data["entities"] = entities
+        if auth_info is not None:
+            self._data["auth_info"] = auth_info
+        fingerprint = device_fingerprint(self._data)
+        if fingerprint is not None and fingerprint == self._fingerprint:
+            return False
+        self._fingerprint = fingerprint
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+        return True
+
+    async def async_flush(self) -> None:
+        """Write the snapshot now instead of waiting for the delayed save."""
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data written to storage."""
+        return {**self._data, "saved_at": time.time()}
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
@@ -12,7 +12,6 @@ import logging
 
 from alexapy import AlexaAPI
 from homeassistant.exceptions import ConfigEntryNotReady, NoEntitySpecifiedError
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -28,7 +27,9 @@ from . import (
 from .alexa_entity import parse_power_from_coordinator
 from .alexa_media import AlexaMedia
 from .const import CONF_EXTENDED_ENTITY_DISCOVERY
-from .helpers import _catch_login_errors, add_devices, safe_get
+from .coordinator import ChangeOnlyStateMixin
+from .helpers import _catch_login_errors, add_devices, connect_device_signals, safe_get
+from .rate_limiter import RequestPriority, limited_call
 
 try:
     from homeassistant.components.switch import SwitchEntity as SwitchDevice
@@ -172,6 +173,9 @@ class AlexaMediaSwitch(SwitchDevice, AlexaMedia):
     """Representation of a Alexa Media switch."""
 
     _attr_has_entity_name = True
+    # Only switches that consume global events (e.g. dnd_update) need the
+    # account-wide signal; the rest listen on their device serial alone.
+    _account_wide_events = False
 
     def __init__(
         self,
@@ -196,10 +200,13 @@ class AlexaMediaSwitch(SwitchDevice, AlexaMedia):
         except AttributeError:
             pass
         # Register event handler on bus
-        self._listener = async_dispatcher_connect(
+        self._listener = connect_device_signals(
             self.hass,
-            f"{ALEXA_DOMAIN}_{hide_email(self.email)}"[0:32],
+            self.email,
+            "switch",
+            self._client.device_serial_number,
             self._handle_event,
+            account_wide=self._account_wide_events,
         )
 
     async def async_will_remove_from_hass(self):
@@ -331,6 +338,7 @@ class DNDSwitch(AlexaMediaSwitch):
     """Representation of a Alexa Media Do Not Disturb switch."""
 
     _attr_translation_key = "do_not_disturb"
+    _account_wide_events = True
 
     def __init__(self, client):
         """Initialize the Alexa Switch."""
@@ -417,7 +425,7 @@ class RepeatSwitch(AlexaMediaSwitch):
         return EntityCategory.CONFIG
 
 
-class SmartSwitch(CoordinatorEntity, SwitchDevice):
+class SmartSwitch(ChangeOnlyStateMixin, CoordinatorEntity, SwitchDevice):
     def __init__(self, coordinator, login, details):
         """Initialize alexa light entity."""
         super().__init__(coordinator)
@@ -461,8 +469,16 @@ class SmartSwitch(CoordinatorEntity, SwitchDevice):
         )
         return not last_refresh_success
 
+    def _coordinator_state(self):
+        """Return the power state and assumed state to compare."""
+        return self.is_on, self.assumed_state
+
     async def _set_state(self, power_on: bool) -> None:
-        response = await AlexaAPI.set_light_state(
+        response = await limited_call(
+            self.hass,
+            self._login,
+            RequestPriority.USER,
+            AlexaAPI.set_light_state,
             self._login,
             self.alexa_entity_id,
             power_on,
@@ -484,6 +500,7 @@ class SmartSwitch(CoordinatorEntity, SwitchDevice):
         self._requested_state_at = datetime.datetime.now(
             datetime.timezone.utc
         )  # must be set last so that previous getters work properly
+        self._reset_coordinator_state()
         self.schedule_update_ha_state()
 
         # Confirm quickly, but debounce to avoid spamming across multiple entities.
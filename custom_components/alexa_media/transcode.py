@@ -0,0 +1,329 @@
+"""Cached announcement audio transcoding for Alexa Media Player.
+
+Converts TTS audio into the MP3 format Alexa's SSML <audio> tag accepts with
+an ffmpeg subprocess that never blocks the event loop. Results are stored in
+UPLOAD_PATH under a hash of the source and the encoder settings, so repeated
+announcements are served from disk, concurrent requests for the same audio
+share one conversion, and old files are evicted by age and total size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import Any
+
+from aiohttp import ClientError
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    DATA_ALEXAMEDIA,
+    TRANSCODE_CACHE_MAX_AGE,
+    TRANSCODE_CACHE_MAX_BYTES,
+    TRANSCODE_TIMEOUT,
+    UPLOAD_PATH,
+)
+from .exceptions import TranscodeException
+
+_LOGGER = logging.getLogger(__name__)
+
+# Encoder settings Alexa accepts for <audio> in SSML
+TRANSCODE_ARGS = (
+    "-ac",
+    "2",
+    "-codec:a",
+    "libmp3lame",
+    "-b:a",
+    "48k",
+    "-ar",
+    "24000",
+    "-write_xing",
+    "0",
+)
+
+# Files in UPLOAD_PATH managed by the cache: hashed outputs and the
+# <name>_input.mp3 / <name>_output.mp3 files of earlier versions.
+_CACHE_FILE = re.compile(r"^(?:[0-9a-f]{32}|.+_input|.+_output)\.mp3$")
+
+
+def cache_key(source: str, args: tuple[str, ...] = TRANSCODE_ARGS) -> str:
+    """Return the cache key of source converted with args."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(source.encode())
+    digest.update(b"\0")
+    digest.update("\0".join(args).encode())
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A file in the transcode cache."""
+
+    name: str
+    size: int
+    last_used: float
+
+
+def _scan_directory(directory: str) -> list[tuple[str, int, float]]:
+    """Create directory and return (name, size, mtime) of its cache files."""
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and _CACHE_FILE.match(entry.name):
+                stat = entry.stat()
+                files.append((entry.name, stat.st_size, stat.st_mtime))
+    files.sort(key=lambda item: item[2])
+    return files
+
+
+def _finalize(temp_path: str, path: str) -> int:
+    """Move a finished conversion into place and return its size."""
+    os.replace(temp_path, path)
+    return os.path.getsize(path)
+
+
+def _touch(path: str) -> bool:
+    """Mark a cached file as used; return False if it no longer exists."""
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _remove_files(paths: list[str]) -> None:
+    """Delete paths, ignoring files that are already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class AudioTranscoder:
+    """Content-addressed cache of transcoded announcement audio."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        max_bytes: int = TRANSCODE_CACHE_MAX_BYTES,
+        max_age: float = TRANSCODE_CACHE_MAX_AGE,
+        timeout: float = TRANSCODE_TIMEOUT,
+        args: tuple[str, ...] = TRANSCODE_ARGS,
+    ) -> None:
+        """Initialize transcoder.
+
+        Args:
+            hass: Home Assistant instance
+            directory: Folder the converted files are written to
+            max_bytes: Total size of cached files before the least recently
+                used are deleted
+            max_age: Seconds a file may go unused before it is deleted
+            timeout: Seconds allowed for downloading and converting a file
+            args: ffmpeg output options
+        """
+        self._hass = hass
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._timeout = timeout
+        self._args = args
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._loaded: asyncio.Future[None] | None = None
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._deduplicated = 0
+        self._transcodes = 0
+        self._failures = 0
+        self._evictions = 0
+        self._download_time = 0.0
+        self._transcode_time = 0.0
+        self._transcode_max = 0.0
+
+    async def async_get(self, source: str, url: str) -> str:
+        """Return the file name of source converted for Alexa.
+
+        source identifies the audio (such as the TTS media_id) and url is
+        where it can be downloaded. Raises TranscodeException on failure.
+        """
+        await self._async_load()
+        key = cache_key(source, self._args)
+        if (entry := self._entries.get(key)) is not None:
+            # The mtime is the last use after a restart, so refresh it too.
+            path = os.path.join(self._directory, entry.name)
+            touched = await self._hass.async_add_executor_job(_touch, path)
+            current = self._entries.get(key) is entry
+            if touched and current:
+                self._hits += 1
+                entry.last_used = time.time()
+                self._entries.move_to_end(key)
+                return entry.name
+            # Deleted from disk, or evicted while touching: convert again.
+            if current:
+                _LOGGER.debug("Cached %s was deleted; converting again", entry.name)
+                del self._entries[key]
+                self._bytes -= entry.size
+        if (pending := self._inflight.get(key)) is not None:
+            self._deduplicated += 1
+            return await asyncio.shield(pending)
+        self._misses += 1
+        pending = self._inflight[key] = asyncio.ensure_future(
+            self._async_transcode(key, url)
+        )
+        pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _async_load(self) -> None:
+        """Index the files already in the cache folder once."""
+        if self._loaded is None:
+            self._loaded = asyncio.ensure_future(self._async_scan())
+        await asyncio.shield(self._loaded)
+
+    async def _async_scan(self) -> None:
+        """Add the files in the cache folder and evict stale ones."""
+        files = await self._hass.async_add_executor_job(
+            _scan_directory, self._directory
+        )
+        for name, size, mtime in files:
+            key = name[:-4]
+            self._entries[key] = _CacheEntry(name, size, mtime)
+            self._bytes += size
+        await self._async_evict()
+
+    async def _async_download(self, url: str) -> bytes:
+        """Return the source audio."""
+        session = async_get_clientsession(self._hass)
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def _async_transcode(self, key: str, url: str) -> str:
+        """Download url, convert it and add the result to the cache."""
+        name = f"{key}.mp3"
+        path = os.path.join(self._directory, name)
+        temp_path = f"{path}.part"
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(self._timeout):
+                audio = await self._async_download(url)
+                downloaded = time.monotonic()
+                await self._async_run_ffmpeg(audio, temp_path)
+            size = await self._hass.async_add_executor_job(_finalize, temp_path, path)
+        except (TimeoutError, ClientError, OSError, TranscodeException) as ex:
+            self._failures += 1
+            await self._hass.async_add_executor_job(_remove_files, [temp_path])
+            if isinstance(ex, TranscodeException):
+                raise
+            raise TranscodeException(
+                f"Unable to convert {url}: {type(ex).__name__}: {ex}"
+            ) from ex
+        elapsed = time.monotonic() - downloaded
+        self._transcodes += 1
+        self._download_time += downloaded - start
+        self._transcode_time += elapsed
+        self._transcode_max = max(self._transcode_max, elapsed)
+        _LOGGER.debug(
+            "Converted %s to %s in %.3fs (download %.3fs)",
+            url,
+            name,
+            elapsed,
+            downloaded - start,
+        )
+        self._entries[key] = _CacheEntry(name, size, time.time())
+        self._bytes += size
+        await self._async_evict(keep=key)
+        return name
+
+    async def _async_run_ffmpeg(self, audio: bytes, output_path: str) -> None:
+        """Convert audio to output_path with ffmpeg."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                "-i",
+                "pipe:0",
+                *self._args,
+                "-f",
+                "mp3",
+                output_path,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as ex:
+            raise TranscodeException("ffmpeg is not installed") from ex
+        try:
+            _, stderr = await process.communicate(audio)
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+        if process.returncode != 0:
+            raise TranscodeException(
+                f"ffmpeg exited with {process.returncode}: "
+                f"{stderr.decode(errors='replace').strip()[-200:]}"
+            )
+
+    async def _async_evict(self, keep: str | None = None) -> None:
+        """Delete files unused for max_age, then the oldest beyond max_bytes."""
+        expired = time.time() - self._max_age
+        victims = []
+        for key, entry in list(self._entries.items()):
+            if key == keep:
+                continue
+            if entry.last_used < expired or self._bytes > self._max_bytes:
+                del self._entries[key]
+                self._bytes -= entry.size
+                victims.append(os.path.join(self._directory, entry.name))
+        if victims:
+            self._evictions += len(victims)
+            await self._hass.async_add_executor_job(_remove_files, victims)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache and timing statistics."""
+        return {
+            "files": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "deduplicated": self._deduplicated,
+            "transcodes": self._transcodes,
+            "failures": self._failures,
+            "evictions": self._evictions,
+            "in_progress": len(self._inflight),
+            "avg_download_time": (
+                round(self._download_time / self._transcodes, 3)
+                if self._transcodes
+                else 0
+            ),
+            "avg_transcode_time": (
+                round(self._transcode_time / self._transcodes, 3)
+                if self._transcodes
+                else 0
+            ),
+            "max_transcode_time": round(self._transcode_max, 3),
+        }
+
+
+def get_transcoder(hass: HomeAssistant) -> AudioTranscoder:
+    """Return the shared transcoder, creating it if needed."""
+    domain_data = hass.data.setdefault(DATA_ALEXAMEDIA, {})
+    transcoder = domain_data.get("transcoder")
+    if transcoder is None:
+        transcoder = domain_data["transcoder"] = AudioTranscoder(
+            hass, hass.config.path(UPLOAD_PATH)
+        )
+    return transcoder
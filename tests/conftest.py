@@ -0,0 +1,49 @@
+"""Shared pytest configuration for the Alexa Media Player tests."""
+
+from collections.abc import Callable
+import time
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the option enabling wall-clock benchmarks."""
+    parser.addoption(
+        "--run-perf",
+        action="store_true",
+        default=False,
+        help="run wall-clock benchmarks marked with @pytest.mark.perf",
+    )
+
+
+def pytest_configure(config):
+    """Register the perf marker."""
+    config.addinivalue_line(
+        "markers", "perf: wall-clock benchmark, skipped unless --run-perf is given"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip perf tests unless they were asked for."""
+    if config.getoption("--run-perf"):
+        return
+    skip_perf = pytest.mark.skip(reason="wall-clock benchmark; use --run-perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture
+def best_of() -> Callable[..., float]:
+    """Return a helper timing the fastest of several runs of a callable."""
+
+    def _best_of(func: Callable[[], object], repeats: int = 3, number: int = 1):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            best = min(best, time.perf_counter() - start)
+        return best / number
+
+    return _best_of
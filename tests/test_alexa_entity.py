@@ -1,13 +1,24 @@
 """Test the alexa_entity module utility functions."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from alexapy import AlexapyLoginError
+from alexapy.errors import AlexapyTooManyRequestsError
 import pytest
 
 from custom_components.alexa_media.alexa_entity import (
+    CapabilityStateIndex,
+    get_entity_data,
     has_capability,
     is_hue_v1,
     is_known_ha_bridge,
     is_local,
     is_skill,
+    parse_value_from_coordinator,
 )
 
 
@@ -297,3 +308,319 @@ class TestIsLocal:
         appliance = {"applianceId": "invalid_pattern"}
         result = is_local(appliance)
         assert result is False
+
+
+def make_entity_data(sample_time: datetime) -> dict:
+    """Return entity data with power, brightness and two range instances."""
+    sampled = sample_time.isoformat()
+    return {
+        "LIGHT1": [
+            {
+                "namespace": "Alexa.PowerController",
+                "name": "powerState",
+                "value": "ON",
+                "timeOfSample": sampled,
+            },
+            {
+                "namespace": "Alexa.BrightnessController",
+                "name": "brightness",
+                "value": 42,
+                "timeOfSample": "not a date",
+            },
+        ],
+        "AQM1": [
+            {
+                "namespace": "Alexa.RangeController",
+                "name": "rangeValue",
+                "instance": 4,
+                "value": 10,
+                "timeOfSample": sampled,
+            },
+            {
+                "namespace": "Alexa.RangeController",
+                "name": "rangeValue",
+                "instance": "5",
+                "value": 20,
+            },
+        ],
+    }
+
+
+class TestCapabilityStateIndex:
+    """Test the indexed capability states used by parse_value_from_coordinator."""
+
+    def test_lookup_by_instance(self):
+        """Test lookups match instances as strings and None matches all."""
+        index = CapabilityStateIndex(make_entity_data(datetime.now(timezone.utc)))
+
+        assert [
+            s["value"]
+            for s, _ in index.lookup("AQM1", "Alexa.RangeController", "rangeValue", "4")
+        ] == [10]
+        assert [
+            s["value"]
+            for s, _ in index.lookup("AQM1", "Alexa.RangeController", "rangeValue", 5)
+        ] == [20]
+        assert [
+            s["value"]
+            for s, _ in index.lookup("AQM1", "Alexa.RangeController", "rangeValue")
+        ] == [10, 20]
+        assert index.lookup("AQM1", "Alexa.RangeController", "rangeValue", "6") == []
+        assert index.lookup("MISSING", "Alexa.PowerController", "powerState") == []
+
+    def test_time_of_sample_is_pre_parsed(self):
+        """Test timeOfSample is parsed once when the index is built."""
+        sampled = datetime.now(timezone.utc)
+        index = CapabilityStateIndex(make_entity_data(sampled))
+
+        ((_, power_time),) = index.lookup(
+            "LIGHT1", "Alexa.PowerController", "powerState"
+        )
+        ((_, brightness_time),) = index.lookup(
+            "LIGHT1", "Alexa.BrightnessController", "brightness"
+        )
+        assert power_time == sampled
+        assert brightness_time is None
+
+    def test_behaves_like_entity_data(self):
+        """Test the index is still the plain entity id mapping."""
+        data = make_entity_data(datetime.now(timezone.utc))
+        index = CapabilityStateIndex(data)
+        assert index == data
+        assert "LIGHT1" in index
+        assert not CapabilityStateIndex()
+
+    @pytest.mark.parametrize(
+        ("entity_id", "namespace", "name", "instance", "since_offset"),
+        [
+            ("LIGHT1", "Alexa.PowerController", "powerState", None, None),
+            ("LIGHT1", "Alexa.PowerController", "powerState", None, -5),
+            ("LIGHT1", "Alexa.PowerController", "powerState", None, 5),
+            ("LIGHT1", "Alexa.PowerController", "powerState", None, -60),
+            ("LIGHT1", "Alexa.BrightnessController", "brightness", None, -5),
+            ("LIGHT1", "Alexa.ColorController", "color", None, None),
+            ("AQM1", "Alexa.RangeController", "rangeValue", "4", -5),
+            ("AQM1", "Alexa.RangeController", "rangeValue", "5", None),
+            ("AQM1", "Alexa.RangeController", "rangeValue", None, None),
+            ("MISSING", "Alexa.PowerController", "powerState", None, None),
+        ],
+    )
+    def test_parse_value_matches_linear_scan(
+        self, entity_id, namespace, name, instance, since_offset
+    ):
+        """Test indexed and plain coordinator data give the same values."""
+        now = datetime.now(timezone.utc)
+        data = make_entity_data(now)
+        since = None if since_offset is None else now + timedelta(seconds=since_offset)
+
+        results = [
+            parse_value_from_coordinator(
+                SimpleNamespace(data=coordinator_data),
+                entity_id,
+                namespace,
+                name,
+                since=since,
+                instance=instance,
+            )
+            for coordinator_data in (data, CapabilityStateIndex(data))
+        ]
+        assert results[0] == results[1]
+
+    def test_parse_value_does_not_reparse_indexed_samples(self):
+        """Test property reads from the index never parse timeOfSample."""
+        now = datetime.now(timezone.utc)
+        coordinator = SimpleNamespace(data=CapabilityStateIndex(make_entity_data(now)))
+        with patch(
+            "custom_components.alexa_media.alexa_entity._parse_time_of_sample",
+            side_effect=AssertionError("re-parsed"),
+        ):
+            value = parse_value_from_coordinator(
+                coordinator,
+                "LIGHT1",
+                "Alexa.PowerController",
+                "powerState",
+                since=now - timedelta(seconds=1),
+            )
+        assert value == "ON"
+
+    @pytest.mark.asyncio
+    async def test_get_entity_data_returns_index(self):
+        """Test get_entity_data builds the index from the API response."""
+        cap_state = {"namespace": "Alexa.PowerController", "name": "powerState"}
+        response = {
+            "deviceStates": [
+                {
+                    "entity": {"entityId": "LIGHT1"},
+                    "capabilityStates": [json.dumps(cap_state)],
+                }
+            ]
+        }
+        with patch(
+            "custom_components.alexa_media.alexa_entity.AlexaAPI.get_entity_state",
+            AsyncMock(return_value=response),
+        ):
+            data = await get_entity_data(object(), ["LIGHT1"])
+
+        assert isinstance(data, CapabilityStateIndex)
+        assert data == {"LIGHT1": [cap_state]}
+        assert data.lookup("LIGHT1", "Alexa.PowerController", "powerState")
+
+
+def entity_state_response(entity_ids):
+    """Return a get_entity_state response with one power state per entity."""
+    return {
+        "deviceStates": [
+            {
+                "entity": {"entityId": entity_id},
+                "capabilityStates": [
+                    json.dumps(
+                        {
+                            "namespace": "Alexa.PowerController",
+                            "name": "powerState",
+                            "value": entity_id,
+                        }
+                    )
+                ],
+            }
+            for entity_id in entity_ids
+        ]
+    }
+
+
+GET_ENTITY_STATE = (
+    "custom_components.alexa_media.alexa_entity.AlexaAPI.get_entity_state"
+)
+
+
+class TestChunkedGetEntityData:
+    """Test chunked, concurrent entity state requests."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_chunked_and_bounded(self):
+        """Test chunks respect the size and concurrency limits and are merged."""
+        in_flight = 0
+        peak = 0
+        requested = []
+
+        async def get_entity_state(_login, entity_ids):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            requested.append(list(entity_ids))
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return entity_state_response(entity_ids)
+
+        entity_ids = [f"E{i}" for i in range(10)]
+        with patch(GET_ENTITY_STATE, side_effect=get_entity_state):
+            data = await get_entity_data(
+                object(), entity_ids, chunk_size=3, concurrency=2
+            )
+
+        assert sorted(len(chunk) for chunk in requested) == [1, 3, 3, 3]
+        assert peak == 2
+        assert set(data) == set(entity_ids)
+        assert data.lookup("E9", "Alexa.PowerController", "powerState")
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_keeps_previous_states(self):
+        """Test a failing or malformed chunk does not discard the others."""
+
+        async def get_entity_state(_login, entity_ids):
+            if "E0" in entity_ids:
+                raise RuntimeError("boom")
+            if "E2" in entity_ids:
+                return {
+                    "deviceStates": [
+                        {"entity": {"entityId": "E2"}, "capabilityStates": ["{"]}
+                    ]
+                }
+            return entity_state_response(entity_ids)
+
+        previous = {"E0": [{"value": "old"}], "E2": [{"value": "older"}]}
+        with patch(GET_ENTITY_STATE, side_effect=get_entity_state):
+            data = await get_entity_data(
+                object(), ["E0", "E1", "E2"], chunk_size=1, previous=previous
+            )
+
+        assert data["E0"] == [{"value": "old"}]
+        assert data["E1"][0]["value"] == "E1"
+        assert data["E2"] == [{"value": "older"}]
+
+    @pytest.mark.asyncio
+    async def test_slow_chunk_times_out_alone(self):
+        """Test a chunk exceeding the timeout is dropped without stalling."""
+
+        async def get_entity_state(_login, entity_ids):
+            if "E0" in entity_ids:
+                await asyncio.sleep(10)
+            return entity_state_response(entity_ids)
+
+        with patch(GET_ENTITY_STATE, side_effect=get_entity_state):
+            data = await get_entity_data(
+                object(), ["E0", "E1"], chunk_size=1, timeout=0.01
+            )
+
+        assert set(data) == {"E1"}
+
+    @pytest.mark.asyncio
+    async def test_all_chunks_failing_raises(self):
+        """Test the error is raised when no chunk succeeded."""
+        with patch(GET_ENTITY_STATE, side_effect=RuntimeError("down")):
+            with pytest.raises(RuntimeError):
+                await get_entity_data(object(), ["E0", "E1"], chunk_size=1)
+
+    @pytest.mark.asyncio
+    async def test_login_error_is_raised(self):
+        """Test an expired login is never hidden by partial results."""
+
+        async def get_entity_state(_login, entity_ids):
+            if "E0" in entity_ids:
+                raise AlexapyLoginError("expired")
+            return entity_state_response(entity_ids)
+
+        with patch(GET_ENTITY_STATE, side_effect=get_entity_state):
+            with pytest.raises(AlexapyLoginError):
+                await get_entity_data(object(), ["E0", "E1"], chunk_size=1)
+
+    @pytest.mark.asyncio
+    async def test_each_chunk_goes_through_rate_limiter(self):
+        """Test every chunk takes its own token from the account limiter."""
+        hass = MagicMock()
+        hass.data = {"alexa_media": {}}
+        login = MagicMock(email="user@example.com", url="amazon.com")
+
+        with patch(
+            GET_ENTITY_STATE,
+            side_effect=lambda _login, entity_ids: entity_state_response(entity_ids),
+        ):
+            data = await get_entity_data(
+                login, ["E0", "E1", "E2"], chunk_size=1, hass=hass
+            )
+
+        limiter = hass.data["alexa_media"]["rate_limiters"]["user@example.com"]
+        assert limiter.get_stats()["priorities"]["poll"]["requests"] == 3
+        assert set(data) == {"E0", "E1", "E2"}
+        limiter.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_chunk_is_raised_and_reported(self):
+        """Test a 429 on one chunk pauses the limiter and reaches the caller."""
+        hass = MagicMock()
+        hass.data = {"alexa_media": {}}
+        login = MagicMock(email="user@example.com", url="amazon.com")
+
+        async def get_entity_state(_login, entity_ids):
+            if "E0" in entity_ids:
+                raise AlexapyTooManyRequestsError("429")
+            return entity_state_response(entity_ids)
+
+        with patch(GET_ENTITY_STATE, side_effect=get_entity_state):
+            with pytest.raises(AlexapyTooManyRequestsError):
+                await get_entity_data(
+                    login, ["E0"], chunk_size=1, hass=hass, previous={"E0": []}
+                )
+
+        limiter = hass.data["alexa_media"]["rate_limiters"]["user@example.com"]
+        assert limiter.get_stats()["rate_limited"] == 1
+        limiter.close()
@@ -0,0 +1,419 @@
+"""Tests for the Alexa Media coordinator helpers."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from custom_components.alexa_media.binary_sensor import AlexaContact
+from custom_components.alexa_media.coordinator import (
+    AlexaMediaCoordinator,
+    ChangeOnlyStateMixin,
+    FetchScheduler,
+    PollIntervalController,
+    device_fingerprint,
+)
+from custom_components.alexa_media.metrics import AlexaMetrics
+
+
+def make_coordinator() -> AlexaMediaCoordinator:
+    """Return a coordinator without running DataUpdateCoordinator setup."""
+    coordinator = AlexaMediaCoordinator.__new__(AlexaMediaCoordinator)
+    coordinator._device_fingerprints = {}  # pylint: disable=protected-access
+    return coordinator
+
+
+def make_device(**overrides) -> dict:
+    """Return a device dict as merged by async_update_data."""
+    device = {
+        "serialNumber": "SERIAL1",
+        "accountName": "Kitchen",
+        "online": True,
+        "bluetooth_state": {"pairedDeviceList": []},
+        "locale": "en-US",
+        "timeZoneId": "UTC",
+        "dnd": False,
+        "auth_info": {"customerId": "C1"},
+    }
+    device.update(overrides)
+    return device
+
+
+# =============================================================================
+# Tests for device fingerprints
+# =============================================================================
+
+
+def test_device_fingerprint_ignores_key_order():
+    """Test equal dicts produce the same fingerprint regardless of order."""
+    device = make_device()
+    reordered = dict(reversed(list(device.items())))
+    assert device_fingerprint(device) == device_fingerprint(reordered)
+
+
+def test_device_fingerprint_includes_extra():
+    """Test extra context changes the fingerprint."""
+    device = make_device()
+    assert device_fingerprint(device, ("SERIAL1", 1)) != device_fingerprint(
+        device, ("SERIAL1", 2)
+    )
+
+
+def test_device_fingerprint_unserializable_keys():
+    """Test data that cannot be serialized returns None."""
+    assert device_fingerprint({1: "a", "b": 2}) is None
+
+
+def test_device_changed_reports_each_change_once():
+    """Test unchanged devices are skipped and changes are applied once."""
+    coordinator = make_coordinator()
+
+    assert coordinator.device_changed("SERIAL1", make_device())
+    assert not coordinator.device_changed("SERIAL1", make_device())
+    assert coordinator.device_changed("SERIAL1", make_device(dnd=True))
+    assert not coordinator.device_changed("SERIAL1", make_device(dnd=True))
+
+
+def test_device_changed_tracks_merged_fragments():
+    """Test changes in merged bluetooth data are detected."""
+    coordinator = make_coordinator()
+    coordinator.device_changed("SERIAL1", make_device())
+
+    changed = make_device(bluetooth_state={"pairedDeviceList": [{"address": "a"}]})
+    assert coordinator.device_changed("SERIAL1", changed)
+
+
+def test_device_changed_when_push_flips_availability():
+    """Test an availability change from push forces a refresh of the device."""
+    coordinator = make_coordinator()
+    coordinator.device_changed("SERIAL1", make_device(), 1, None, False)
+    assert not coordinator.device_changed("SERIAL1", make_device(), 1, None, False)
+
+    # A push event marked the entity available while the json still says offline
+    assert coordinator.device_changed("SERIAL1", make_device(), 1, None, True)
+
+
+def test_forget_device_forces_next_refresh():
+    """Test forgetting a device makes the next check report a change."""
+    coordinator = make_coordinator()
+    coordinator.device_changed("SERIAL1", make_device())
+    coordinator.forget_device("SERIAL1")
+
+    assert coordinator.device_changed("SERIAL1", make_device())
+
+
+def test_device_refresh_counts_in_report():
+    """Test applied and skipped refreshes are reported."""
+    metrics = AlexaMetrics(MagicMock())
+    metrics.record_device_refresh(applied=True)
+    metrics.record_device_refresh(applied=False)
+    metrics.record_device_refresh(applied=False)
+
+    assert metrics.get_full_report()["device_refreshes"] == {
+        "applied": 1,
+        "skipped": 2,
+    }
+
+
+# =============================================================================
+# Tests for FetchScheduler
+# =============================================================================
+
+MONOTONIC = "custom_components.alexa_media.coordinator.time.monotonic"
+POLICIES = {
+    "bluetooth": {"interval": 900.0, "push_covered": True},
+    "preferences": {"interval": 3600.0, "push_covered": False},
+}
+
+
+def test_fetch_scheduler_due_until_first_fetch():
+    """Test endpoints are due until fetched, and unknown ones always."""
+    scheduler = FetchScheduler(POLICIES)
+    assert scheduler.select(["bluetooth", "preferences", "other"]) == [
+        "bluetooth",
+        "preferences",
+        "other",
+    ]
+
+    scheduler.mark_fetched("bluetooth")
+    scheduler.mark_fetched("other")
+    assert scheduler.select(["bluetooth", "preferences", "other"]) == [
+        "preferences",
+        "other",
+    ]
+    assert scheduler.get_stats()["bluetooth"]["skips"] == 1
+
+
+def test_fetch_scheduler_interval_elapses():
+    """Test an endpoint becomes due again after its interval."""
+    with patch(MONOTONIC, return_value=1000.0):
+        scheduler = FetchScheduler(POLICIES)
+        scheduler.mark_fetched("preferences")
+    assert not scheduler.due("preferences", now=1000.0 + 3599)
+    assert scheduler.due("preferences", now=1000.0 + 3600)
+
+
+def test_fetch_scheduler_invalidate():
+    """Test invalidation makes an endpoint due until the next fetch."""
+    scheduler = FetchScheduler(POLICIES)
+    scheduler.mark_fetched("bluetooth")
+    scheduler.invalidate("bluetooth")
+    assert scheduler.due("bluetooth")
+    assert scheduler.get_stats()["bluetooth"]["invalidated"]
+
+    scheduler.mark_fetched("bluetooth")
+    assert not scheduler.due("bluetooth")
+
+
+def test_fetch_scheduler_push_covered_needs_healthy_push():
+    """Test push covered endpoints are polled every time push is unhealthy."""
+    scheduler = FetchScheduler(POLICIES)
+    scheduler.mark_fetched("bluetooth")
+    scheduler.mark_fetched("preferences")
+
+    assert scheduler.select(["bluetooth", "preferences"], push_healthy=False) == [
+        "bluetooth"
+    ]
+
+
+def test_fetch_scheduler_stats():
+    """Test stats report interval, age and counters per endpoint."""
+    scheduler = FetchScheduler(POLICIES)
+    scheduler.mark_fetched("preferences")
+
+    stats = scheduler.get_stats()
+
+    assert list(stats) == ["bluetooth", "preferences"]
+    assert stats["bluetooth"]["last_fetch_age"] is None
+    assert stats["preferences"]["interval"] == 3600.0
+    assert stats["preferences"]["fetches"] == 1
+
+
+# =============================================================================
+# Tests for PollIntervalController
+# =============================================================================
+
+NOW = 100_000.0
+
+
+def test_poll_interval_push_down_uses_scan_interval():
+    """Test polling stays at the scan interval without push."""
+    controller = PollIntervalController(60)
+    assert controller.evaluate(push_connected=False, playing=2) == 60
+    assert controller.reasons == ["push_down"]
+
+
+def test_poll_interval_push_healthy_relaxes():
+    """Test healthy push relaxes polling, less so while playing."""
+    controller = PollIntervalController(60)
+    assert (
+        controller.evaluate(
+            now=NOW,
+            push_connected=True,
+            push_healthy=True,
+            last_push_activity=NOW - 10,
+        )
+        == 600
+    )
+    assert controller.evaluate(now=NOW, playing=1) == 300
+    assert controller.reasons == ["push_healthy", "playing:1"]
+
+
+def test_poll_interval_tightens_when_push_stale_while_playing():
+    """Test a stale push connection polls playing devices at the scan interval."""
+    controller = PollIntervalController(60)
+    interval = controller.evaluate(
+        now=NOW,
+        push_connected=True,
+        push_healthy=False,
+        last_push_activity=NOW - 700,
+        playing=1,
+    )
+    assert interval == 60
+    assert controller.reasons == ["push_stale", "playing:1"]
+
+
+def test_poll_interval_quiet_night():
+    """Test long push silence on healthy push with nothing playing polls least."""
+    controller = PollIntervalController(60)
+    interval = controller.evaluate(
+        now=NOW,
+        push_connected=True,
+        push_healthy=True,
+        last_push_activity=NOW - 3600,
+    )
+    assert interval == 1200
+    assert controller.reasons == ["push_healthy", "quiet"]
+
+
+def test_poll_interval_tightens_when_connected_push_goes_silent():
+    """Test a connected but unhealthy push polls at the scan interval when idle."""
+    controller = PollIntervalController(60)
+    for silence in (700, 3600):
+        interval = controller.evaluate(
+            now=NOW,
+            push_connected=True,
+            push_healthy=False,
+            last_push_activity=NOW - silence,
+        )
+        assert interval == 60
+        assert controller.reasons == ["push_stale"]
+
+
+def test_poll_interval_rate_limits_back_off_within_bounds():
+    """Test recent 429s double the interval up to the maximum and then expire."""
+    with patch(MONOTONIC, return_value=1000.0):
+        controller = PollIntervalController(60)
+        controller.record_rate_limited()
+        assert controller.evaluate(push_connected=False) == 120
+        assert controller.reasons == ["push_down", "rate_limited:1"]
+
+        controller.record_rate_limited()
+        controller.evaluate(push_connected=True, push_healthy=True)
+        assert controller.interval == controller.max_interval == 1800
+        assert controller.reasons[-1] == "max_interval"
+
+    with patch(MONOTONIC, return_value=1000.0 + 901):
+        assert controller.evaluate() == 600
+        assert controller.get_stats()["recent_rate_limits"] == 0
+
+
+def test_coordinator_adapt_interval_applies_and_reports():
+    """Test the coordinator applies the chosen interval and exposes reasons."""
+    coordinator = make_coordinator()
+    coordinator.poll_interval = PollIntervalController(60)
+    coordinator.update_interval = None
+
+    coordinator.set_http2_status(True)
+    assert coordinator.update_interval.total_seconds() == 600
+
+    coordinator.adapt_interval(push_connected=False)
+    assert coordinator.update_interval.total_seconds() == 60
+
+    stats = coordinator.poll_interval.get_stats()
+    assert stats["reasons"] == ["push_down"]
+    assert stats["changes"] == 2
+
+
+# =============================================================================
+# Tests for ChangeOnlyStateMixin
+# =============================================================================
+
+
+class FakeCoordinatorEntity:
+    """Stand-in for CoordinatorEntity counting state writes."""
+
+    available = True
+
+    def __init__(self) -> None:
+        """Start without writes."""
+        self.writes = 0
+
+    def _handle_coordinator_update(self) -> None:
+        self.writes += 1
+
+
+class FakeSensor(ChangeOnlyStateMixin, FakeCoordinatorEntity):
+    """Coordinator entity whose state is a single value."""
+
+    entity_id = "sensor.kitchen_temperature"
+
+    def __init__(self, hass) -> None:
+        """Initialize with no value."""
+        super().__init__()
+        self.hass = hass
+        self.value = None
+
+    def _coordinator_state(self):
+        """Return the sensor value."""
+        return self.value
+
+
+class FakeStateEntity(ChangeOnlyStateMixin, FakeCoordinatorEntity):
+    """Coordinator entity relying on the default comparable state."""
+
+    entity_id = "switch.kitchen"
+
+    def __init__(self, hass) -> None:
+        """Initialize in the off state."""
+        super().__init__()
+        self.hass = hass
+        self.state = "off"
+
+
+def make_hass_with_metrics():
+    """Return a hass stub with an AlexaMetrics instance registered."""
+    hass = MagicMock()
+    hass.data = {"alexa_media": {}}
+    hass.data["alexa_media"]["metrics"] = AlexaMetrics(hass)
+    return hass
+
+
+def test_change_only_writes_skip_unchanged_state():
+    """Test unchanged coordinator updates do not write state."""
+    hass = make_hass_with_metrics()
+    sensor = FakeSensor(hass)
+
+    sensor._handle_coordinator_update()
+    sensor._handle_coordinator_update()
+    sensor.value = 21.5
+    sensor._handle_coordinator_update()
+    sensor._handle_coordinator_update()
+
+    assert sensor.writes == 2
+    report = hass.data["alexa_media"]["metrics"].get_full_report()
+    assert report["state_writes"] == {"sensor": {"written": 2, "suppressed": 2}}
+
+
+def test_change_only_writes_on_availability_change():
+    """Test a failed coordinator refresh is written even if the value is the same."""
+    sensor = FakeSensor(make_hass_with_metrics())
+    sensor._handle_coordinator_update()
+    sensor.available = False
+    sensor._handle_coordinator_update()
+    assert sensor.writes == 2
+
+
+def test_change_only_default_compares_entity_state():
+    """Test entities without an override compare their state."""
+    entity = FakeStateEntity(make_hass_with_metrics())
+    entity._handle_coordinator_update()
+    entity._handle_coordinator_update()
+    entity.state = "on"
+    entity._handle_coordinator_update()
+    assert entity.writes == 2
+
+
+def test_reset_forces_next_write():
+    """Test an optimistic write makes the next coordinator update write."""
+    sensor = FakeSensor(make_hass_with_metrics())
+    sensor._handle_coordinator_update()
+    sensor._reset_coordinator_state()
+    sensor._handle_coordinator_update()
+    assert sensor.writes == 2
+
+
+def test_contact_sensor_writes_only_on_detection_change():
+    """Test AlexaContact suppresses writes while the detection state is unchanged."""
+
+    def contact_data(value):
+        return {
+            "CONTACT1": [
+                {
+                    "namespace": "Alexa.ContactSensor",
+                    "name": "detectionState",
+                    "value": value,
+                }
+            ]
+        }
+
+    coordinator = SimpleNamespace(
+        data=contact_data("NOT_DETECTED"), last_update_success=True
+    )
+    contact = AlexaContact(coordinator, {"id": "CONTACT1", "name": "Door"})
+    contact.hass = make_hass_with_metrics()
+    with patch.object(contact, "async_write_ha_state") as write:
+        contact._handle_coordinator_update()
+        contact._handle_coordinator_update()
+        coordinator.data = contact_data("DETECTED")
+        contact._handle_coordinator_update()
+
+    assert write.call_count == 2
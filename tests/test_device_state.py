@@ -0,0 +1,221 @@
+"""Tests for the per-poll device state index."""
+
+from functools import partial
+
+import pytest
+
+from custom_components.alexa_media.device_state import DeviceStateIndex, index_by_serial
+
+
+def make_payloads(count: int) -> tuple[list[dict], dict, dict, dict]:
+    """Return synthetic devices, bluetooth, preferences and DND payloads."""
+    serials = [f"SERIAL{i}" for i in range(count)]
+    devices = [{"serialNumber": serial} for serial in serials]
+    bluetooth = {
+        "bluetoothStates": [
+            {"deviceSerialNumber": serial, "pairedDeviceList": []}
+            for serial in reversed(serials)
+        ]
+    }
+    preferences = {
+        "devicePreferences": [
+            {"deviceSerialNumber": serial, "locale": "en-US", "timeZoneId": "UTC"}
+            for serial in reversed(serials)
+        ]
+    }
+    dnd = {
+        "doNotDisturbDeviceStatusList": [
+            {"deviceSerialNumber": serial, "enabled": i % 2 == 0}
+            for i, serial in enumerate(reversed(serials))
+        ]
+    }
+    return devices, bluetooth, preferences, dnd
+
+
+# =============================================================================
+# Tests for index_by_serial
+# =============================================================================
+
+
+def test_index_by_serial_first_entry_wins():
+    """Test duplicate serials keep the first entry like the linear scan did."""
+    response = {
+        "doNotDisturbDeviceStatusList": [
+            {"deviceSerialNumber": "SERIAL1", "enabled": True},
+            {"deviceSerialNumber": "SERIAL1", "enabled": False},
+        ]
+    }
+    index = index_by_serial(response, "doNotDisturbDeviceStatusList")
+    assert index == {"SERIAL1": {"deviceSerialNumber": "SERIAL1", "enabled": True}}
+
+
+def test_index_by_serial_malformed_responses():
+    """Test missing or malformed responses give an empty index."""
+    assert index_by_serial(None, "bluetoothStates") == {}
+    assert index_by_serial({}, "bluetoothStates") == {}
+    assert index_by_serial({"bluetoothStates": None}, "bluetoothStates") == {}
+    assert index_by_serial({"bluetoothStates": ["x", {}]}, "bluetoothStates") == {}
+
+
+# =============================================================================
+# Tests for DeviceStateIndex
+# =============================================================================
+
+
+def test_merge_sets_indexed_fields():
+    """Test bluetooth, locale, timezone and DND are merged by serial."""
+    devices, bluetooth, preferences, dnd = make_payloads(3)
+    index = DeviceStateIndex.from_responses(bluetooth, preferences, dnd)
+
+    device = devices[0]
+    index.merge(device)
+
+    assert device["bluetooth_state"]["deviceSerialNumber"] == "SERIAL0"
+    assert device["locale"] == "en-US"
+    assert device["timeZoneId"] == "UTC"
+    assert device["dnd"] is True
+    assert index.get_stats() == {"bluetooth": 3, "preferences": 3, "dnd": 3}
+
+
+def test_merge_leaves_unknown_serials_untouched():
+    """Test devices missing from the responses are not modified."""
+    index = DeviceStateIndex.from_responses(None, None, None)
+    device = {"serialNumber": "SERIAL1", "dnd": False}
+    index.merge(device)
+    assert device == {"serialNumber": "SERIAL1", "dnd": False}
+
+
+def test_update_dnd_replaces_entries():
+    """Test a fresh DND response replaces the indexed entries."""
+    _, bluetooth, preferences, dnd = make_payloads(2)
+    index = DeviceStateIndex.from_responses(bluetooth, preferences, dnd)
+    index.update_dnd(
+        {
+            "doNotDisturbDeviceStatusList": [
+                {"deviceSerialNumber": "SERIAL0", "enabled": False}
+            ]
+        }
+    )
+
+    assert list(index.dnd) == ["SERIAL0"]
+    assert index.bluetooth.keys() == {"SERIAL0", "SERIAL1"}
+
+
+# =============================================================================
+# Merge cost per poll
+# =============================================================================
+
+
+class CountingList(list):
+    """List counting the entries visited by iteration."""
+
+    visits = 0
+
+    def __iter__(self):
+        """Count each entry as it is yielded."""
+        for entry in super().__iter__():
+            self.visits += 1
+            yield entry
+
+
+def make_counted_payloads(count: int):
+    """Return payloads whose entry lists count how often entries are visited."""
+    devices, bluetooth, preferences, dnd = make_payloads(count)
+    lists = (
+        CountingList(bluetooth["bluetoothStates"]),
+        CountingList(preferences["devicePreferences"]),
+        CountingList(dnd["doNotDisturbDeviceStatusList"]),
+    )
+    bluetooth["bluetoothStates"] = lists[0]
+    preferences["devicePreferences"] = lists[1]
+    dnd["doNotDisturbDeviceStatusList"] = lists[2]
+    return devices, bluetooth, preferences, dnd, lists
+
+
+def indexed_merge(devices, bluetooth, preferences, dnd) -> None:
+    """Index the responses and merge them into every device."""
+    index = DeviceStateIndex.from_responses(bluetooth, preferences, dnd)
+    for device in devices:
+        index.merge(device)
+
+
+def legacy_merge(devices, bluetooth, preferences, dnd) -> None:
+    """Merge the responses with the old per-device linear scans."""
+    for device in devices:
+        serial = device["serialNumber"]
+        for b_state in bluetooth["bluetoothStates"]:
+            if serial == b_state["deviceSerialNumber"]:
+                device["bluetooth_state"] = b_state
+                break
+        for dev in preferences["devicePreferences"]:
+            if dev["deviceSerialNumber"] == serial:
+                device["locale"] = dev["locale"]
+                device["timeZoneId"] = dev["timeZoneId"]
+                break
+        for dev in dnd["doNotDisturbDeviceStatusList"]:
+            if dev["deviceSerialNumber"] == serial:
+                device["dnd"] = dev["enabled"]
+                break
+
+
+def test_merge_visits_each_entry_once():
+    """Test the merge visits every entry once, unlike the quadratic scans.
+
+    The payloads list devices in reverse, so the linear scans visit
+    count * (count + 1) / 2 entries per endpoint.
+    """
+    for count in (50, 500):
+        devices, bluetooth, preferences, dnd, lists = make_counted_payloads(count)
+        indexed_merge(devices, bluetooth, preferences, dnd)
+        merged = [dict(device) for device in devices]
+        assert [entries.visits for entries in lists] == [count] * 3
+
+        devices, bluetooth, preferences, dnd, lists = make_counted_payloads(count)
+        legacy_merge(devices, bluetooth, preferences, dnd)
+        assert devices == merged
+        assert [entries.visits for entries in lists] == [count * (count + 1) // 2] * 3
+
+
+@pytest.mark.perf
+def test_benchmark_merge_cost(best_of):
+    """Benchmark the merge from 50 to 500 devices against the linear scans."""
+    costs = {}
+    for count in (50, 500):
+        payloads = make_payloads(count)
+        costs[("indexed", count)] = best_of(partial(indexed_merge, *payloads))
+        costs[("legacy", count)] = best_of(partial(legacy_merge, *payloads))
+    print(
+        "\nmerge cost 50 -> 500 devices: "
+        f"indexed {costs[('indexed', 50)] * 1e3:.3f}ms -> "
+        f"{costs[('indexed', 500)] * 1e3:.3f}ms, "
+        f"linear scan {costs[('legacy', 50)] * 1e3:.3f}ms -> "
+        f"{costs[('legacy', 500)] * 1e3:.3f}ms"
+    )
+    assert costs[("indexed", 500)] < costs[("legacy", 500)]
+
+
+def test_from_responses_keeps_previous_for_skipped_endpoints():
+    """Test endpoints not fetched this poll reuse the previous entries."""
+    _, bluetooth, preferences, dnd = make_payloads(2)
+    previous = DeviceStateIndex.from_responses(bluetooth, preferences, dnd)
+    fresh_dnd = {
+        "doNotDisturbDeviceStatusList": [
+            {"deviceSerialNumber": "SERIAL0", "enabled": False}
+        ]
+    }
+
+    index = DeviceStateIndex.from_responses(None, None, fresh_dnd, previous=previous)
+
+    assert index.bluetooth is previous.bluetooth
+    assert index.preferences is previous.preferences
+    assert list(index.dnd) == ["SERIAL0"]
+
+
+def test_update_ignores_failed_fetch():
+    """Test a None response does not wipe the indexed entries."""
+    _, bluetooth, preferences, dnd = make_payloads(2)
+    index = DeviceStateIndex.from_responses(bluetooth, preferences, dnd)
+    index.update_bluetooth(None)
+    index.update_dnd(None)
+    assert len(index.bluetooth) == 2
+    assert len(index.dnd) == 2
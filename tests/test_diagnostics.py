@@ -17,11 +17,13 @@ from custom_components.alexa_media.diagnostics import (
     _maybe_keys,
     _obfuscate_identifier,
     _obfuscate_title_with_email,
+    _summarize_amp_account,
     _summarize_amp_entry_runtime,
     _summarize_coordinator,
     async_get_config_entry_diagnostics,
     async_get_device_diagnostics,
 )
+from custom_components.alexa_media.last_called import LastCalledActivityQueue
 
 
 @pytest.fixture
@@ -142,6 +144,22 @@ def test_summarize_amp_entry_runtime_mapping(monkeypatch):
     assert out["runtime_keys"] == ["aa...zz"]
 
 
+def test_summarize_amp_account_reports_last_called_queue():
+    queue = LastCalledActivityQueue()
+    queue.upsert("SERIAL1", None, 1000, "PUSH_VOLUME_CHANGE")
+    entry = SimpleNamespace(data={"email": "daniel@example.com"})
+    domain_data = {
+        "accounts": {"daniel@example.com": {"last_called_activity_queue": queue}}
+    }
+
+    out = _summarize_amp_account(domain_data, entry)
+
+    assert out["present"] is True
+    assert out["last_called_queue"]["size"] == 1
+    assert out["last_called_queue"]["queued"] == 1
+    assert _summarize_amp_account({}, entry) == {"present": False}
+
+
 @pytest.mark.asyncio
 async def test_async_get_config_entry_diagnostics_redacts_sensitive_fields(
     mock_hass, monkeypatch
@@ -8,6 +8,7 @@ from custom_components.alexa_media.exceptions import (
     LoginForbiddenException,
     LoginInvalidException,
     TimeoutException,
+    TranscodeException,
     UnexpectedApiException,
 )
 
@@ -75,6 +76,13 @@ def test_unexpected_api_exception():
     assert str(exception) == "Unexpected response"
 
 
+def test_transcode_exception():
+    """Test TranscodeException creation and inheritance."""
+    exception = TranscodeException("ffmpeg is not installed")
+    assert isinstance(exception, Exception)
+    assert str(exception) == "ffmpeg is not installed"
+
+
 def test_all_exceptions_are_raisable():
     """Test that all custom exceptions can be raised and caught."""
     exceptions_to_test = [
@@ -83,6 +91,7 @@ def test_all_exceptions_are_raisable():
         (LoginForbiddenException, "login forbidden"),
         (LoginInvalidException, 2),
         (TimeoutException, "timeout"),
+        (TranscodeException, "transcode"),
         (UnexpectedApiException, "unexpected"),
     ]
 
@@ -3,129 +3,25 @@
 Tests the helper functions using pytest-homeassistant-custom-component.
 """
 
-from unittest.mock import MagicMock, patch
+import functools
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from alexapy import AlexapyLoginError
 import pytest
 
 from custom_components.alexa_media.const import DATA_ALEXAMEDIA
 from custom_components.alexa_media.helpers import (
-    _existing_serials,
+    _catch_login_errors,
+    account_signal,
     add_devices,
+    connect_device_signals,
+    dispatch_account_event,
+    dispatch_serial_event,
     is_http2_enabled,
     safe_get,
+    serial_signal,
 )
-
-# =============================================================================
-# Tests for _existing_serials function
-# =============================================================================
-
-
-def test_existing_serials_no_accounts():
-    """Test _existing_serials returns empty list when no accounts data."""
-    hass = MagicMock()
-    login_obj = MagicMock()
-    login_obj.email = "test@example.com"
-    hass.data = {}
-
-    result = _existing_serials(hass, login_obj)
-    assert result == []
-
-
-def test_existing_serials_no_email():
-    """Test _existing_serials returns empty list when email not in accounts."""
-    hass = MagicMock()
-    login_obj = MagicMock()
-    login_obj.email = "test@example.com"
-    hass.data = {DATA_ALEXAMEDIA: {"accounts": {}}}
-
-    result = _existing_serials(hass, login_obj)
-    assert result == []
-
-
-def test_existing_serials_with_devices():
-    """Test _existing_serials returns device serials."""
-    hass = MagicMock()
-    login_obj = MagicMock()
-    email = "test@example.com"
-    login_obj.email = email
-
-    hass.data = {
-        DATA_ALEXAMEDIA: {
-            "accounts": {
-                email: {
-                    "entities": {"media_player": {"device1": {}, "device2": {}}},
-                    "devices": {"media_player": {"device1": {}, "device2": {}}},
-                }
-            }
-        }
-    }
-
-    result = _existing_serials(hass, login_obj)
-    assert sorted(result) == ["device1", "device2"]
-
-
-def test_existing_serials_with_app_devices():
-    """Test _existing_serials includes app device serial numbers."""
-    hass = MagicMock()
-    login_obj = MagicMock()
-    email = "test@example.com"
-    login_obj.email = email
-
-    hass.data = {
-        DATA_ALEXAMEDIA: {
-            "accounts": {
-                email: {
-                    "entities": {"media_player": {"device1": {}}},
-                    "devices": {
-                        "media_player": {
-                            "device1": {
-                                "appDeviceList": [
-                                    {"serialNumber": "app1"},
-                                    {"serialNumber": "app2"},
-                                    {"serialNumber": "device1"},
-                                ]
-                            }
-                        }
-                    },
-                }
-            }
-        }
-    }
-
-    result = _existing_serials(hass, login_obj)
-    assert sorted(result) == ["app1", "app2", "device1", "device1"]
-
-
-def test_existing_serials_with_invalid_app_devices():
-    """Test _existing_serials handles app devices without serialNumber."""
-    hass = MagicMock()
-    login_obj = MagicMock()
-    email = "test@example.com"
-    login_obj.email = email
-
-    hass.data = {
-        DATA_ALEXAMEDIA: {
-            "accounts": {
-                email: {
-                    "entities": {"media_player": {"device1": {}}},
-                    "devices": {
-                        "media_player": {
-                            "device1": {
-                                "appDeviceList": [
-                                    {"invalid": "data"},
-                                    {"serialNumber": "app1"},
-                                ]
-                            }
-                        }
-                    },
-                }
-            }
-        }
-    }
-
-    result = _existing_serials(hass, login_obj)
-    assert sorted(result) == ["app1", "device1"]
-
+from custom_components.alexa_media.notify_delivery import NotifyDeliveryQueue
 
 # =============================================================================
 # Tests for add_devices function
@@ -404,6 +300,97 @@ def test_is_http2_enabled_http2_object():
     assert is_http2_enabled(hass, "test@example.com") is True
 
 
+# =============================================================================
+# Tests for dispatcher signal routing
+# =============================================================================
+
+EMAIL = "test@example.com"
+
+
+def test_serial_signal_is_scoped_to_account_and_type():
+    """Test serial signals extend the account signal with type and serial."""
+    assert serial_signal(EMAIL, "media_player", "SERIAL1") == (
+        f"{account_signal(EMAIL)}_media_player_SERIAL1"
+    )
+    assert serial_signal(EMAIL, "switch", "SERIAL1") != serial_signal(
+        EMAIL, "media_player", "SERIAL1"
+    )
+
+
+def test_dispatch_serial_event_routes_to_consumer_types():
+    """Test queue_state reaches media players and switches of one serial only."""
+    hass = MagicMock()
+    event = {"queue_state": {"dopplerId": {"deviceSerialNumber": "SERIAL1"}}}
+    with patch(
+        "custom_components.alexa_media.helpers.async_dispatcher_send"
+    ) as mock_send:
+        dispatch_serial_event(hass, EMAIL, "SERIAL1", event)
+
+    signals = [call.args[1] for call in mock_send.call_args_list]
+    assert signals == [
+        serial_signal(EMAIL, "media_player", "SERIAL1"),
+        serial_signal(EMAIL, "switch", "SERIAL1"),
+    ]
+    assert account_signal(EMAIL) not in signals
+
+
+def test_dispatch_serial_event_unknown_key_falls_back_to_account():
+    """Test events without a route are sent on the account-wide signal."""
+    hass = MagicMock()
+    with patch(
+        "custom_components.alexa_media.helpers.async_dispatcher_send"
+    ) as mock_send:
+        dispatch_serial_event(hass, EMAIL, "SERIAL1", {"unrouted": {}})
+
+    mock_send.assert_called_once_with(hass, account_signal(EMAIL), {"unrouted": {}})
+
+
+def test_dispatch_account_event_uses_account_signal():
+    """Test global events go out on the account-wide signal."""
+    hass = MagicMock()
+    event = {"notifications_refreshed": True}
+    with patch(
+        "custom_components.alexa_media.helpers.async_dispatcher_send"
+    ) as mock_send:
+        dispatch_account_event(hass, EMAIL, event)
+
+    mock_send.assert_called_once_with(hass, account_signal(EMAIL), event)
+
+
+def test_connect_device_signals_subscribes_and_unsubscribes():
+    """Test a single unsubscribe callable removes every subscription."""
+    hass = MagicMock()
+    target = MagicMock()
+    unsubs = [MagicMock(), MagicMock()]
+    with patch(
+        "custom_components.alexa_media.helpers.async_dispatcher_connect",
+        side_effect=unsubs,
+    ) as mock_connect:
+        unsubscribe = connect_device_signals(hass, EMAIL, "sensor", "SERIAL1", target)
+
+    assert [call.args[1] for call in mock_connect.call_args_list] == [
+        serial_signal(EMAIL, "sensor", "SERIAL1"),
+        account_signal(EMAIL),
+    ]
+    unsubscribe()
+    for unsub in unsubs:
+        unsub.assert_called_once()
+
+
+def test_connect_device_signals_serial_only():
+    """Test account_wide=False skips the account-wide subscription."""
+    hass = MagicMock()
+    with patch(
+        "custom_components.alexa_media.helpers.async_dispatcher_connect"
+    ) as mock_connect:
+        connect_device_signals(
+            hass, EMAIL, "switch", "SERIAL1", MagicMock(), account_wide=False
+        )
+
+    mock_connect.assert_called_once()
+    assert mock_connect.call_args.args[1] == serial_signal(EMAIL, "switch", "SERIAL1")
+
+
 # =============================================================================
 # Tests for safe_get function
 # =============================================================================
@@ -571,3 +558,52 @@ def test_safe_get_none_default_no_type_check():
         mock_dictor.return_value = 123
         result = safe_get({}, ["key"], None)
         assert result == 123
+
+
+# =============================================================================
+# Tests for _catch_login_errors
+# =============================================================================
+
+
+class LoginClient:
+    """Object with a login whose API call fails on auth."""
+
+    hass = None
+
+    def __init__(self) -> None:
+        """Initialize with a login that cannot be restored."""
+        self._login = MagicMock(email=EMAIL)
+        self._login.test_loggedin = AsyncMock(return_value=False)
+
+    @_catch_login_errors
+    async def send(self, message):
+        """Fail as an expired login does."""
+        raise AlexapyLoginError(message)
+
+
+@pytest.mark.asyncio
+async def test_catch_login_errors_swallows_by_default():
+    """Test a login error is handled and None returned."""
+    client = LoginClient()
+    assert await client.send("expired") is None
+    client._login.test_loggedin.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_catch_login_errors_reraises_when_asked():
+    """Test the login error reaches callers that need delivery results."""
+    client = LoginClient()
+    with pytest.raises(AlexapyLoginError):
+        await client.send("expired", raise_login_errors=True)
+    client._login.test_loggedin.assert_awaited_once()
+
+    queue = NotifyDeliveryQueue()
+    future = await queue.submit(
+        "media_player.kitchen",
+        functools.partial(client.send, "expired", raise_login_errors=True),
+    )
+    (result,) = await future
+    assert not result.ok
+    assert "AlexapyLoginError" in result.error
+    assert queue.get_stats()["failed"] == 1
+    queue.close()
@@ -0,0 +1,391 @@
+"""Tests for last-called activity tracking."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.alexa_media.const import LAST_CALLED_STALE_FUDGE_MS
+from custom_components.alexa_media.last_called import (
+    CustomerHistoryWindow,
+    LastCalledActivityQueue,
+    LastCalledHistoryMatcher,
+    QueuedActivity,
+    valid_utterance_type,
+    valid_voice_summary,
+)
+
+MONOTONIC = "custom_components.alexa_media.last_called.time.monotonic"
+
+
+# =============================================================================
+# Tests for LastCalledActivityQueue
+# =============================================================================
+
+
+def test_upsert_merges_same_key():
+    """Test a repeated activity keeps the earliest timestamp and latest command."""
+    queue = LastCalledActivityQueue()
+    queue.upsert("SERIAL1", "C1", 2000, "PUSH_VOLUME_CHANGE")
+    queue.upsert("SERIAL1", "C1", 1000, "PUSH_EQUALIZER_STATE_CHANGE")
+    queue.upsert("SERIAL1", "C1", 3000, "PUSH_DOPPLER_CONNECTION_CHANGE")
+    queue.upsert("SERIAL1", "C2", None, "PUSH_VOLUME_CHANGE")
+
+    first, second = queue.snapshot()
+    assert first.key == ("SERIAL1", "C1")
+    assert first.activity_ts == 1000
+    assert first.command == "PUSH_DOPPLER_CONNECTION_CHANGE"
+    assert second.activity_ts == 0
+    stats = queue.get_stats()
+    assert stats["queued"] == 2
+    assert stats["merged"] == 2
+
+
+def test_upsert_ignores_missing_serial():
+    """Test activities without a device serial are not queued."""
+    queue = LastCalledActivityQueue()
+    queue.upsert("", None, 1000, "PUSH_VOLUME_CHANGE")
+    assert not queue
+
+
+def test_snapshot_is_stable_across_updates():
+    """Test a snapshot does not change when the queue is updated later."""
+    queue = LastCalledActivityQueue()
+    queue.upsert("SERIAL1", None, 2000, "PUSH_VOLUME_CHANGE")
+    snapshot = queue.snapshot()
+
+    queue.upsert("SERIAL1", None, 1000, "PUSH_EQUALIZER_STATE_CHANGE")
+    queue.upsert("SERIAL2", None, 1000, "PUSH_VOLUME_CHANGE")
+
+    assert len(snapshot) == 1
+    assert snapshot[0].activity_ts == 2000
+
+
+def test_remove_counts_resolved_and_unresolved():
+    """Test removal by key counts resolved and unresolved entries separately."""
+    queue = LastCalledActivityQueue()
+    for serial in ("SERIAL1", "SERIAL2", "SERIAL3"):
+        queue.upsert(serial, None, 1000, "PUSH_VOLUME_CHANGE")
+
+    assert queue.remove({("SERIAL2", None), ("MISSING", None)}) == 1
+    assert queue.remove([("SERIAL1", None)], resolved=False) == 1
+
+    assert [item.serial for item in queue.snapshot()] == ["SERIAL3"]
+    stats = queue.get_stats()
+    assert stats["resolved"] == 1
+    assert stats["unresolved"] == 1
+
+
+def test_bounded_size_drops_oldest():
+    """Test the oldest activity is dropped when the queue is full."""
+    queue = LastCalledActivityQueue(max_size=2)
+    for serial in ("SERIAL1", "SERIAL2", "SERIAL3"):
+        queue.upsert(serial, None, 1000, "PUSH_VOLUME_CHANGE")
+
+    assert [item.serial for item in queue.snapshot()] == ["SERIAL2", "SERIAL3"]
+    assert queue.get_stats()["dropped"] == 1
+
+
+def test_unresolved_entries_expire():
+    """Test activities whose history never shows up expire after max_age."""
+    with patch(MONOTONIC, return_value=1000.0):
+        queue = LastCalledActivityQueue(max_age=300)
+        queue.upsert("SERIAL1", None, 1000, "PUSH_VOLUME_CHANGE")
+    with patch(MONOTONIC, return_value=1200.0):
+        queue.upsert("SERIAL2", None, 1000, "PUSH_VOLUME_CHANGE")
+        # Refreshing an entry does not extend its lifetime.
+        queue.upsert("SERIAL1", None, 900, "PUSH_VOLUME_CHANGE")
+    with patch(MONOTONIC, return_value=1300.0):
+        assert [item.serial for item in queue.snapshot()] == ["SERIAL2"]
+        stats = queue.get_stats()
+    assert stats["expired"] == 1
+    assert stats["oldest_age"] == 100.0
+
+
+# =============================================================================
+# Tests for LastCalledHistoryMatcher
+# =============================================================================
+
+
+def make_record(serial: str, ts: int, summary: str = "what time is it") -> dict:
+    """Return a raw customer history record."""
+    return {
+        "deviceSerialNumber": serial,
+        "creationTimestamp": ts,
+        "utteranceType": "GENERAL",
+        "description": {"summary": summary},
+        "alexaResponse": "It is noon.",
+    }
+
+
+def make_activity(serial: str, ts: int, customer_id=None) -> QueuedActivity:
+    """Return a queued activity."""
+    return QueuedActivity(serial, customer_id, ts, "PUSH_VOLUME_CHANGE", 0.0)
+
+
+def test_match_returns_newest_matching_record():
+    """Test the newest usable record for a queued serial resolves it."""
+    records = [
+        make_record("SERIAL1", 1000),
+        make_record("SERIAL1", 3000),
+        make_record("SERIAL2", 4000),
+        make_record("SERIAL1", 5000, summary=" "),
+    ]
+    queue = [make_activity("SERIAL1", 2000)]
+
+    payload, resolved = LastCalledHistoryMatcher().match(
+        records, queue, {"SERIAL1", "SERIAL2"}
+    )
+
+    assert payload == {
+        "serialNumber": "SERIAL1",
+        "timestamp": 3000,
+        "summary": "what time is it",
+        "response": "It is noon.",
+    }
+    assert resolved == {("SERIAL1", None)}
+
+
+def test_match_skips_applied_and_unknown_records():
+    """Test watermark, last pushed activity and unknown serials are honoured."""
+    matcher = LastCalledHistoryMatcher()
+    queue = [make_activity("SERIAL1", 0)]
+    records = [make_record("SERIAL1", 5000), make_record("SERIAL1", 3000)]
+
+    assert matcher.match(records, queue, {"SERIAL1"}, watermark=5000) == (
+        None,
+        set(),
+    )
+    assert matcher.match(records, queue, set()) == (None, set())
+    payload, _ = matcher.match(
+        records, queue, {"SERIAL1"}, last_pushed_activity={"SERIAL1": 5000}
+    )
+    assert payload is None
+
+
+def test_match_allows_stale_fudge():
+    """Test a record slightly older than the activity still matches."""
+    queue = [make_activity("SERIAL1", 10_000)]
+    inside = [make_record("SERIAL1", 10_000 - LAST_CALLED_STALE_FUDGE_MS)]
+    outside = [make_record("SERIAL1", 10_000 - LAST_CALLED_STALE_FUDGE_MS - 1)]
+
+    assert LastCalledHistoryMatcher().match(inside, queue, {"SERIAL1"})[0]
+    assert LastCalledHistoryMatcher().match(outside, queue, {"SERIAL1"}) == (
+        None,
+        set(),
+    )
+
+
+def test_match_reuses_parsed_records_between_retries():
+    """Test a retry over the same window only parses new records."""
+    matcher = LastCalledHistoryMatcher()
+    queue = [make_activity("SERIAL9", 0)]
+    records = [make_record("SERIAL1", ts) for ts in range(1000, 1010)]
+
+    matcher.match(records, queue, {"SERIAL1"})
+    matcher.match(records + [make_record("SERIAL1", 2000)], queue, {"SERIAL1"})
+
+    assert matcher.get_stats() == {
+        "cached_records": 11,
+        "parse_hits": 10,
+        "parse_misses": 11,
+    }
+
+
+def test_validators():
+    """Test utterance type and summary filters."""
+    assert not valid_utterance_type({"utteranceType": "WAKE_WORD_ONLY"})
+    assert valid_utterance_type({"utteranceType": "GENERAL"})
+    assert not valid_voice_summary(" ?! ")
+    assert not valid_voice_summary(None)
+    assert valid_voice_summary("turn on the lights")
+
+
+# =============================================================================
+# Matching 1,000 history records against 50 queued activities
+# =============================================================================
+
+
+def _legacy_select(records, queue_snapshot, existing_serials, watermark=0):
+    """Return the match of the previous sort-then-scan implementation."""
+    queue_by_key = {item.key: item for item in queue_snapshot}
+    for record in sorted(
+        records, key=lambda r: int(r.get("creationTimestamp") or 0), reverse=True
+    ):
+        serial = record.get("deviceSerialNumber")
+        if not serial or serial not in existing_serials:
+            continue
+        if not valid_utterance_type(record):
+            continue
+        summary = ((record.get("description") or {}).get("summary") or "").strip()
+        if not valid_voice_summary(summary):
+            continue
+        ts = int(record.get("creationTimestamp") or 0)
+        if ts <= watermark:
+            continue
+        for key, queued in queue_by_key.items():
+            if serial != key[0]:
+                continue
+            if queued.activity_ts and ts < (
+                queued.activity_ts - LAST_CALLED_STALE_FUDGE_MS
+            ):
+                continue
+            return {
+                "serialNumber": serial,
+                "timestamp": ts,
+                "summary": summary,
+                "response": (record.get("alexaResponse") or "").strip() or None,
+            }, {key}
+    return None, set()
+
+
+def make_benchmark_payloads(seed: int = 1) -> tuple[list[dict], list, set[str]]:
+    """Return 1,000 records whose only match is the oldest record."""
+    rng = random.Random(seed)
+    serials = [f"SERIAL{i}" for i in range(100)]
+    records = [
+        make_record(rng.choice(serials[50:]), 1_000_000 + i * 1000)
+        for i in range(1, 1000)
+    ]
+    records.append(make_record("SERIAL0", 1_000_000))
+    rng.shuffle(records)
+    queue = [make_activity(serial, 0) for serial in serials[:50]]
+    return records, queue, set(serials)
+
+
+class CountingSet(set):
+    """Set counting membership tests."""
+
+    lookups = 0
+
+    def __contains__(self, item):
+        """Count and answer a membership test."""
+        self.lookups += 1
+        return super().__contains__(item)
+
+
+def test_matcher_retry_skips_unqueued_records():
+    """Test a probe retry parses nothing and checks only queued devices.
+
+    The linear scan tests device membership for every one of the 1,000
+    records; the matcher only for records of devices with queued activity.
+    """
+    records, queue, serials = make_benchmark_payloads()
+    matcher = LastCalledHistoryMatcher()
+
+    legacy_serials = CountingSet(serials)
+    expected = _legacy_select(records, queue, legacy_serials)
+    assert expected[0]["serialNumber"] == "SERIAL0"
+    assert legacy_serials.lookups == 1000
+
+    assert matcher.match(records, queue, serials) == expected
+    parse_misses = matcher.get_stats()["parse_misses"]
+    retry_serials = CountingSet(serials)
+    assert matcher.match(records, queue, retry_serials) == expected
+    assert retry_serials.lookups == 1
+    assert matcher.get_stats()["parse_misses"] == parse_misses
+
+
+@pytest.mark.perf
+def test_benchmark_matcher_1000_records_50_queued(best_of):
+    """Benchmark an indexed probe retry against the linear scan."""
+    records, queue, serials = make_benchmark_payloads()
+    matcher = LastCalledHistoryMatcher()
+    matcher.match(records, queue, serials)
+
+    legacy = best_of(lambda: _legacy_select(records, queue, serials), repeats=5)
+    indexed = best_of(lambda: matcher.match(records, queue, serials), repeats=5)
+    print(
+        f"\nmatch 1000 records x 50 queued: linear scan {legacy * 1e3:.3f}ms, "
+        f"indexed retry {indexed * 1e3:.3f}ms"
+    )
+    assert indexed < legacy
+
+
+def test_matcher_agrees_with_linear_scan():
+    """Test random queues and records resolve to the same payload."""
+    rng = random.Random(7)
+    for _ in range(200):
+        serials = [f"SERIAL{i}" for i in range(rng.randint(1, 6))]
+        records = [
+            make_record(
+                rng.choice(serials),
+                rng.randint(0, 60_000),
+                summary=rng.choice(["play music", "", "stop"]),
+            )
+            for _ in range(rng.randint(0, 20))
+        ]
+        queue = [
+            make_activity(serial, rng.choice([0, rng.randint(0, 60_000)]))
+            for serial in rng.sample(serials, rng.randint(1, len(serials)))
+        ]
+        watermark = rng.choice([0, 20_000])
+        expected = _legacy_select(records, queue, set(serials), watermark)
+        got = LastCalledHistoryMatcher().match(
+            records, queue, set(serials), watermark=watermark
+        )
+        assert got == expected
+
+
+# =============================================================================
+# Tests for CustomerHistoryWindow
+# =============================================================================
+
+NOW_MS = 1_700_000_000_000
+SPAN_MS = 15 * 60 * 1000
+
+
+def test_history_window_starts_wide():
+    """Test the first request covers the wide window around queued activity."""
+    window = CustomerHistoryWindow()
+    assert window.bounds(0, NOW_MS) == (NOW_MS - SPAN_MS, NOW_MS + SPAN_MS)
+    assert window.bounds(NOW_MS - 1000, NOW_MS)[0] == NOW_MS - 1000 - SPAN_MS
+    assert window.get_stats()["wide_requests"] == 2
+
+
+def test_history_window_fetches_past_high_water_mark():
+    """Test later requests only reach back to the newest record seen."""
+    window = CustomerHistoryWindow(overlap_ms=60_000)
+    window.record_response(
+        [
+            make_record("SERIAL1", NOW_MS - 120_000),
+            make_record("SERIAL1", NOW_MS - 100_000),
+            "bad",
+        ]
+    )
+
+    start, end = window.bounds(NOW_MS - 5000, NOW_MS)
+
+    assert start == NOW_MS - 160_000
+    assert end == NOW_MS + SPAN_MS
+    stats = window.get_stats()
+    assert stats["high_water_ms"] == NOW_MS - 100_000
+    assert stats["incremental_requests"] == 1
+    assert stats["records"] == 3
+
+
+def test_history_window_uses_applied_watermark():
+    """Test the last applied last_called timestamp seeds the high-water mark."""
+    window = CustomerHistoryWindow(overlap_ms=60_000)
+    window.record_response([])
+    assert window.bounds(0, NOW_MS, watermark=NOW_MS - 10_000)[0] == (NOW_MS - 70_000)
+
+
+def test_history_window_never_narrower_than_wide_start():
+    """Test an old high-water mark does not widen past the wide window."""
+    window = CustomerHistoryWindow()
+    window.record_response([make_record("SERIAL1", NOW_MS - 10 * SPAN_MS)])
+    assert window.bounds(0, NOW_MS)[0] == NOW_MS - SPAN_MS
+
+
+def test_history_window_widens_after_errors():
+    """Test an error makes only the next request wide."""
+    window = CustomerHistoryWindow()
+    window.record_response([make_record("SERIAL1", NOW_MS - 1000)])
+    window.widen()
+    window.widen()
+
+    assert window.bounds(0, NOW_MS)[0] == NOW_MS - SPAN_MS
+    window.record_response([])
+    assert window.bounds(0, NOW_MS)[0] > NOW_MS - SPAN_MS
+    assert window.get_stats()["widened"] == 1
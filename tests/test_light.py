@@ -0,0 +1,163 @@
+"""Tests for Alexa light color conversion."""
+
+import random
+from unittest.mock import patch
+
+from homeassistant.util.color import color_hs_to_RGB, color_hsb_to_RGB, color_RGB_to_hs
+import pytest
+
+from custom_components.alexa_media import light
+from custom_components.alexa_media.light import (
+    ALEXA_COLORS,
+    hs_to_alexa_color,
+    hsb_to_alexa_color,
+    red_mean,
+    rgb_to_alexa_color,
+)
+
+
+def legacy_rgb_to_alexa_color(rgb):
+    """Return the nearest Alexa color with the original linear scan."""
+    name, alexa_rgb = min(
+        ALEXA_COLORS.items(),
+        key=lambda alexa_color: red_mean(alexa_color[1], rgb),
+    )
+    return color_RGB_to_hs(*alexa_rgb), name
+
+
+def clear_caches():
+    """Drop the memoised conversions and the nearest-color index."""
+    light._nearest_alexa_color.cache_clear()
+    light._hs_to_alexa_color.cache_clear()
+    light._hsb_to_alexa_color.cache_clear()
+    light._color_cell_candidates.clear()
+
+
+def wheel_drag(points: int) -> list[tuple[float, float]]:
+    """Return hue/saturation values of a drag around the color wheel."""
+    return [
+        (round(i * 360 / points * 7 % 360, 2), round(40 + 60 * (i % 50) / 50, 2))
+        for i in range(points)
+    ]
+
+
+# =============================================================================
+# Tests for identical results
+# =============================================================================
+
+
+def test_rgb_grid_matches_linear_scan():
+    """Test the indexed lookup matches the linear scan across RGB space."""
+    clear_caches()
+    values = sorted({*range(0, 256, 15), 15, 16, 31, 32, 127, 128, 255})
+    for red in values:
+        for green in values:
+            for blue in values:
+                rgb = (red, green, blue)
+                assert rgb_to_alexa_color(rgb) == legacy_rgb_to_alexa_color(rgb)
+
+
+def test_random_rgb_matches_linear_scan():
+    """Test random RGB values give the same color as the linear scan."""
+    rng = random.Random(25)
+    for _ in range(3000):
+        rgb = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        assert rgb_to_alexa_color(rgb) == legacy_rgb_to_alexa_color(rgb)
+
+
+def test_hs_sweep_matches_linear_scan():
+    """Test hue/saturation input gives the same color as before."""
+    clear_caches()
+    for hue in range(0, 360, 3):
+        for saturation in range(0, 101, 5):
+            assert hs_to_alexa_color((hue, saturation)) == legacy_rgb_to_alexa_color(
+                color_hs_to_RGB(hue, saturation)
+            )
+            hsb = (hue, saturation / 100, 1)
+            assert hsb_to_alexa_color(hsb) == legacy_rgb_to_alexa_color(
+                color_hsb_to_RGB(*hsb)
+            )
+
+
+def test_conversion_edge_cases():
+    """Test None, list input and non-integer RGB values."""
+    assert hs_to_alexa_color(None) == (None, None)
+    assert hsb_to_alexa_color(None) == (None, None)
+    assert hs_to_alexa_color([0, 100]) == hs_to_alexa_color((0, 100))
+    assert rgb_to_alexa_color((254.6, 0.2, 0.0)) == legacy_rgb_to_alexa_color(
+        (254.6, 0.2, 0.0)
+    )
+
+
+def test_hs_conversion_is_memoised():
+    """Test repeated hue/saturation values are served from the cache."""
+    clear_caches()
+    hs_to_alexa_color((120.5, 80.0))
+    hs_to_alexa_color((120.5, 80.0))
+    assert light._hs_to_alexa_color.cache_info().hits == 1
+
+
+# =============================================================================
+# Color wheel drag
+# =============================================================================
+
+
+def test_wheel_drag_matches_linear_scan():
+    """Test every point of a color wheel drag matches the linear scan."""
+    clear_caches()
+    drag = wheel_drag(2000)
+    assert [hs_to_alexa_color(hs) for hs in drag] == [
+        legacy_rgb_to_alexa_color(color_hs_to_RGB(*hs)) for hs in drag
+    ]
+
+
+def test_wheel_drag_compares_few_colors():
+    """Test a drag compares a fraction of the colors the linear scan does.
+
+    The linear scan computes the distance to every Alexa color per point; the
+    index only to the candidates of the point's cell, and a repeated drag is
+    served from the cache without any distance computed.
+    """
+    drag = wheel_drag(2000)
+    clear_caches()
+    with patch.object(light, "red_mean", wraps=red_mean) as distance:
+        for hs_color in drag:
+            hs_to_alexa_color(hs_color)
+        cold_calls = distance.call_count
+        for hs_color in drag:
+            hs_to_alexa_color(hs_color)
+
+    assert cold_calls * 10 < len(drag) * len(ALEXA_COLORS)
+    assert distance.call_count == cold_calls
+
+
+@pytest.mark.perf
+def test_benchmark_wheel_drag(best_of):
+    """Benchmark a color wheel drag against the linear scan, cold and warm.
+
+    The cold run includes building the index cells it touches; the warm run
+    repeats the same drag, as happens when several lights follow one wheel.
+    """
+    drag = wheel_drag(2000)
+
+    def legacy():
+        for hue, saturation in drag:
+            legacy_rgb_to_alexa_color(color_hs_to_RGB(hue, saturation))
+
+    def cold():
+        clear_caches()
+        warm()
+
+    def warm():
+        for hs_color in drag:
+            hs_to_alexa_color(hs_color)
+
+    legacy_time = best_of(legacy)
+    cold_time = best_of(cold)
+    warm_time = best_of(warm)
+    print(
+        f"\nwheel drag of {len(drag)} points: linear scan {legacy_time * 1e3:.1f}ms, "
+        f"indexed cold {cold_time * 1e3:.1f}ms, warm {warm_time * 1e3:.1f}ms"
+    )
+    assert cold_time < legacy_time
+    assert warm_time < legacy_time
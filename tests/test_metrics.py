@@ -0,0 +1,170 @@
+"""Tests for Alexa Media metrics and the API data cache."""
+
+from unittest.mock import MagicMock, patch
+
+from custom_components.alexa_media.metrics import AlexaMetrics, DataCache
+
+MONOTONIC = "custom_components.alexa_media.metrics.time.monotonic"
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        """Start at 1000 seconds."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+# =============================================================================
+# Tests for LRU eviction
+# =============================================================================
+
+
+def test_lru_evicts_least_recently_used():
+    """Test reading a key protects it from eviction."""
+    cache = DataCache(max_entries=2)
+    cache.cache_set("a", 1)
+    cache.cache_set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.cache_set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_overwrite_does_not_evict():
+    """Test replacing an existing key keeps the other entries."""
+    cache = DataCache(max_entries=2)
+    cache.cache_set("a", 1)
+    cache.cache_set("b", 2)
+    cache.cache_set("a", 10)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") == 2
+    assert cache.get_stats()["evictions"] == 0
+
+
+def test_max_bytes_evicts_until_within_budget():
+    """Test size accounting evicts old entries over the byte budget."""
+    cache = DataCache(max_bytes=30)
+    cache.cache_set("a", "x" * 10)
+    cache.cache_set("b", "y" * 10)
+    assert cache.get_stats()["bytes"] == 24
+
+    cache.cache_set("c", "z" * 10)
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 24
+    assert cache.get("a") is None
+
+
+def test_size_not_tracked_without_budget():
+    """Test byte stats are only reported when a budget is set."""
+    cache = DataCache()
+    cache.cache_set("a", {"large": "x" * 1000})
+    assert "bytes" not in cache.get_stats()
+
+
+# =============================================================================
+# Tests for TTLs and sweeping
+# =============================================================================
+
+
+def test_per_key_and_prefix_ttls():
+    """Test explicit, prefix and default TTLs are applied per key."""
+    clock = FakeClock()
+    with patch(MONOTONIC, clock):
+        cache = DataCache(ttl_seconds=30, prefix_ttls={"dnd": 5})
+        cache.cache_set("dnd:acct", "dnd")
+        cache.cache_set("devices:acct", "devices")
+        cache.cache_set("notifications:acct", "notifications", ttl=120)
+
+        clock.now += 10
+        assert cache.get("dnd:acct") is None
+        assert cache.get("devices:acct") == "devices"
+
+        clock.now += 30
+        assert cache.get("devices:acct") is None
+        assert cache.get("notifications:acct") == "notifications"
+        assert cache.get_stats()["expirations"] == 2
+
+
+def test_lazy_sweep_drops_unread_expired_entries():
+    """Test expired entries are removed on a later write without being read."""
+    clock = FakeClock()
+    with patch(MONOTONIC, clock):
+        cache = DataCache(ttl_seconds=10)
+        cache.cache_set("a", 1)
+        cache.cache_set("b", 2, ttl=100)
+
+        clock.now += 11
+        cache.cache_set("c", 3)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["expirations"] == 1
+
+
+def test_sweep_returns_removed_count():
+    """Test an explicit sweep reports how many entries expired."""
+    clock = FakeClock()
+    with patch(MONOTONIC, clock):
+        cache = DataCache(ttl_seconds=10)
+        cache.cache_set("a", 1)
+        cache.cache_set("b", 2)
+        clock.now += 10
+        assert cache.sweep() == 2
+        assert cache.get_stats()["entries"] == 0
+
+
+# =============================================================================
+# Tests for statistics
+# =============================================================================
+
+
+def test_prefix_hit_rates():
+    """Test hits and misses are counted per key prefix."""
+    cache = DataCache()
+    cache.cache_set("devices:acct", [])
+    cache.get("devices:acct")
+    cache.get("devices:other")
+    cache.get("legacy_key")
+
+    prefixes = cache.get_stats()["prefixes"]
+    assert prefixes["devices"] == {"hits": 1, "misses": 1, "hit_rate_percent": 50.0}
+    assert prefixes["default"] == {"hits": 0, "misses": 1, "hit_rate_percent": 0.0}
+
+
+def test_invalidate_prefix():
+    """Test invalidating a prefix only removes its keys."""
+    cache = DataCache()
+    cache.cache_set("dnd:a", 1)
+    cache.cache_set("dnd:b", 2)
+    cache.cache_set("devices:a", 3)
+
+    cache.invalidate_prefix("dnd")
+
+    assert cache.get("dnd:a") is None
+    assert cache.get("devices:a") == 3
+
+
+def test_cache_stats_in_full_report():
+    """Test cache statistics are part of the full metrics report."""
+    metrics = AlexaMetrics(MagicMock())
+    metrics.api_cache.cache_set("devices:acct", [])
+    metrics.api_cache.get("devices:acct")
+
+    report = metrics.get_full_report()["cache"]
+
+    assert report["hits"] == 1
+    assert report["evictions"] == 0
+    assert report["expirations"] == 0
+    assert report["prefixes"]["devices"]["hits"] == 1
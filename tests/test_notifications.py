@@ -0,0 +1,274 @@
+"""Tests for notification snapshot diffing and scheduling."""
+
+import datetime
+from unittest.mock import MagicMock, patch
+
+from custom_components.alexa_media.metrics import AlexaMetrics
+from custom_components.alexa_media.notifications import (
+    NotificationScheduler,
+    bucket_versions,
+    changed_buckets,
+    count_notification_sensors,
+    get_notification_scheduler,
+    notification_fingerprint,
+)
+from custom_components.alexa_media.sensor import AlexaMediaNotificationSensor
+
+
+def make_snapshot(**overrides):
+    """Return a processed notifications snapshot for two devices."""
+    snapshot = {
+        "process_timestamp": "2026-01-01T00:00:00",
+        "SERIAL1": {
+            "Alarm": {
+                "idx1": {"id": "a1", "version": "1", "status": "ON"},
+                "idx2": {"id": "a2", "version": "3", "status": "OFF"},
+            },
+            "Timer": {"idx3": {"id": "t1", "version": "1", "status": "ON"}},
+        },
+        "SERIAL2": {
+            "Reminder": {"idx4": {"id": "r1", "version": "2", "status": "ON"}},
+        },
+    }
+    snapshot.update(overrides)
+    return snapshot
+
+
+def make_sensor(n_type):
+    """Return a notification sensor stub of the given type."""
+    sensor = object.__new__(AlexaMediaNotificationSensor)
+    sensor._type = n_type
+    sensor._client = MagicMock(device_serial_number="SERIAL1")
+    sensor.schedule_update_ha_state = MagicMock()
+    return sensor
+
+
+# =============================================================================
+# Tests for fingerprints and bucket versions
+# =============================================================================
+
+
+def test_fingerprint_uses_version_and_status():
+    """Test versioned notifications ignore fields Alexa does not version."""
+    before = {"version": "4", "status": "ON", "remainingTime": 1000}
+    after = {"version": "4", "status": "ON", "remainingTime": 900}
+    assert notification_fingerprint(before) == notification_fingerprint(after)
+    assert notification_fingerprint(before) != notification_fingerprint(
+        {"version": "4", "status": "PAUSED"}
+    )
+
+
+def test_fingerprint_without_version_digests_payload():
+    """Test unversioned notifications fall back to a payload digest."""
+    assert notification_fingerprint({"a": 1, "b": 2}) == notification_fingerprint(
+        {"b": 2, "a": 1}
+    )
+    assert notification_fingerprint({"a": 1}) != notification_fingerprint({"a": 2})
+
+
+def test_bucket_versions_skips_process_timestamp():
+    """Test only serial/type buckets are fingerprinted."""
+    versions = bucket_versions(make_snapshot())
+    assert set(versions) == {
+        ("SERIAL1", "Alarm"),
+        ("SERIAL1", "Timer"),
+        ("SERIAL2", "Reminder"),
+    }
+    assert versions[("SERIAL1", "Alarm")]["idx2"] == ("3", "OFF")
+    assert bucket_versions(None) == {}
+
+
+# =============================================================================
+# Tests for changed_buckets
+# =============================================================================
+
+
+def test_unchanged_snapshot_has_no_changed_buckets():
+    """Test a refresh with identical versions changes nothing."""
+    previous = bucket_versions(make_snapshot())
+    current = bucket_versions(make_snapshot(process_timestamp="later"))
+    assert changed_buckets(previous, current) == {}
+
+
+def test_changed_buckets_reports_only_modified_types():
+    """Test an edited alarm only marks its own bucket as changed."""
+    previous = bucket_versions(make_snapshot())
+    snapshot = make_snapshot()
+    snapshot["SERIAL1"]["Alarm"]["idx1"]["version"] = "2"
+    assert changed_buckets(previous, bucket_versions(snapshot)) == {
+        "SERIAL1": {"Alarm"}
+    }
+
+
+def test_changed_buckets_added_and_removed():
+    """Test new and deleted buckets are both reported."""
+    previous = bucket_versions(make_snapshot())
+    snapshot = make_snapshot()
+    del snapshot["SERIAL2"]
+    snapshot["SERIAL3"] = {"Timer": {"idx5": {"version": "1", "status": "ON"}}}
+    assert changed_buckets(previous, bucket_versions(snapshot)) == {
+        "SERIAL2": {"Reminder"},
+        "SERIAL3": {"Timer"},
+    }
+
+
+def test_first_refresh_marks_every_bucket_changed():
+    """Test everything is changed without a previous snapshot."""
+    changed = changed_buckets(None, bucket_versions(make_snapshot()))
+    assert changed == {"SERIAL1": {"Alarm", "Timer"}, "SERIAL2": {"Reminder"}}
+
+
+# =============================================================================
+# Tests for sensor counts and dispatch handling
+# =============================================================================
+
+
+def test_count_notification_sensors():
+    """Test sensors outside changed buckets are counted as skipped."""
+    sensors = {
+        "SERIAL1": {"Alarm": object(), "Timer": object(), "Temperature": object()},
+        "SERIAL2": {"Reminder": object()},
+    }
+    assert count_notification_sensors(sensors, {"SERIAL1": {"Alarm"}}) == (1, 2)
+    assert count_notification_sensors(None, {}) == (0, 0)
+
+
+def test_sensor_refreshes_only_for_its_type():
+    """Test a targeted refresh only updates sensors of the changed types."""
+    alarm, timer = make_sensor("Alarm"), make_sensor("Timer")
+    event = {"notifications_refreshed": {"types": ["Alarm"]}}
+
+    alarm._handle_event(event)
+    timer._handle_event(event)
+
+    alarm.schedule_update_ha_state.assert_called_once_with(True)
+    timer.schedule_update_ha_state.assert_not_called()
+
+
+def test_sensor_refreshes_on_global_event():
+    """Test a bare notifications_refreshed still forces a refresh."""
+    sensor = make_sensor("Reminder")
+    sensor._handle_event({"notifications_refreshed": True})
+    sensor.schedule_update_ha_state.assert_called_once_with(True)
+
+
+def test_notification_refresh_metrics():
+    """Test skipped sensor counts are reported per refresh and in total."""
+    metrics = AlexaMetrics(MagicMock())
+    metrics.record_notification_refresh(2, 5)
+    metrics.record_notification_refresh(1, 6)
+
+    assert metrics.get_full_report()["notification_refreshes"] == {
+        "refreshes": 2,
+        "sensors_updated": 3,
+        "sensors_skipped": 11,
+        "last_skipped": 6,
+    }
+
+
+# =============================================================================
+# Tests for NotificationScheduler
+# =============================================================================
+
+TRACK = "custom_components.alexa_media.notifications.async_track_point_in_utc_time"
+UTCNOW = "custom_components.alexa_media.notifications.dt_util.utcnow"
+BASE = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def at(minutes):
+    """Return BASE plus the given minutes."""
+    return BASE + datetime.timedelta(minutes=minutes)
+
+
+def test_scheduler_arms_one_timer_for_earliest_fire():
+    """Test only the earliest fire is armed and later ones do not re-arm."""
+    scheduler = NotificationScheduler(MagicMock())
+    with patch(TRACK) as track:
+        scheduler.schedule("alarm", at(30), MagicMock())
+        scheduler.schedule("timer", at(10), MagicMock())
+        scheduler.schedule("reminder", at(60), MagicMock())
+
+    assert [call.args[2] for call in track.call_args_list] == [at(30), at(10)]
+    assert [fire["label"] for fire in scheduler.upcoming()] == [
+        "timer",
+        "alarm",
+        "reminder",
+    ]
+
+
+def test_scheduler_reschedule_and_cancel():
+    """Test rescheduling replaces the fire and stale cancels are ignored."""
+    scheduler = NotificationScheduler(MagicMock())
+    unsub = MagicMock()
+    with patch(TRACK, return_value=unsub) as track:
+        cancel_old = scheduler.schedule("alarm", at(10), MagicMock())
+        cancel_new = scheduler.schedule("alarm", at(20), MagicMock())
+        cancel_old()
+        assert scheduler.get_stats()["pending"] == 1
+
+        cancel_new()
+
+    unsub.assert_called()
+    assert track.call_args.args[2] == at(20)
+    stats = scheduler.get_stats()
+    assert stats["pending"] == 0
+    assert stats["cancelled"] == 1
+    assert stats["armed_at"] is None
+
+
+def test_scheduler_fires_due_actions_and_rearms():
+    """Test every due action runs once and the next fire is armed."""
+    scheduler = NotificationScheduler(MagicMock())
+    first, second, later = MagicMock(), MagicMock(), MagicMock()
+    with patch(TRACK) as track, patch(UTCNOW, return_value=at(10)):
+        scheduler.schedule("a", at(10), first)
+        scheduler.schedule("b", at(10), second)
+        scheduler.schedule("c", at(45), later)
+        scheduler._fire(at(10))
+
+    first.assert_called_once_with(at(10))
+    second.assert_called_once_with(at(10))
+    later.assert_not_called()
+    assert track.call_args.args[2] == at(45)
+    assert scheduler.get_stats()["fired"] == 2
+
+
+def test_scheduler_isolates_failing_action():
+    """Test an exception in one action does not stop the others."""
+    scheduler = NotificationScheduler(MagicMock())
+    ok = MagicMock()
+    with patch(TRACK), patch(UTCNOW, return_value=at(5)):
+        scheduler.schedule("bad", at(1), MagicMock(side_effect=RuntimeError))
+        scheduler.schedule("good", at(2), ok)
+        scheduler._fire(at(5))
+    ok.assert_called_once()
+
+
+def test_scheduler_compacts_stale_heap_entries():
+    """Test repeated rescheduling does not grow the heap without bound."""
+    scheduler = NotificationScheduler(MagicMock())
+    with patch(TRACK):
+        for minute in range(200):
+            scheduler.schedule("timer", at(minute), MagicMock())
+    assert len(scheduler._heap) <= 2 * len(scheduler._entries) + 17
+
+
+def test_scheduler_close_cancels_timer():
+    """Test closing cancels the armed timer and drops pending fires."""
+    scheduler = NotificationScheduler(MagicMock())
+    unsub = MagicMock()
+    with patch(TRACK, return_value=unsub):
+        scheduler.schedule("alarm", at(10), MagicMock())
+    scheduler.close()
+    unsub.assert_called_once()
+    assert scheduler.upcoming() == []
+
+
+def test_get_notification_scheduler_is_per_account():
+    """Test the scheduler is created once per account."""
+    hass = MagicMock()
+    hass.data = {"alexa_media": {"accounts": {"user@example.com": {}}}}
+    scheduler = get_notification_scheduler(hass, "user@example.com")
+    assert isinstance(scheduler, NotificationScheduler)
+    assert get_notification_scheduler(hass, "user@example.com") is scheduler
+    assert get_notification_scheduler(hass, "other@example.com") is None
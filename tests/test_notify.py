@@ -5,10 +5,15 @@ Tests the notification service using pytest-homeassistant-custom-component.
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from homeassistant.exceptions import HomeAssistantError
 import pytest
 
 from custom_components.alexa_media.const import DATA_ALEXAMEDIA
-from custom_components.alexa_media.notify import AlexaNotificationService
+from custom_components.alexa_media.notify import (
+    AlexaNotificationService,
+    NotifyTargetIndex,
+    invalidate_notify_targets,
+)
 
 # =============================================================================
 # Tests for AlexaNotificationService.devices property
@@ -627,3 +632,293 @@ class TestAsyncSendMessageGroupExpansion:
         assert "Living Room Echo" in expanded  # plain target
         assert "media_player.echo_group" not in expanded
         assert "group.echo_players" not in expanded
+
+
+# =============================================================================
+# Tests for the notify target index
+# =============================================================================
+
+
+def _make_player(name, serial, entity_id=None):
+    """Return a media player stub with the identity fields convert() uses."""
+    player = MagicMock()
+    player.name = name
+    player.unique_id = serial
+    player.device_serial_number = serial
+    player.entity_id = entity_id
+    player.extra_state_attributes = {}
+    return player
+
+
+class TestNotifyTargetIndex:
+    """Test the cached lookup shared by convert, targets and devices."""
+
+    def _create_service(self, accounts: dict) -> AlexaNotificationService:
+        service = object.__new__(AlexaNotificationService)
+        service.hass = MagicMock()
+        service.hass.data = {DATA_ALEXAMEDIA: {"accounts": accounts}}
+        service.last_called = False
+        return service
+
+    def _accounts(self):
+        kitchen = _make_player("Kitchen", "SERIAL1", "media_player.kitchen")
+        office = _make_player("Office", "SERIAL2", "media_player.office")
+        accounts = {
+            "user1@example.com": {"entities": {"media_player": {"SERIAL1": kitchen}}},
+            "user2@example.com": {"entities": {"media_player": {"SERIAL2": office}}},
+        }
+        return accounts, kitchen, office
+
+    def test_convert_matches_every_identity_field(self):
+        """Test names, serials, entity_ids and entities all resolve."""
+        accounts, kitchen, office = self._accounts()
+        service = self._create_service(accounts)
+
+        assert service.convert(
+            ["Kitchen", "SERIAL2", "media_player.kitchen", office]
+        ) == [kitchen, office, kitchen, office]
+        assert service.convert("Office", type_="serialnumbers") == ["SERIAL2"]
+        assert service.convert(["SERIAL1"], type_="names") == ["Kitchen"]
+        assert service.convert(["Office"], type_="entity_ids") == [
+            "media_player.office"
+        ]
+
+    def test_convert_keeps_or_filters_unmatched(self):
+        """Test unmatched and unhashable items follow filter_matches."""
+        accounts, kitchen, _ = self._accounts()
+        service = self._create_service(accounts)
+        unknown = {"not": "hashable"}
+
+        assert service.convert(["sensor.x", unknown, "Kitchen"]) == [
+            "sensor.x",
+            unknown,
+            kitchen,
+        ]
+        assert service.convert(
+            ["sensor.x", unknown, "Kitchen"], filter_matches=True
+        ) == [kitchen]
+
+    def test_convert_returns_all_devices_sharing_a_name(self):
+        """Test a name shared by two devices still matches both in order."""
+        first = _make_player("Echo", "SERIAL1")
+        second = _make_player("Echo", "SERIAL2")
+        service = self._create_service(
+            {
+                "user@example.com": {
+                    "entities": {"media_player": {"SERIAL1": first, "SERIAL2": second}}
+                }
+            }
+        )
+        assert service.convert(["Echo"]) == [first, second]
+
+    def test_index_is_cached_until_players_change(self):
+        """Test the index is reused and rebuilt when a player is added."""
+        accounts, _, _ = self._accounts()
+        service = self._create_service(accounts)
+
+        index = service._index()
+        assert service._index() is index
+
+        den = _make_player("Den", "SERIAL3", "media_player.den")
+        accounts["user1@example.com"]["entities"]["media_player"]["SERIAL3"] = den
+
+        assert service._index() is not index
+        assert service.convert(["Den"]) == [den]
+        assert len(service.devices) == 3
+
+    def test_invalidate_picks_up_renamed_player(self):
+        """Test a rename is seen after invalidate_notify_targets."""
+        accounts, kitchen, _ = self._accounts()
+        service = self._create_service(accounts)
+        assert service.convert(["Kitchen"], filter_matches=True) == [kitchen]
+
+        kitchen.name = "Cooking"
+        invalidate_notify_targets(service.hass)
+
+        assert service.convert(["Cooking"], filter_matches=True) == [kitchen]
+        assert service.convert(["Kitchen"], filter_matches=True) == []
+
+    def test_targets_use_index_per_account(self):
+        """Test targets skip players without an entity_id."""
+        accounts, _, _ = self._accounts()
+        accounts["user2@example.com"]["entities"]["media_player"]["SERIAL4"] = (
+            _make_player("New", "SERIAL4")
+        )
+        service = self._create_service(accounts)
+
+        assert service.targets == {"kitchen": "SERIAL1", "office": "SERIAL2"}
+
+    @pytest.mark.asyncio
+    async def test_send_message_resolves_targets_once(self):
+        """Test TTS only reaches the targeted, available players."""
+        accounts, kitchen, office = self._accounts()
+        for account_dict in accounts.values():
+            account_dict["options"] = {}
+        kitchen.async_send_tts = AsyncMock()
+        office.async_send_tts = AsyncMock()
+        service = self._create_service(accounts)
+        service.hass.states.get.return_value = None
+
+        with patch.object(
+            NotifyTargetIndex, "get", autospec=True, side_effect=NotifyTargetIndex.get
+        ) as lookup:
+            await service.async_send_message(
+                "hi", target=["Kitchen"], data={"wait": True}
+            )
+
+        kitchen.async_send_tts.assert_awaited_once()
+        assert kitchen.async_send_tts.call_args.kwargs["wait"] is True
+        assert kitchen.async_send_tts.call_args.kwargs["raise_login_errors"] is True
+        office.async_send_tts.assert_not_called()
+        # One lookup in convert() and one when matching, not one per player.
+        assert lookup.call_count == 2
+        for account_dict in accounts.values():
+            if "notify_delivery" in account_dict:
+                account_dict["notify_delivery"].close()
+
+    @pytest.mark.asyncio
+    async def test_send_message_wait_fires_results_event(self):
+        """Test wait mode publishes per-target results as an event."""
+        accounts, kitchen, office = self._accounts()
+        for account_dict in accounts.values():
+            account_dict["options"] = {}
+        kitchen.async_send_tts = AsyncMock()
+        office.async_send_tts = AsyncMock()
+        service = self._create_service(accounts)
+        service.hass.states.get.return_value = None
+
+        results = await service.async_send_message(
+            "hi", target=["Kitchen", "Office"], data={"wait": True}
+        )
+
+        service.hass.bus.async_fire.assert_called_once_with(
+            "alexa_media_notify_results", event_data=results
+        )
+        assert results["delivered"] == 2
+        assert [result["target"] for result in results["results"]] == [
+            "media_player.kitchen",
+            "media_player.office",
+        ]
+        for account_dict in accounts.values():
+            assert account_dict["notify_delivery"].get_stats()["delivered"] == 1
+            account_dict["notify_delivery"].close()
+
+    @pytest.mark.asyncio
+    async def test_send_message_wait_raises_on_failure(self):
+        """Test wait mode reports failed targets to the caller."""
+        accounts, kitchen, _ = self._accounts()
+        for account_dict in accounts.values():
+            account_dict["options"] = {}
+        kitchen.async_send_tts = AsyncMock(side_effect=RuntimeError("offline"))
+        service = self._create_service(accounts)
+        service.hass.states.get.return_value = None
+
+        with pytest.raises(HomeAssistantError, match="media_player.kitchen"):
+            await service.async_send_message(
+                "hi", target=["Kitchen"], data={"wait": True}
+            )
+        event_data = service.hass.bus.async_fire.call_args.kwargs["event_data"]
+        assert event_data["failed"] == 1
+        accounts["user1@example.com"]["notify_delivery"].close()
+
+
+# =============================================================================
+# Tests for batched notify sequences
+# =============================================================================
+
+
+class TestNotifySequenceBatching:
+    """Test multi-device TTS, push and drop in use one sequence per account."""
+
+    def _create_service(self, players):
+        service = object.__new__(AlexaNotificationService)
+        service.hass = MagicMock()
+        service.hass.data = {
+            DATA_ALEXAMEDIA: {
+                "accounts": {
+                    "user@example.com": {
+                        "entities": {
+                            "media_player": {
+                                player.device_serial_number: player
+                                for player in players
+                            }
+                        },
+                        "options": {},
+                    }
+                }
+            }
+        }
+        service.hass.states.get.return_value = None
+        service.last_called = False
+        return service
+
+    def _players(self, count):
+        players = []
+        for i in range(count):
+            player = _make_player(f"Echo {i}", f"SERIAL{i}", f"media_player.echo_{i}")
+            player._locale = "en-US"
+            player.async_send_tts = AsyncMock()
+            player.async_run_sequence_nodes = AsyncMock()
+            players.append(player)
+        return players
+
+    @pytest.mark.asyncio
+    async def test_multi_device_tts_is_one_sequence(self):
+        """Test TTS to three devices sends one parallel sequence."""
+        players = self._players(3)
+        service = self._create_service(players)
+
+        results = await service.async_send_message(
+            "Dinner", target=["Echo 0", "Echo 1", "Echo 2"], data={"wait": True}
+        )
+
+        players[0].async_run_sequence_nodes.assert_awaited_once()
+        nodes = players[0].async_run_sequence_nodes.call_args.args[0]
+        assert [node["operationPayload"]["deviceSerialNumber"] for node in nodes] == [
+            "SERIAL0",
+            "SERIAL1",
+            "SERIAL2",
+        ]
+        assert all(node["type"] == "Alexa.Speak" for node in nodes)
+        for player in players:
+            player.async_send_tts.assert_not_called()
+        assert results["delivered"] == 3
+        service.hass.data[DATA_ALEXAMEDIA]["accounts"]["user@example.com"][
+            "notify_delivery"
+        ].close()
+
+    @pytest.mark.asyncio
+    async def test_push_to_several_devices_is_batched(self):
+        """Test mobile push to several devices keeps its title in every node."""
+        players = self._players(2)
+        service = self._create_service(players)
+
+        await service.async_send_message(
+            "Door",
+            title="Alert",
+            target=["Echo 0", "Echo 1"],
+            data={"type": "push", "wait": True},
+        )
+
+        nodes = players[0].async_run_sequence_nodes.call_args.args[0]
+        assert [node["operationPayload"]["title"] for node in nodes] == [
+            "Alert",
+            "Alert",
+        ]
+        service.hass.data[DATA_ALEXAMEDIA]["accounts"]["user@example.com"][
+            "notify_delivery"
+        ].close()
+
+    @pytest.mark.asyncio
+    async def test_single_device_keeps_per_device_send(self):
+        """Test a single target still uses async_send_tts with the queue delay."""
+        players = self._players(2)
+        service = self._create_service(players)
+
+        await service.async_send_message("Hi", target=["Echo 1"], data={"wait": True})
+
+        players[1].async_send_tts.assert_awaited_once()
+        players[0].async_run_sequence_nodes.assert_not_called()
+        service.hass.data[DATA_ALEXAMEDIA]["accounts"]["user@example.com"][
+            "notify_delivery"
+        ].close()
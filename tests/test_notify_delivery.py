@@ -0,0 +1,231 @@
+"""Tests for the per-account notify delivery queue."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.alexa_media.notify_delivery import (
+    DeliveryResult,
+    NotifyDeliveryQueue,
+    get_notify_delivery_queue,
+    summarize_results,
+)
+
+
+def make_sender(log, name, delay=0.0, error=None):
+    """Return a send callable that records when it starts and ends."""
+
+    async def _send():
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        log.append(("end", name))
+        if error is not None:
+            raise error
+
+    return _send
+
+
+# =============================================================================
+# Tests for NotifyDeliveryQueue
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_deliveries_start_in_submit_order():
+    """Test a single worker delivers strictly in order."""
+    queue = NotifyDeliveryQueue(concurrency=1)
+    log = []
+    futures = [
+        await queue.submit(name, make_sender(log, name)) for name in ("a", "b", "c")
+    ]
+    results = await asyncio.gather(*futures)
+
+    assert [name for event, name in log if event == "start"] == ["a", "b", "c"]
+    assert log == [
+        ("start", "a"),
+        ("end", "a"),
+        ("start", "b"),
+        ("end", "b"),
+        ("start", "c"),
+        ("end", "c"),
+    ]
+    assert all(batch[0].ok for batch in results)
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """Test no more than concurrency deliveries run at once."""
+    queue = NotifyDeliveryQueue(concurrency=2)
+    running = peak = 0
+
+    async def _send():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    futures = [await queue.submit(f"t{i}", _send) for i in range(6)]
+    await asyncio.gather(*futures)
+
+    assert peak == 2
+    assert queue.get_stats()["delivered"] == 6
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_waits_when_queue_is_full():
+    """Test submitting blocks once max_queued deliveries are pending."""
+    queue = NotifyDeliveryQueue(concurrency=1, max_queued=1)
+    release = asyncio.Event()
+
+    async def _blocked():
+        await release.wait()
+
+    await queue.submit("first", _blocked)
+    await asyncio.sleep(0)  # worker picks up the first delivery
+    await queue.submit("second", _blocked)
+    third = asyncio.ensure_future(queue.submit("third", _blocked))
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    release.set()
+    await asyncio.wait_for(third, 1)
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_failures_and_timeouts_are_reported_per_target():
+    """Test a failing or slow target does not stop the others."""
+    queue = NotifyDeliveryQueue(concurrency=1, timeout=0.01)
+    log = []
+    futures = [
+        await queue.submit("bad", make_sender(log, "bad", error=ValueError("boom"))),
+        await queue.submit("slow", make_sender(log, "slow", delay=1)),
+        await queue.submit("good", make_sender(log, "good")),
+    ]
+    results = [batch[0] for batch in await asyncio.gather(*futures)]
+
+    assert [result.ok for result in results] == [False, False, True]
+    assert results[0].error == "ValueError: boom"
+    assert results[1].error.startswith("timed out")
+    stats = queue.get_stats()
+    assert stats["failed"] == 2
+    assert stats["targets"]["bad"]["last_error"] == "ValueError: boom"
+    assert stats["targets"]["good"]["delivered"] == 1
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_batched_send_reports_every_target():
+    """Test one send covering several targets yields a result per target."""
+    queue = NotifyDeliveryQueue()
+    send = AsyncMock()
+    future = await queue.submit(["media_player.a", "media_player.b"], send)
+    results = await future
+
+    send.assert_awaited_once()
+    assert [result.target for result in results] == [
+        "media_player.a",
+        "media_player.b",
+    ]
+    assert queue.get_stats()["delivered"] == 2
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_deliveries():
+    """Test closing cancels running and queued deliveries."""
+    queue = NotifyDeliveryQueue(concurrency=1)
+    blocked = asyncio.Event()
+
+    async def _blocked():
+        await blocked.wait()
+
+    running = await queue.submit("running", _blocked)
+    await asyncio.sleep(0)
+    queued = await queue.submit("queued", _blocked)
+    queue.close()
+
+    assert running.cancelled()
+    assert queued.cancelled()
+    assert queue.queue_depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_workers_exit_when_idle():
+    """Test no worker task outlives the deliveries it ran."""
+    queue = NotifyDeliveryQueue(concurrency=2)
+    log = []
+    first = await queue.submit("a", make_sender(log, "a"))
+    await first
+    await asyncio.sleep(0)
+    assert not queue._workers
+
+    second = await queue.submit("b", make_sender(log, "b"))
+    assert (await second)[0].ok
+    await asyncio.sleep(0)
+    assert not queue._workers
+    assert queue.get_stats()["delivered"] == 2
+
+
+@pytest.mark.asyncio
+async def test_submit_while_worker_exits_starts_a_worker():
+    """Test a job submitted as the last worker exits is still delivered.
+
+    The first result's callbacks run after the worker found the queue empty
+    but before its task finished, so the submit lands in that window.
+    """
+    queue = NotifyDeliveryQueue(concurrency=1)
+    log = []
+    submitted = []
+
+    def _submit_now(_future):
+        coro = queue.submit("b", make_sender(log, "b"))
+        try:
+            coro.send(None)
+        except StopIteration as done:
+            submitted.append(done.value)
+
+    first = await queue.submit("a", make_sender(log, "a"))
+    first.add_done_callback(_submit_now)
+    await first
+
+    assert submitted
+    assert (await asyncio.wait_for(submitted[0], 1))[0].ok
+    queue.close()
+
+
+# =============================================================================
+# Tests for helpers
+# =============================================================================
+
+
+def test_summarize_results():
+    """Test results are aggregated into delivered and failed counts."""
+    summary = summarize_results(
+        [
+            DeliveryResult("media_player.kitchen", True, 0.12345),
+            DeliveryResult("media_player.office", False, 1.0, "TimeoutError"),
+        ]
+    )
+    assert summary["delivered"] == 1
+    assert summary["failed"] == 1
+    assert summary["results"][0] == {
+        "target": "media_player.kitchen",
+        "ok": True,
+        "latency": 0.123,
+        "error": None,
+    }
+
+
+def test_get_notify_delivery_queue_is_per_account():
+    """Test the queue is created once per account."""
+    hass = MagicMock()
+    hass.data = {"alexa_media": {"accounts": {"user@example.com": {}}}}
+    queue = get_notify_delivery_queue(hass, "user@example.com")
+    assert isinstance(queue, NotifyDeliveryQueue)
+    assert get_notify_delivery_queue(hass, "user@example.com") is queue
+    assert get_notify_delivery_queue(hass, "other@example.com") is None
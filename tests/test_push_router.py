@@ -0,0 +1,239 @@
+"""Tests for the HTTP2 push command router."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.alexa_media.metrics import AlexaMetrics
+from custom_components.alexa_media.push_router import (
+    PushCommand,
+    PushCommandRouter,
+    extract_push_serial,
+)
+
+
+def make_router(known=("SERIAL1",), metrics=None):
+    """Return a router, its dispatch mock and metrics."""
+    dispatch = MagicMock()
+    metrics = metrics or AlexaMetrics(MagicMock())
+    router = PushCommandRouter(
+        dispatch=dispatch,
+        is_known_serial=lambda serial: serial in known,
+        metrics=metrics,
+    )
+    return router, dispatch, metrics
+
+
+# =============================================================================
+# Tests for extract_push_serial
+# =============================================================================
+
+
+def test_extract_push_serial_doppler_id():
+    """Test serial is read from dopplerId."""
+    payload = {"dopplerId": {"deviceSerialNumber": "SERIAL1"}}
+    assert extract_push_serial(payload) == "SERIAL1"
+
+
+def test_extract_push_serial_entry_id_sets_key_serial():
+    """Test serial is parsed from key.entryId and copied to key.serialNumber."""
+    payload = {"key": {"entryId": "CUSTOMER#TYPE#SERIAL1"}}
+    assert extract_push_serial(payload) == "SERIAL1"
+    assert payload["key"]["serialNumber"] == "SERIAL1"
+
+
+def test_extract_push_serial_missing():
+    """Test payloads without a serial return None."""
+    assert extract_push_serial({"key": {"entryId": "no-separator"}}) is None
+    assert extract_push_serial({}) is None
+
+
+# =============================================================================
+# Tests for PushCommandRouter
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_route_dispatches_for_known_serial():
+    """Test a dispatch-only command sends its key to the serial."""
+    router, dispatch, _ = make_router()
+    router.register(PushCommand("PUSH_MEDIA_QUEUE_CHANGE", dispatch_key="queue_state"))
+    payload = {"dopplerId": {"deviceSerialNumber": "SERIAL1"}}
+
+    assert await router.async_route("PUSH_MEDIA_QUEUE_CHANGE", "SERIAL1", payload, {})
+    dispatch.assert_called_once_with("SERIAL1", {"queue_state": payload})
+
+
+@pytest.mark.asyncio
+async def test_route_skips_dispatch_for_unknown_serial():
+    """Test the handler runs but dispatch is skipped for unknown serials."""
+    router, dispatch, _ = make_router()
+    handler = MagicMock(return_value=None)
+    router.register(
+        PushCommand(
+            "PUSH_NOTIFICATION_CHANGE",
+            handler=handler,
+            dispatch_key="notification_update",
+        )
+    )
+
+    await router.async_route("PUSH_NOTIFICATION_CHANGE", "OTHER", {"a": 1}, {})
+
+    handler.assert_called_once_with("OTHER", {"a": 1}, {})
+    dispatch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_route_runs_handler_before_dispatch():
+    """Test async handlers are awaited before the dispatch is sent."""
+    router, dispatch, _ = make_router()
+    calls = []
+    handler = AsyncMock(side_effect=lambda *args: calls.append("handler"))
+    dispatch.side_effect = lambda *args: calls.append("dispatch")
+    router.register(
+        PushCommand("PUSH_VOLUME_CHANGE", handler=handler, dispatch_key="player_state")
+    )
+
+    await router.async_route("PUSH_VOLUME_CHANGE", "SERIAL1", {"a": 1}, {})
+
+    handler.assert_awaited_once()
+    assert calls == ["handler", "dispatch"]
+
+
+@pytest.mark.asyncio
+async def test_route_unsupported_command_is_known():
+    """Test unsupported commands are recognised and do nothing."""
+    router, dispatch, metrics = make_router()
+    router.register_unsupported(["PUSH_TODO_CHANGE"])
+
+    assert await router.async_route("PUSH_TODO_CHANGE", "SERIAL1", {"a": 1}, {})
+    dispatch.assert_not_called()
+    assert metrics.get_push_stats()["commands"]["PUSH_TODO_CHANGE"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_route_counts_unknown_commands():
+    """Test unknown commands are counted separately."""
+    router, dispatch, metrics = make_router()
+
+    assert not await router.async_route("NEW_COMMAND", None, {"a": 1}, {})
+    assert not await router.async_route("NEW_COMMAND", None, {"a": 1}, {})
+
+    dispatch.assert_not_called()
+    stats = metrics.get_push_stats()
+    assert stats["unknown"] == {"NEW_COMMAND": 2}
+    assert "NEW_COMMAND" not in stats["commands"]
+
+
+@pytest.mark.asyncio
+async def test_route_records_timing_when_handler_raises():
+    """Test per-command metrics are recorded even if the handler fails."""
+    router, _, metrics = make_router()
+    router.register(
+        PushCommand("PUSH_BROKEN", handler=MagicMock(side_effect=ValueError))
+    )
+
+    with pytest.raises(ValueError):
+        await router.async_route("PUSH_BROKEN", "SERIAL1", {"a": 1}, {})
+
+    assert metrics.get_push_stats()["commands"]["PUSH_BROKEN"]["count"] == 1
+
+
+def test_push_stats_in_full_report():
+    """Test push statistics are part of the full metrics report."""
+    metrics = AlexaMetrics(MagicMock())
+    metrics.record_push_command("PUSH_VOLUME_CHANGE", 0.002)
+    metrics.record_push_command("PUSH_VOLUME_CHANGE", 0.004)
+    metrics.record_push_command("PUSH_MEDIA_CHANGE", 0.001)
+
+    report = metrics.get_full_report()["push_commands"]
+
+    assert list(report["commands"]) == ["PUSH_VOLUME_CHANGE", "PUSH_MEDIA_CHANGE"]
+    assert report["commands"]["PUSH_VOLUME_CHANGE"] == {
+        "count": 2,
+        "total_time": 0.006,
+        "avg_time": 0.003,
+    }
+
+
+# =============================================================================
+# Tests for push coalescing
+# =============================================================================
+
+
+def make_coalescing_router(window=0.05):
+    """Return a router with coalescable volume and immediate media commands."""
+    router, dispatch, metrics = make_router(known=("SERIAL1", "SERIAL2"))
+    router._coalesce_window = window  # pylint: disable=protected-access
+    router.register(
+        PushCommand("PUSH_VOLUME_CHANGE", dispatch_key="player_state", coalesce=True)
+    )
+    router.register(PushCommand("PUSH_AUDIO_PLAYER_STATE", dispatch_key="player_state"))
+    return router, dispatch, metrics
+
+
+@pytest.mark.asyncio
+async def test_coalesce_dispatches_latest_payload_once():
+    """Test a burst is flushed once with the latest payload."""
+    router, dispatch, metrics = make_coalescing_router()
+    for volume in (10, 20, 30):
+        await router.async_route(
+            "PUSH_VOLUME_CHANGE", "SERIAL1", {"volumeSetting": volume}, {}
+        )
+    dispatch.assert_not_called()
+
+    await asyncio.sleep(0.1)
+
+    dispatch.assert_called_once_with("SERIAL1", {"player_state": {"volumeSetting": 30}})
+    assert metrics.get_push_stats()["coalesced"] == {"PUSH_VOLUME_CHANGE": 2}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_handler_runs_for_every_message():
+    """Test activity handlers still see every message in order."""
+    router, _, _ = make_coalescing_router()
+    seen = []
+    router.register(
+        PushCommand(
+            "PUSH_VOLUME_CHANGE",
+            handler=lambda serial, payload, resource: seen.append(
+                payload["volumeSetting"]
+            ),
+            dispatch_key="player_state",
+            coalesce=True,
+        )
+    )
+    for volume in (10, 20, 30):
+        await router.async_route(
+            "PUSH_VOLUME_CHANGE", "SERIAL1", {"volumeSetting": volume}, {}
+        )
+
+    assert seen == [10, 20, 30]
+    router.cancel_pending()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_before_immediate_dispatch():
+    """Test held events for a serial go out before a non-coalesced event."""
+    router, dispatch, _ = make_coalescing_router()
+    await router.async_route("PUSH_VOLUME_CHANGE", "SERIAL1", {"volumeSetting": 5}, {})
+    await router.async_route("PUSH_VOLUME_CHANGE", "SERIAL2", {"volumeSetting": 7}, {})
+    await router.async_route("PUSH_AUDIO_PLAYER_STATE", "SERIAL1", {"state": 1}, {})
+
+    assert dispatch.call_args_list == [
+        (("SERIAL1", {"player_state": {"volumeSetting": 5}}),),
+        (("SERIAL1", {"player_state": {"state": 1}}),),
+    ]
+    router.cancel_pending()
+    await asyncio.sleep(0.1)
+    assert dispatch.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_disabled_with_zero_window():
+    """Test a zero window dispatches immediately."""
+    router, dispatch, _ = make_coalescing_router(window=0)
+    await router.async_route("PUSH_VOLUME_CHANGE", "SERIAL1", {"volumeSetting": 5}, {})
+
+    dispatch.assert_called_once_with("SERIAL1", {"player_state": {"volumeSetting": 5}})
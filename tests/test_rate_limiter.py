@@ -0,0 +1,207 @@
+"""Tests for the shared Alexa API rate limiter."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from alexapy.errors import AlexapyTooManyRequestsError
+import pytest
+
+from custom_components.alexa_media.const import DATA_ALEXAMEDIA
+from custom_components.alexa_media.metrics import AlexaMetrics
+from custom_components.alexa_media.rate_limiter import (
+    AlexaRateLimiter,
+    RateLimitedAPI,
+    RequestPriority,
+    get_rate_limiter,
+    limited_call,
+    remove_rate_limiter,
+)
+
+
+def make_hass() -> SimpleNamespace:
+    """Return a hass stand-in with integration data."""
+    return SimpleNamespace(data={DATA_ALEXAMEDIA: {"accounts": {}}})
+
+
+def make_login(email="user@example.com", url="amazon.com") -> SimpleNamespace:
+    """Return a login stand-in."""
+    return SimpleNamespace(email=email, url=url)
+
+
+# =============================================================================
+# Tests for AlexaRateLimiter
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_burst_is_granted_without_waiting():
+    """Test calls within the bucket size do not wait."""
+    limiter = AlexaRateLimiter(rate=1.0, burst=3)
+    for _ in range(3):
+        assert await limiter.acquire(RequestPriority.POLL) == 0.0
+
+    stats = limiter.get_stats()
+    assert stats["priorities"]["poll"]["requests"] == 3
+    assert stats["priorities"]["poll"]["waited"] == 0
+    assert stats["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_by_priority():
+    """Test user commands queued after polls are served first."""
+    limiter = AlexaRateLimiter(rate=50.0, burst=1)
+    await limiter.acquire()
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(request("poll", RequestPriority.POLL)),
+        asyncio.create_task(request("push", RequestPriority.PUSH)),
+        asyncio.create_task(request("user", RequestPriority.USER)),
+    ]
+    await asyncio.sleep(0)
+    assert limiter.get_stats()["max_queue_depth"] == 3
+
+    await asyncio.gather(*tasks)
+
+    assert order == ["user", "push", "poll"]
+    stats = limiter.get_stats()
+    assert stats["priorities"]["user"]["waited"] == 1
+    assert stats["priorities"]["poll"]["max_wait"] > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_pauses_bucket():
+    """Test a 429 pauses every priority until the backoff ends."""
+    limiter = AlexaRateLimiter(rate=100.0, burst=5)
+    api = AsyncMock(side_effect=AlexapyTooManyRequestsError("429"))
+
+    with pytest.raises(AlexapyTooManyRequestsError):
+        await limiter.call(RequestPriority.POLL, api)
+
+    waiter = asyncio.create_task(limiter.acquire(RequestPriority.USER))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    assert limiter.queue_depth == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queue_depth == 0
+
+    stats = limiter.get_stats()
+    assert stats["rate_limited"] == 1
+    assert 0 < stats["backoff_remaining"] <= 5.0
+    limiter.close()
+
+
+def test_backoff_doubles_until_success():
+    """Test repeated 429s lengthen the pause and a success resets it."""
+    limiter = AlexaRateLimiter()
+    with patch(
+        "custom_components.alexa_media.rate_limiter.time.monotonic",
+        return_value=1000.0,
+    ):
+        limiter.report_rate_limited()
+        limiter.report_rate_limited()
+        assert limiter.get_stats()["backoff_remaining"] == 10.0
+        limiter.report_success()
+        limiter.report_rate_limited()
+        assert limiter.get_stats()["backoff_remaining"] == 10.0
+    assert limiter.get_stats()["rate_limited"] == 3
+
+
+# =============================================================================
+# Tests for the registry and call helpers
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_limited_call_uses_account_limiter():
+    """Test calls of one account share a limiter that is removed on unload."""
+    hass = make_hass()
+    login = make_login()
+    api = AsyncMock(return_value={"ok": True})
+
+    assert await limited_call(hass, login, RequestPriority.PUSH, api, 1, a=2) == {
+        "ok": True
+    }
+    api.assert_awaited_once_with(1, a=2)
+    limiter = get_rate_limiter(hass, login)
+    assert limiter is get_rate_limiter(hass, make_login(url="amazon.de"))
+    assert limiter.get_stats()["priorities"]["push"]["requests"] == 1
+
+    remove_rate_limiter(hass, login.email, login.url)
+    assert hass.data[DATA_ALEXAMEDIA]["rate_limiters"] == {}
+
+
+@pytest.mark.asyncio
+async def test_limited_call_without_integration_data():
+    """Test calls are not limited before the integration data exists."""
+    api = AsyncMock(return_value=1)
+    assert await limited_call(MagicMock(), make_login(), RequestPriority.POLL, api) == 1
+
+
+def test_region_scope_shares_limiter():
+    """Test accounts on the same Amazon URL share a limiter in region scope."""
+    hass = make_hass()
+    with patch("custom_components.alexa_media.rate_limiter.RATE_LIMIT_SCOPE", "region"):
+        first = get_rate_limiter(hass, make_login("a@example.com"))
+        second = get_rate_limiter(hass, make_login("b@example.com"))
+        other = get_rate_limiter(hass, make_login("c@example.com", "amazon.de"))
+    assert first is second
+    assert first is not other
+    assert first.name == "amazon.com"
+
+
+def test_region_scope_limiter_removed_with_last_account():
+    """Test a shared region limiter is closed once its last account unloads."""
+    hass = make_hass()
+    first, second = make_login("a@example.com"), make_login("b@example.com")
+    accounts = hass.data[DATA_ALEXAMEDIA]["accounts"]
+    accounts[second.email] = {"login_obj": second}
+    with patch("custom_components.alexa_media.rate_limiter.RATE_LIMIT_SCOPE", "region"):
+        limiter = get_rate_limiter(hass, first)
+        get_rate_limiter(hass, second)
+
+        remove_rate_limiter(hass, first.email, first.url)
+        assert hass.data[DATA_ALEXAMEDIA]["rate_limiters"] == {
+            "url:amazon.com": limiter
+        }
+
+        accounts.pop(second.email)
+        remove_rate_limiter(hass, second.email, second.url)
+    assert hass.data[DATA_ALEXAMEDIA]["rate_limiters"] == {}
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_api_proxy_priorities():
+    """Test the AlexaAPI proxy limits coroutine methods with their priority."""
+    hass = make_hass()
+    owner = SimpleNamespace(hass=hass, _login=make_login())
+    api = MagicMock()
+    api.set_volume = AsyncMock(return_value=None)
+    api.get_state = AsyncMock(return_value={"playerInfo": {}})
+    api.update_login = MagicMock(return_value=False)
+    proxy = RateLimitedAPI(api, owner, priorities={"get_state": RequestPriority.POLL})
+
+    await proxy.set_volume(0.5)
+    assert await proxy.get_state() == {"playerInfo": {}}
+    assert proxy.update_login(None) is False
+
+    api.set_volume.assert_awaited_once_with(0.5)
+    priorities = get_rate_limiter(hass, owner._login).get_stats()["priorities"]
+    assert priorities["user"]["requests"] == 1
+    assert priorities["poll"]["requests"] == 1
+
+
+def test_rate_limits_in_metrics_report():
+    """Test limiter statistics are part of the full metrics report."""
+    hass = make_hass()
+    get_rate_limiter(hass, make_login())
+    report = AlexaMetrics(hass).get_full_report()["rate_limits"]
+    assert list(report) == ["u**r@e*********m"]
+    assert report["u**r@e*********m"]["queue_depth"] == 0
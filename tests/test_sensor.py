@@ -4,7 +4,7 @@ Tests the sensor functionality using pytest-homeassistant-custom-component.
 """
 
 import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from custom_components.alexa_media.sensor import AlexaMediaNotificationSensor
 
@@ -267,3 +267,152 @@ class TestUpdateRecurringAlarm:
         result_alarm = result[1]["alarmTime"]
         # Reminders should also be advanced correctly
         assert result_alarm.isoweekday() == 5
+
+
+def _make_pipeline_sensor(n_dict):
+    """Return a bare Alarm sensor ready for _process_raw_notifications."""
+    sensor = object.__new__(AlexaMediaNotificationSensor)
+    sensor._type = "Alarm"
+    sensor._sensor_property = "date_time"
+    sensor._debug = False
+    sensor._account = "test@example.com"
+    sensor._client = MagicMock(_timezone="UTC", device_serial_number="SERIAL1")
+    sensor.hass = MagicMock()
+    sensor._n_dict = n_dict
+    sensor._all = []
+    sensor._active = []
+    sensor._next = None
+    sensor._tracker = None
+    sensor._status = None
+    sensor._version = None
+    sensor._amz_id = None
+    sensor._dismissed = None
+    sensor._entry_cache = {}
+    sensor._by_id = {}
+    sensor._upcoming = []
+    return sensor
+
+
+def _alarm(alarm_id, when, status="ON", version="1"):
+    """Return a raw alarm as stored by process_notifications."""
+    return {
+        "id": alarm_id,
+        "status": status,
+        "version": version,
+        "type": "Alarm",
+        "date_time": when,
+    }
+
+
+NOW = datetime.datetime(2030, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class TestNotificationPipeline:
+    """Test the cached single-pass _process_raw_notifications pipeline."""
+
+    scheduler = MagicMock()
+
+    def _process(self, sensor, now=NOW):
+        with (
+            patch("custom_components.alexa_media.sensor.dt.now", return_value=now),
+            patch(
+                "custom_components.alexa_media.sensor.get_notification_scheduler",
+                return_value=self.scheduler,
+            ),
+        ):
+            sensor._process_raw_notifications()
+
+    def test_picks_next_future_alarm_and_skips_past(self) -> None:
+        """Test the next alarm is the earliest future active one."""
+        sensor = _make_pipeline_sensor(
+            {
+                "n1": _alarm("a1", "2030-01-01 08:00:00"),
+                "n2": _alarm("a2", "2030-01-01 18:00:00"),
+                "n3": _alarm("a3", "2030-01-01 15:00:00", status="OFF"),
+                "n4": _alarm("a4", "2030-01-02 07:00:00"),
+            }
+        )
+        self._process(sensor)
+
+        assert [v["id"] for _, v in sensor._all] == ["a1", "a3", "a2", "a4"]
+        assert sensor._next["id"] == "a2"
+        assert [item[2][1]["id"] for item in sorted(sensor._upcoming)] == [
+            "a2",
+            "a4",
+        ]
+
+        later = datetime.datetime(2030, 1, 1, 19, 0, tzinfo=datetime.timezone.utc)
+        self._process(sensor, later)
+        assert sensor._next["id"] == "a4"
+
+    def test_falls_back_to_first_active_when_all_past(self) -> None:
+        """Test the earliest active alarm is used when none are in the future."""
+        sensor = _make_pipeline_sensor({"n1": _alarm("a1", "2030-01-01 08:00:00")})
+        self._process(sensor)
+        assert sensor._next["id"] == "a1"
+        assert sensor._upcoming == []
+
+    def test_unchanged_entries_are_not_renormalized(self) -> None:
+        """Test entries are cached by id and version across refreshes."""
+        raw = _alarm("a1", "2030-01-01 18:00:00")
+        sensor = _make_pipeline_sensor({"n1": raw})
+        self._process(sensor)
+        first = sensor._all[0]
+
+        sensor._n_dict = {"n1": dict(raw)}
+        with patch.object(
+            sensor, "_fix_alarm_date_time", wraps=sensor._fix_alarm_date_time
+        ) as fix:
+            self._process(sensor)
+            fix.assert_not_called()
+            assert sensor._all[0] is first
+
+            sensor._n_dict = {"n1": dict(raw, version="2", status="OFF")}
+            self._process(sensor)
+            fix.assert_called_once()
+        assert sensor._next is None
+        assert sensor._status == "OFF"
+
+    def test_snapshot_is_not_mutated(self) -> None:
+        """Test normalization works on copies of the account snapshot."""
+        raw = _alarm("a1", "2030-01-01 18:00:00")
+        sensor = _make_pipeline_sensor({"n1": raw})
+        self._process(sensor)
+        assert raw["date_time"] == "2030-01-01 18:00:00"
+        assert isinstance(sensor._next["date_time"], datetime.datetime)
+
+    def test_recurring_alarm_recomputed_after_it_passes(self) -> None:
+        """Test recurrence is only recomputed once now passes the occurrence."""
+        raw = dict(_alarm("a1", "2030-01-01 18:00:00"), recurringPattern="P")
+        sensor = _make_pipeline_sensor({"n1": raw})
+        with patch(
+            "custom_components.alexa_media.sensor.RECURRING_PATTERN_ISO_SET",
+            {"P": {3}},
+        ):
+            self._process(sensor)
+            assert sensor._next["date_time"].day == 1
+            with patch.object(
+                sensor, "_update_recurring_alarm", wraps=sensor._update_recurring_alarm
+            ) as update:
+                self._process(sensor)
+                update.assert_not_called()
+
+                later = datetime.datetime(
+                    2030, 1, 1, 19, 0, tzinfo=datetime.timezone.utc
+                )
+                self._process(sensor, later)
+                update.assert_called_once()
+        assert sensor._next["date_time"].day == 2
+
+    def test_next_alarm_is_scheduled_on_account_scheduler(self) -> None:
+        """Test the trigger goes through the account-level scheduler."""
+        sensor = _make_pipeline_sensor({"n1": _alarm("a1", "2030-01-01 18:00:00")})
+        self.scheduler = MagicMock()
+        self._process(sensor)
+
+        key, when, action = self.scheduler.schedule.call_args.args
+        assert when == datetime.datetime(
+            2030, 1, 1, 18, 0, tzinfo=datetime.timezone.utc
+        )
+        assert action == sensor._trigger_event
+        assert sensor._tracker is self.scheduler.schedule.return_value
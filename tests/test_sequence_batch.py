@@ -0,0 +1,91 @@
+"""Tests for batched notify sequences."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from alexapy import AlexaAPI
+import pytest
+
+from custom_components.alexa_media.sequence_batch import (
+    BATCH_NODE_BUILDERS,
+    PARALLEL_NODE,
+    parallel_sequence,
+)
+
+
+def make_device(serial, locale="en-GB"):
+    """Return a media player stub backed by a real AlexaAPI."""
+    login = MagicMock(url="amazon.com", email="user@example.com", customer_id="C1")
+    login._headers = {}
+    device = SimpleNamespace(
+        _device_type="A3S5BH2HU6VAYF",
+        _device_family="ECHO",
+        _locale=locale,
+        _customer_id="C2",
+        _login=login,
+        device_serial_number=serial,
+    )
+    device.alexa_api = AlexaAPI(device, login)
+    return device
+
+
+async def alexapy_node(device, method, message, **kwargs):
+    """Return the node alexapy itself queues for one device."""
+    with patch.object(AlexaAPI, "run_behavior", new=AsyncMock()) as run_behavior:
+        await getattr(device.alexa_api, method)(
+            message, customer_id=device._customer_id, **kwargs
+        )
+    return run_behavior.call_args.args[0]
+
+
+# =============================================================================
+# Tests for node builders
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("data_type", "method", "message", "kwargs"),
+    [
+        ("tts", "send_tts", "Dinner is ready", {}),
+        ("tts", "send_tts", "alexa.cannedtts.speak.curatedtts-category-goodnight", {}),
+        ("push", "send_mobilepush", "Door open", {"title": "Alert"}),
+        ("dropin_notification", "send_dropin_notification", "Hi", {"title": "T"}),
+    ],
+)
+async def test_nodes_match_alexapy(data_type, method, message, kwargs):
+    """Test each builder produces the node alexapy would send."""
+    device = make_device("SERIAL1")
+    expected = await alexapy_node(device, method, message, **kwargs)
+    assert BATCH_NODE_BUILDERS[data_type](device, message, **kwargs) == expected
+
+
+def test_missing_locale_uses_default():
+    """Test devices without a locale fall back to en-US like alexapy."""
+    node = BATCH_NODE_BUILDERS["push"](make_device("SERIAL1", locale=None), "x")
+    assert node["operationPayload"]["locale"] == "en-US"
+
+
+# =============================================================================
+# Tests for parallel_sequence
+# =============================================================================
+
+
+def test_parallel_sequence_wraps_several_nodes():
+    """Test several nodes run in one parallel node."""
+    nodes = [
+        BATCH_NODE_BUILDERS["tts"](make_device(serial), "Hello")
+        for serial in ("SERIAL1", "SERIAL2", "SERIAL3")
+    ]
+    sequence = parallel_sequence(nodes)
+    assert sequence["@type"] == PARALLEL_NODE
+    assert [
+        node["operationPayload"]["deviceSerialNumber"]
+        for node in sequence["nodesToExecute"]
+    ] == ["SERIAL1", "SERIAL2", "SERIAL3"]
+
+
+def test_parallel_sequence_single_node_is_unwrapped():
+    """Test a single node is sent as is."""
+    node = BATCH_NODE_BUILDERS["tts"](make_device("SERIAL1"), "Hello")
+    assert parallel_sequence([node]) is node
@@ -0,0 +1,265 @@
+"""Tests for the per-account serial index."""
+
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.alexa_media import media_player
+from custom_components.alexa_media.const import DATA_ALEXAMEDIA
+from custom_components.alexa_media.serial_index import SerialIndex, get_serial_index
+
+
+def make_device(serial: str, apps: int = 0) -> dict:
+    """Return a minimal devices["media_player"] entry."""
+    return {
+        "serialNumber": serial,
+        "appDeviceList": [{"serialNumber": f"{serial}_app{i}"} for i in range(apps)],
+    }
+
+
+def make_account(count: int, apps: int = 1) -> dict:
+    """Return a legacy account dict with count media players."""
+    devices = {f"SERIAL{i}": make_device(f"SERIAL{i}", apps) for i in range(count)}
+    return {
+        "devices": {"media_player": devices},
+        "entities": {
+            "media_player": {serial: MagicMock() for serial in devices},
+            "sensor": {"AIAQM1": {}},
+        },
+        "excluded": {},
+    }
+
+
+# =============================================================================
+# Tests for SerialIndex
+# =============================================================================
+
+
+def test_membership_players_apps_and_entity_backed():
+    """Test players, their app devices and entity-backed serials are known."""
+    index = SerialIndex()
+    index.add_player("ECHO1", make_device("ECHO1", apps=2))
+    index.add_entity_backed("AIAQM1")
+
+    assert "ECHO1" in index
+    assert "ECHO1_app0" in index
+    assert "ECHO1_app1" in index
+    assert "AIAQM1" in index
+    assert "UNKNOWN" not in index
+    assert index.parent_of("ECHO1_app1") == "ECHO1"
+
+
+def test_app_devices_need_a_player_entity():
+    """Test app serials are only known once their parent has an entity."""
+    index = SerialIndex()
+    index.set_device("ECHO1", make_device("ECHO1", apps=1))
+
+    assert "ECHO1" not in index
+    assert "ECHO1_app0" not in index
+
+    index.add_player("ECHO1")
+    assert "ECHO1_app0" in index
+
+
+def test_set_device_replaces_app_devices():
+    """Test changed appDeviceList entries replace the previous mapping."""
+    index = SerialIndex()
+    index.add_player("ECHO1", make_device("ECHO1", apps=2))
+    index.set_device("ECHO1", {"serialNumber": "ECHO1", "appDeviceList": []})
+
+    assert "ECHO1_app0" not in index
+    assert index.parent_of("ECHO1_app0") is None
+
+
+def test_remove_player_and_entity_backed():
+    """Test removal drops serials from membership."""
+    index = SerialIndex()
+    index.add_player("ECHO1", make_device("ECHO1", apps=1))
+    index.add_entity_backed("AIAQM1")
+
+    index.remove_player("ECHO1")
+    index.remove_entity_backed("AIAQM1")
+
+    assert "ECHO1" not in index
+    assert "ECHO1_app0" not in index
+    assert "AIAQM1" not in index
+
+
+def test_exclude_records_device_and_apps():
+    """Test excluded devices share the account's excluded dict."""
+    excluded = {}
+    index = SerialIndex(excluded)
+    device = make_device("ECHO1", apps=1)
+    index.exclude(device)
+
+    assert excluded == {"ECHO1": device, "ECHO1_app0": device}
+    assert index.is_excluded("ECHO1_app0")
+    assert "ECHO1" not in index
+
+
+def test_get_serial_index_rebuilds_legacy_account():
+    """Test an account without an index is rebuilt once and then reused."""
+    account = make_account(3)
+    index = get_serial_index(account)
+
+    assert index is get_serial_index(account)
+    assert index.excluded is account["excluded"]
+    assert index.get_stats() == {
+        "players": 3,
+        "app_devices": 3,
+        "entity_backed": 1,
+        "excluded": 0,
+    }
+
+
+def legacy_serials(account: dict) -> list[str]:
+    """Return the serials the old per-message rebuild produced.
+
+    Media player entity serials followed by the app device serials of their
+    devices; entity-backed sensor serials were added by the callers.
+    """
+    serials = list(account["entities"]["media_player"])
+    devices = account.get("devices", {}).get("media_player", {})
+    for serial in list(serials):
+        for app in devices.get(serial, {}).get("appDeviceList") or []:
+            if "serialNumber" in app:
+                serials.append(app["serialNumber"])
+    return serials
+
+
+def test_serials_matches_legacy_rebuild():
+    """Test the index agrees with the old rebuild plus sensor serials."""
+    account = make_account(10, apps=2)
+    legacy = set(legacy_serials(account)) | set(account["entities"]["sensor"])
+
+    assert get_serial_index(account).serials() == legacy
+
+
+def test_rebuild_skips_app_devices_without_serial():
+    """Test app device entries without a serialNumber are ignored."""
+    account = {
+        "entities": {"media_player": {"device1": MagicMock()}},
+        "devices": {
+            "media_player": {
+                "device1": {
+                    "appDeviceList": [{"invalid": "data"}, {"serialNumber": "app1"}]
+                }
+            }
+        },
+    }
+
+    assert get_serial_index(account).serials() == {"device1", "app1"}
+
+
+def test_rebuild_of_empty_account():
+    """Test an account without media players knows no serials."""
+    assert get_serial_index({"entities": {}, "devices": {}}).serials() == set()
+
+
+@pytest.mark.asyncio
+async def test_media_player_unload_removes_players():
+    """Test unloading media players drops them and their apps from the index."""
+    email = "test@example.com"
+    account = make_account(2)
+    for entity in account["entities"]["media_player"].values():
+        entity.async_remove = AsyncMock()
+    index = get_serial_index(account)
+    hass = MagicMock()
+    hass.data = {DATA_ALEXAMEDIA: {"accounts": {email: account}}}
+    entry = MagicMock(data={"email": email})
+
+    assert await media_player.async_unload_entry(hass, entry)
+
+    assert "SERIAL0" not in index
+    assert "SERIAL1_app0" not in index
+    assert "AIAQM1" in index
+
+
+# =============================================================================
+# Per-message membership cost
+# =============================================================================
+
+LOOKUPS = ["SERIAL1", "SERIAL1_app0", "AIAQM1", "UNKNOWN"]
+
+
+class CountingDict(dict):
+    """Dict counting reads of its entries."""
+
+    reads = 0
+
+    def get(self, key, default=None):
+        """Count and return an entry."""
+        self.reads += 1
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        """Count and return an entry."""
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+def make_counted_account(count: int) -> dict:
+    """Return an account whose device entries count how often they are read."""
+    account = make_account(count)
+    account["devices"]["media_player"] = CountingDict(
+        account["devices"]["media_player"]
+    )
+    return account
+
+
+def legacy_membership(account: dict, lookups: list[str]) -> Callable[[], list]:
+    """Return a callable answering lookups with the old per-message rebuild."""
+
+    def _answer():
+        existing = set(legacy_serials(account))
+        existing |= set(account["entities"]["sensor"])
+        return [serial in existing for serial in lookups]
+
+    return _answer
+
+
+def test_per_message_device_reads_do_not_grow_with_devices():
+    """Test membership reads no device entries, unlike the rebuild.
+
+    The legacy rebuild reads every media player entry per push message.
+    """
+    reads = {}
+    for count in (5, 200):
+        account = make_counted_account(count)
+        index = get_serial_index(account)
+        devices = account["devices"]["media_player"]
+        devices.reads = 0
+        for _ in range(10):
+            answers = [serial in index for serial in LOOKUPS]
+        reads[("index", count)] = devices.reads
+        legacy = legacy_membership(account, LOOKUPS)
+        for _ in range(10):
+            assert legacy() == answers
+        reads[("legacy", count)] = devices.reads - reads[("index", count)]
+
+    assert reads[("index", 5)] == reads[("index", 200)] == 0
+    assert reads[("legacy", 5)] == 10 * 5
+    assert reads[("legacy", 200)] == 10 * 200
+
+
+@pytest.mark.perf
+def test_benchmark_per_message_cost(best_of):
+    """Benchmark membership cost from 5 to 200 devices against the rebuild."""
+    small, large = make_account(5), make_account(200)
+
+    def index_cost(account):
+        index = get_serial_index(account)
+        return best_of(lambda: [serial in index for serial in LOOKUPS], number=200)
+
+    def legacy_cost(account):
+        return best_of(legacy_membership(account, LOOKUPS), number=200)
+
+    index_small, index_large = index_cost(small), index_cost(large)
+    legacy_small, legacy_large = legacy_cost(small), legacy_cost(large)
+    print(
+        f"\nper-message cost 5 -> 200 devices: "
+        f"index {index_small * 1e6:.2f}us -> {index_large * 1e6:.2f}us, "
+        f"rebuild {legacy_small * 1e6:.2f}us -> {legacy_large * 1e6:.2f}us"
+    )
+    assert index_large < legacy_large
@@ -0,0 +1,137 @@
+"""Tests for the warm boot device snapshot."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+
+from custom_components.alexa_media.const import SNAPSHOT_SAVE_DELAY
+from custom_components.alexa_media.snapshot import DeviceSnapshot, snapshot_signature
+
+
+def make_snapshot(stored=None):
+    """Return a DeviceSnapshot backed by a mocked Store."""
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=stored)
+    store.async_remove = AsyncMock()
+    with patch("custom_components.alexa_media.snapshot.Store", return_value=store):
+        snapshot = DeviceSnapshot(MagicMock(), "entry1")
+    return snapshot, store
+
+
+def make_stored():
+    """Return stored snapshot data."""
+    return {
+        "devices": [{"serialNumber": "SERIAL1", "accountName": "Kitchen"}],
+        "entities": {"light": [{"id": "LIGHT1", "name": "Lamp"}], "guard": []},
+        "auth_info": {"customerId": "C1"},
+        "saved_at": 0,
+    }
+
+
+# =============================================================================
+# Tests for loading
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_load_valid_snapshot():
+    """Test a stored snapshot is exposed through the properties."""
+    snapshot, _ = make_snapshot(make_stored())
+
+    assert await snapshot.async_load()
+    assert snapshot.devices[0]["serialNumber"] == "SERIAL1"
+    assert snapshot.auth_info == {"customerId": "C1"}
+    assert snapshot.signature == (frozenset({"SERIAL1"}), frozenset({"LIGHT1"}))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stored",
+    [
+        None,
+        [],
+        {"devices": [], "entities": {}, "auth_info": None},
+        {"devices": [{"serialNumber": "SERIAL1"}], "entities": []},
+        {"devices": [{"serialNumber": "SERIAL1"}], "entities": {}, "auth_info": 1},
+    ],
+)
+async def test_load_rejects_unusable_snapshot(stored):
+    """Test missing, empty or malformed snapshots are not used."""
+    snapshot, _ = make_snapshot(stored)
+    assert not await snapshot.async_load()
+
+
+@pytest.mark.asyncio
+async def test_load_unreadable_snapshot():
+    """Test a corrupt storage file is ignored."""
+    snapshot, store = make_snapshot()
+    store.async_load.side_effect = HomeAssistantError("bad json")
+    assert not await snapshot.async_load()
+
+
+# =============================================================================
+# Tests for saving
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_update_saves_only_on_change():
+    """Test unchanged data does not schedule another write."""
+    snapshot, store = make_snapshot(make_stored())
+    await snapshot.async_load()
+    stored = make_stored()
+
+    assert not snapshot.async_update(stored["devices"], stored["entities"])
+    store.async_delay_save.assert_not_called()
+
+    stored["devices"].append({"serialNumber": "SERIAL2"})
+    assert snapshot.async_update(stored["devices"])
+    store.async_delay_save.assert_called_once()
+    data_func, delay = store.async_delay_save.call_args.args
+    assert delay == SNAPSHOT_SAVE_DELAY
+    saved = data_func()
+    assert len(saved["devices"]) == 2
+    assert saved["entities"] == stored["entities"]
+    assert saved["auth_info"] == {"customerId": "C1"}
+    assert "saved_at" in saved
+
+
+def test_update_keeps_parts_passed_as_none():
+    """Test a poll without network details keeps the previous entities."""
+    snapshot, _ = make_snapshot()
+    snapshot.async_update([{"serialNumber": "S1"}], {"light": [{"id": "L1"}]}, {})
+    snapshot.async_update([{"serialNumber": "S1"}, {"serialNumber": "S2"}])
+
+    assert snapshot.entities == {"light": [{"id": "L1"}]}
+    assert snapshot.auth_info == {}
+
+
+# =============================================================================
+# Tests for snapshot_signature
+# =============================================================================
+
+
+def test_signature_ignores_state_changes():
+    """Test only serials and entity ids affect the signature."""
+    entities = {"light": [{"id": "L1", "name": "Lamp"}]}
+    before = snapshot_signature([{"serialNumber": "S1", "online": True}], entities)
+    after = snapshot_signature(
+        [{"serialNumber": "S1", "online": False}],
+        {"light": [{"id": "L1", "name": "Desk lamp"}]},
+    )
+    assert before == after
+    assert before != snapshot_signature([{"serialNumber": "S2"}], entities)
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_immediately():
+    """Test flushing saves the current data without the delay."""
+    snapshot, store = make_snapshot()
+    store.async_save = AsyncMock()
+    snapshot.async_update([{"serialNumber": "S1"}], {}, None)
+
+    await snapshot.async_flush()
+
+    saved = store.async_save.await_args.args[0]
+    assert saved["devices"] == [{"serialNumber": "S1"}]
@@ -0,0 +1,206 @@
+"""Tests for the cached announcement audio transcoder."""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.alexa_media.exceptions import TranscodeException
+from custom_components.alexa_media.transcode import (
+    TRANSCODE_ARGS,
+    AudioTranscoder,
+    cache_key,
+)
+
+
+def make_hass():
+    """Return a hass mock that runs executor jobs inline."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return hass
+
+
+def make_transcoder(tmp_path, **kwargs):
+    """Return a transcoder whose download and ffmpeg steps are faked."""
+    transcoder = AudioTranscoder(make_hass(), str(tmp_path), **kwargs)
+    transcoder._async_download = AsyncMock(return_value=b"source audio")
+
+    async def _fake_ffmpeg(audio, output_path):
+        await asyncio.sleep(0.01)
+        with open(output_path, "wb") as file:
+            file.write(b"x" * 100)
+
+    transcoder._async_run_ffmpeg = AsyncMock(side_effect=_fake_ffmpeg)
+    return transcoder
+
+
+# =============================================================================
+# Tests for cache_key
+# =============================================================================
+
+
+def test_cache_key_depends_on_source_and_settings():
+    """Test the key changes with the source and with the encoder settings."""
+    key = cache_key("media-source://tts/cloud?message=hi")
+    assert key == cache_key("media-source://tts/cloud?message=hi")
+    assert key != cache_key("media-source://tts/cloud?message=bye")
+    assert key != cache_key("media-source://tts/cloud?message=hi", TRANSCODE_ARGS[:2])
+    assert len(key) == 32
+
+
+# =============================================================================
+# Tests for AudioTranscoder
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_served_from_cache(tmp_path):
+    """Test a repeated announcement does not convert again."""
+    transcoder = make_transcoder(tmp_path)
+
+    name = await transcoder.async_get("tts:hi", "http://ha/hi.mp3")
+    again = await transcoder.async_get("tts:hi", "http://ha/hi.mp3")
+
+    assert name == again == f"{cache_key('tts:hi')}.mp3"
+    assert (tmp_path / name).read_bytes() == b"x" * 100
+    assert not list(tmp_path.glob("*.part"))
+    transcoder._async_run_ffmpeg.assert_awaited_once()
+    stats = transcoder.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["transcodes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_refreshes_file_age(tmp_path):
+    """Test a hit updates the file mtime so a restart keeps it."""
+    transcoder = make_transcoder(tmp_path, max_age=60)
+    name = await transcoder.async_get("tts:hi", "http://ha/hi.mp3")
+    stale = time.time() - 3600
+    os.utime(tmp_path / name, (stale, stale))
+
+    await transcoder.async_get("tts:hi", "http://ha/hi.mp3")
+
+    assert (tmp_path / name).stat().st_mtime > stale + 3000
+    restarted = make_transcoder(tmp_path, max_age=60)
+    assert await restarted.async_get("tts:hi", "http://ha/hi.mp3") == name
+    restarted._async_run_ffmpeg.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deleted_file_is_converted_again(tmp_path):
+    """Test a cached file removed from disk is treated as a miss."""
+    transcoder = make_transcoder(tmp_path)
+    name = await transcoder.async_get("tts:hi", "http://ha/hi.mp3")
+    (tmp_path / name).unlink()
+
+    assert await transcoder.async_get("tts:hi", "http://ha/hi.mp3") == name
+
+    assert (tmp_path / name).exists()
+    assert transcoder._async_run_ffmpeg.await_count == 2
+    stats = transcoder.get_stats()
+    assert stats["hits"] == 0
+    assert stats["misses"] == 2
+    assert stats["bytes"] == 100
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_conversion(tmp_path):
+    """Test simultaneous requests for the same audio are de-duplicated."""
+    transcoder = make_transcoder(tmp_path)
+
+    names = await asyncio.gather(
+        *(transcoder.async_get("tts:hi", "http://ha/hi.mp3") for _ in range(5))
+    )
+
+    assert len(set(names)) == 1
+    transcoder._async_download.assert_awaited_once()
+    assert transcoder.get_stats()["deduplicated"] == 4
+
+
+@pytest.mark.asyncio
+async def test_existing_files_are_indexed(tmp_path):
+    """Test files from an earlier run are cache hits after a restart."""
+    name = f"{cache_key('tts:hi')}.mp3"
+    (tmp_path / name).write_bytes(b"old")
+    (tmp_path / "keep_me.txt").write_text("not ours")
+    transcoder = make_transcoder(tmp_path)
+
+    assert await transcoder.async_get("tts:hi", "http://ha/hi.mp3") == name
+    transcoder._async_run_ffmpeg.assert_not_called()
+    assert (tmp_path / "keep_me.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_eviction_by_size_keeps_newest(tmp_path):
+    """Test the least recently used files go once the size budget is hit."""
+    transcoder = make_transcoder(tmp_path, max_bytes=250)
+
+    first = await transcoder.async_get("tts:1", "http://ha/1.mp3")
+    second = await transcoder.async_get("tts:2", "http://ha/2.mp3")
+    await transcoder.async_get("tts:1", "http://ha/1.mp3")  # touch first
+    third = await transcoder.async_get("tts:3", "http://ha/3.mp3")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([first, third])
+    assert not (tmp_path / second).exists()
+    assert transcoder.get_stats()["evictions"] == 1
+    assert transcoder.get_stats()["bytes"] == 200
+
+
+@pytest.mark.asyncio
+async def test_eviction_by_age_includes_legacy_files(tmp_path):
+    """Test old files, including earlier _input/_output files, are deleted."""
+    stale = time.time() - 3600
+    for name in ("abc_input.mp3", "abc_output.mp3"):
+        (tmp_path / name).write_bytes(b"legacy")
+        os.utime(tmp_path / name, (stale, stale))
+    transcoder = make_transcoder(tmp_path, max_age=60)
+
+    await transcoder.async_get("tts:new", "http://ha/new.mp3")
+
+    assert [path.name for path in tmp_path.iterdir()] == [f"{cache_key('tts:new')}.mp3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_conversion_is_not_cached(tmp_path):
+    """Test a failure raises, cleans up and is retried on the next request."""
+    transcoder = make_transcoder(tmp_path)
+    transcoder._async_download.side_effect = [OSError("refused"), b"audio"]
+
+    with pytest.raises(TranscodeException, match="refused"):
+        await transcoder.async_get("tts:hi", "http://ha/hi.mp3")
+    assert await transcoder.async_get("tts:hi", "http://ha/hi.mp3")
+    assert transcoder.get_stats()["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ffmpeg_error_raises(tmp_path):
+    """Test a non-zero ffmpeg exit is reported with its stderr."""
+    transcoder = AudioTranscoder(make_hass(), str(tmp_path))
+    process = MagicMock(returncode=1)
+    process.communicate = AsyncMock(return_value=(None, b"Invalid data found"))
+
+    with patch(
+        "custom_components.alexa_media.transcode.asyncio.create_subprocess_exec",
+        AsyncMock(return_value=process),
+    ) as create:
+        with pytest.raises(TranscodeException, match="Invalid data found"):
+            await transcoder._async_run_ffmpeg(b"audio", str(tmp_path / "out.part"))
+
+    args = create.call_args.args
+    assert args[:6] == ("ffmpeg", "-y", "-loglevel", "error", "-i", "pipe:0")
+    process.communicate.assert_awaited_once_with(b"audio")
+
+
+@pytest.mark.asyncio
+async def test_missing_ffmpeg_raises(tmp_path):
+    """Test a missing ffmpeg binary is reported as a TranscodeException."""
+    transcoder = AudioTranscoder(make_hass(), str(tmp_path))
+    with patch(
+        "custom_components.alexa_media.transcode.asyncio.create_subprocess_exec",
+        AsyncMock(side_effect=FileNotFoundError),
+    ):
+        with pytest.raises(TranscodeException, match="not installed"):
+            await transcoder._async_run_ffmpeg(b"audio", str(tmp_path / "out.part"))